@@ -11,6 +11,7 @@ from .operator import (
     TensorSpec,
     Operator,
     OperatorInstance,
+    NumbaKernelProvider,
 )
 
 from .graph import (
@@ -40,6 +41,7 @@ __all__ = [
     "TensorSpec",
     "Operator",
     "OperatorInstance",
+    "NumbaKernelProvider",
     # graph.py
     "Edge",
     "OperatorGraph",
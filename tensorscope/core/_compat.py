@@ -0,0 +1,11 @@
+"""Compatibility helpers across supported Python versions."""
+
+from __future__ import annotations
+
+import sys
+
+# dataclass(slots=True) is only available on Python 3.10+. On 3.9 the
+# dataclasses fall back to a regular per-instance __dict__.
+DATACLASS_SLOTS: dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
@@ -0,0 +1,248 @@
+"""Fused reduction kernels used by compute_summary().
+
+The kernels are compiled with numba when it is installed; otherwise the
+NumPy fallbacks below produce the same results with separate reductions.
+Kernels are declared with explicit float32/float64 signatures, so they are
+compiled (or loaded from numba's on-disk cache) at import time rather than
+on the first summary request; other real dtypes are promoted to float64.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - exercised only without numba
+    numba = None
+
+# Values with magnitude below this count as zero for sparsity
+ZERO_TOL = 1e-10
+
+HAVE_NUMBA = numba is not None
+
+# Arrays smaller than this are reduced on one thread
+_PARALLEL_MIN_SIZE = 1 << 16
+
+# LLVM fast-math flags for the reductions: reassociation lets the loops
+# vectorize, while leaving out "nnan" and "ninf" keeps NaN and inf
+# handling the same as the NumPy fallback
+_FASTMATH = {"nsz", "arcp", "contract", "reassoc"}
+
+# Side length of the blocks compared by the symmetry kernel
+_SYMMETRY_TILE = 32
+
+# dtypes the kernels are compiled for
+_KERNEL_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+
+def _basic_stats_numpy(
+    flat: np.ndarray,
+) -> tuple[float, float, float, float, float, int]:
+    """Compute (min, max, mean, std, norm, near-zero count) with NumPy."""
+    return (
+        float(np.min(flat)),
+        float(np.max(flat)),
+        float(np.mean(flat)),
+        float(np.std(flat)),
+        float(np.linalg.norm(flat)),
+        int(np.count_nonzero(np.abs(flat) < ZERO_TOL)),
+    )
+
+
+if HAVE_NUMBA:
+    from numba import types
+
+    def _signatures(ndim: int, layout: str, *extra: types.Type) -> list[tuple]:
+        """Argument signatures for writable and read-only float arrays."""
+        return [
+            (types.Array(dtype, ndim, layout, readonly=readonly), *extra)
+            for dtype in (types.float64, types.float32)
+            for readonly in (False, True)
+        ]
+
+    @numba.njit(fastmath=_FASTMATH, boundscheck=False, cache=True)
+    def _accumulate(flat, start, stop, shift):  # pragma: no cover - numba
+        # Partials of one chunk; sums are taken around shift to limit
+        # cancellation in the variance
+        lo = float(flat[start])
+        hi = lo
+        total = 0.0
+        sqtotal = 0.0
+        norm = 0.0
+        zeros = 0
+        for i in range(start, stop):
+            x = float(flat[i])
+            # NaN propagates into min and max, as with np.min and np.max
+            if x < lo or x != x:
+                lo = x
+            if x > hi or x != x:
+                hi = x
+            d = x - shift
+            total += d
+            sqtotal += d * d
+            norm += x * x
+            # Branch-free so the loop body stays vectorizable
+            zeros += abs(x) < ZERO_TOL
+        return lo, hi, total, sqtotal, norm, zeros
+
+    @numba.njit(fastmath=_FASTMATH, boundscheck=False, cache=True)
+    def _finish(size, shift, lo, hi, total, sqtotal, norm, zeros):  # pragma: no cover
+        # Combine shifted partials into (min, max, mean, std, norm, zeros)
+        mean_shifted = total / size
+        variance = sqtotal / size - mean_shifted * mean_shifted
+        # Clamp rounding below zero, leaving a NaN variance as NaN
+        if variance < 0.0:
+            variance = 0.0
+        return (
+            lo,
+            hi,
+            shift + mean_shifted,
+            math.sqrt(variance),
+            math.sqrt(norm),
+            zeros,
+        )
+
+    @numba.njit(
+        _signatures(1, "C", types.intp),
+        parallel=True,
+        fastmath=_FASTMATH,
+        boundscheck=False,
+        cache=True,
+    )
+    def _basic_stats_kernel(flat, n_chunks):  # pragma: no cover - numba
+        # Each chunk accumulates its own partials around the first element
+        size = flat.size
+        chunk = (size + n_chunks - 1) // n_chunks
+        n_chunks = (size + chunk - 1) // chunk
+        shift = float(flat[0])
+        mins = np.empty(n_chunks)
+        maxs = np.empty(n_chunks)
+        sums = np.zeros(n_chunks)
+        sqsums = np.zeros(n_chunks)
+        norms = np.zeros(n_chunks)
+        zeros = np.zeros(n_chunks, dtype=np.int64)
+        for c in numba.prange(n_chunks):
+            start = c * chunk
+            stop = min(start + chunk, size)
+            (
+                mins[c],
+                maxs[c],
+                sums[c],
+                sqsums[c],
+                norms[c],
+                zeros[c],
+            ) = _accumulate(flat, start, stop, shift)
+        return _finish(
+            size,
+            shift,
+            mins.min(),
+            maxs.max(),
+            sums.sum(),
+            sqsums.sum(),
+            norms.sum(),
+            zeros.sum(),
+        )
+
+    @numba.njit(
+        _signatures(1, "C"),
+        fastmath=_FASTMATH,
+        boundscheck=False,
+        cache=True,
+    )
+    def _basic_stats_serial_kernel(flat):  # pragma: no cover - numba
+        # Single-threaded variant for small arrays, where starting the
+        # parallel region costs more than the reduction itself
+        shift = float(flat[0])
+        lo, hi, total, sqtotal, norm, zeros = _accumulate(flat, 0, flat.size, shift)
+        return _finish(flat.size, shift, lo, hi, total, sqtotal, norm, zeros)
+
+if HAVE_NUMBA:
+
+    # Compiled for read-only arrays only: any other layout or writability
+    # would convert equally well to several "A" signatures
+    @numba.njit(
+        [
+            (types.Array(dtype, 2, "A", readonly=True), types.float64, types.float64)
+            for dtype in (types.float64, types.float32)
+        ],
+        cache=True,
+    )
+    def _is_symmetric_kernel(a, rtol, atol):  # pragma: no cover - numba
+        # Same per-element test as np.allclose(a, a.T), applied in both
+        # directions over the upper triangle and stopping at the first miss.
+        # The triangle is walked in square tiles so that the mirrored
+        # column reads stay in cache, and exactly equal pairs skip the
+        # tolerance arithmetic. A diagonal entry is compared with itself,
+        # which only fails for NaN.
+        n = a.shape[0]
+        for i in range(n):
+            if a[i, i] != a[i, i]:
+                return False
+        for i0 in range(0, n, _SYMMETRY_TILE):
+            i1 = min(i0 + _SYMMETRY_TILE, n)
+            for j0 in range(i0, n, _SYMMETRY_TILE):
+                j1 = min(j0 + _SYMMETRY_TILE, n)
+                for i in range(i0, i1):
+                    for j in range(max(j0, i + 1), j1):
+                        x = a[i, j]
+                        y = a[j, i]
+                        if x != y:
+                            diff = abs(x - y)
+                            if not (
+                                diff <= atol + rtol * abs(y)
+                                and diff <= atol + rtol * abs(x)
+                            ):
+                                return False
+        return True
+
+
+def basic_stats(data: np.ndarray) -> tuple[float, float, float, float, float, int]:
+    """Compute elementwise summary statistics in a single pass.
+
+    Args:
+        data: Array of any shape with at least one element.
+
+    Returns:
+        A tuple (min, max, mean, std, norm, near_zero_count), where norm is
+        the 2-norm of the flattened array.
+    """
+    flat = np.ascontiguousarray(data).ravel()
+    if not HAVE_NUMBA or flat.size == 0 or flat.dtype.kind not in "biuf":
+        return _basic_stats_numpy(flat)
+
+    if flat.dtype not in _KERNEL_DTYPES:
+        flat = flat.astype(np.float64)
+    n_threads = numba.get_num_threads()
+    if flat.size < _PARALLEL_MIN_SIZE or n_threads == 1:
+        mn, mx, mean, std, norm, zeros = _basic_stats_serial_kernel(flat)
+    else:
+        n_chunks = min(n_threads, flat.size)
+        mn, mx, mean, std, norm, zeros = _basic_stats_kernel(flat, n_chunks)
+    return float(mn), float(mx), float(mean), float(std), float(norm), int(zeros)
+
+
+def is_symmetric(data: np.ndarray, rtol: float = 1e-5, atol: float = 1e-8) -> bool:
+    """Check whether a square matrix equals its transpose within tolerance.
+
+    Equivalent to np.allclose(data, data.T) without building the temporary
+    comparison arrays.
+
+    Args:
+        data: A square 2D array.
+        rtol: Relative tolerance, as in np.allclose.
+        atol: Absolute tolerance, as in np.allclose.
+
+    Returns:
+        True if the matrix is symmetric within tolerance.
+    """
+    if not HAVE_NUMBA or data.dtype.kind not in "biuf":
+        return bool(np.allclose(data, data.T, rtol=rtol, atol=atol))
+    if data.dtype not in _KERNEL_DTYPES:
+        data = data.astype(np.float64)
+    if data.flags.writeable:
+        data = data.view()
+        data.flags.writeable = False
+    return bool(_is_symmetric_kernel(data, rtol, atol))
@@ -2,18 +2,99 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import sys
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Sequence, Tuple
+
+from ._compat import DATACLASS_SLOTS
+from .operator import NumbaKernelProvider, Operator, OperatorInstance
+from .tensor import TensorKind, TrackedTensor, _data_digest
+
+# (node_name, operator, ((source_slot, to_input), ...), ((output_name, slot), ...))
+_PlanStep = Tuple[
+    str, Operator, Tuple[Tuple[int, str], ...], Tuple[Tuple[str, int], ...]
+]
+
+# Sorted tag tuples, shared by every node whose operator has the same tags
+_SORTED_TAGS_CACHE: dict[frozenset[str], tuple[str, ...]] = {}
+
+# Entries kept by each graph's content-keyed node memo
+_MAX_CONTENT_MEMO = 128
+
+
+def _sorted_tags(tags: frozenset[str]) -> tuple[str, ...]:
+    """Return tags in sorted order, sorting each distinct tag set only once."""
+    result = _SORTED_TAGS_CACHE.get(tags)
+    if result is None:
+        result = _SORTED_TAGS_CACHE[tags] = tuple(sorted(tags))
+    return result
+
+
+def _fingerprint(tensor: TrackedTensor) -> tuple[Any, ...]:
+    """Return a key identifying a tensor by everything an operator can read."""
+    data = tensor.data
+    return (
+        tensor.name,
+        tensor.kind,
+        tensor.tags,
+        data.dtype.str,
+        data.shape,
+        _data_digest(data),
+    )
+
+
+def _check_outputs(
+    node_name: str, operator: Operator, outputs: Mapping[str, TrackedTensor]
+) -> None:
+    """Check that a node's forward() returned exactly its declared outputs.
+
+    Raises:
+        ValueError: If a declared output is missing or an undeclared one is
+            returned.
+    """
+    declared = operator._cached_output_specs()
+    if outputs.keys() != declared.keys():
+        missing = sorted(declared.keys() - outputs.keys())
+        undeclared = sorted(outputs.keys() - declared.keys())
+        raise ValueError(
+            f"Node '{node_name}' ({operator.name}) outputs do not match its "
+            f"output_specs: missing {missing}, undeclared {undeclared}"
+        )
 
-from .tensor import TrackedTensor
-from .operator import Operator, OperatorInstance
 
+def _positional_args(
+    operator: Operator, gathers: Tuple[Tuple[int, str], ...]
+) -> str | None:
+    """Return the slot arguments for a node's _forward_fast() call.
 
-@dataclass
+    Returns:
+        Comma-separated slot names (None for unconnected optional inputs),
+        or None if the operator has no _forward_fast() or the node's inputs
+        don't fit its signature, in which case forward() is called with a
+        dict so validation can report the problem.
+    """
+    names = operator._FORWARD_ARGS
+    if names is None:
+        return None
+    slots = {to_input: slot for slot, to_input in gathers}
+    specs = operator._cached_input_specs()
+    if not slots.keys() <= set(names) or any(
+        name not in slots and not specs[name].optional for name in names
+    ):
+        return None
+    return ", ".join(
+        f"s{slots[name]}" if name in slots else "None" for name in names
+    )
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Edge:
     """An edge in the operator graph, representing data flow.
 
+    Edges are immutable and hashable, so identical connections compare equal.
+
     Attributes:
         from_node: The source node name.
         from_output: The output name on the source node.
@@ -49,9 +130,38 @@ class OperatorGraph:
     def __init__(self) -> None:
         """Initialize an empty operator graph."""
         self._nodes: dict[str, OperatorInstance] = {}
-        self._edges: list[Edge] = []
+        # Insertion-ordered set of edges; values are unused
+        self._edges: dict[Edge, None] = {}
+        # Node dependency structure maintained by connect(): each node's
+        # unique upstream nodes and downstream nodes (graph inputs excluded)
+        self._reverse_preds: dict[str, set[str]] = {}
+        self._successors: dict[str, list[str]] = {}
         self._input_node = "_input"
         self._cached_order: list[str] | None = None
+        self._incoming: dict[str, list[Edge]] | None = None
+        self._compiled_plan: list[_PlanStep] | None = None
+        # Compiled tensor slots: slot id -> "<node>.<output>" key, plus the
+        # slot ids of graph inputs consumed by edges
+        self._slot_keys: list[str] = []
+        self._input_slots: dict[str, int] = {}
+        self._input_keys: dict[str, str] = {}
+        # Memoized outputs of deterministic nodes, keyed by the exact input
+        # tensor objects they were computed from
+        self._deterministic_nodes: frozenset[str] = frozenset()
+        self._node_memo: dict[
+            str, tuple[tuple[TrackedTensor, ...], dict[str, TrackedTensor]]
+        ] = {}
+        # Outputs of deterministic nodes keyed by (node name, fingerprints of
+        # its inputs), most recently used last, for execute_memoized()
+        self._content_memo: OrderedDict[
+            tuple[Any, ...], dict[str, TrackedTensor]
+        ] = OrderedDict()
+        self._last_inputs: dict[str, TrackedTensor] = {}
+        self._numba_exec: Callable[..., tuple[Any, ...]] | None = None
+        self._python_exec: Callable[..., tuple[TrackedTensor, ...]] | None = None
+        self._structure_cache: dict[str, Any] | None = None
+        # node name -> (kind, shape) signature of its last validated inputs
+        self._validated: dict[str, tuple[Any, ...]] = {}
         self._last_execution_tensors: dict[str, TrackedTensor] = {}
 
     def add_node(
@@ -81,7 +191,9 @@ class OperatorGraph:
             node_name=name,
             config=config or {},
         )
-        self._cached_order = None
+        self._reverse_preds[name] = set()
+        self._successors[name] = []
+        self._invalidate()
         return name
 
     def connect(
@@ -93,7 +205,8 @@ class OperatorGraph:
     ) -> None:
         """Connect an output of one node to an input of another.
 
-        Use "_input" as from_node to connect graph inputs.
+        Use "_input" as from_node to connect graph inputs. Repeating an
+        existing connection is a no-op.
 
         Args:
             from_node: Source node name (or "_input" for graph inputs).
@@ -112,22 +225,60 @@ class OperatorGraph:
         # Validate output exists on source (skip for graph inputs)
         if from_node != self._input_node:
             source_op = self._nodes[from_node].operator
-            if from_output not in source_op.output_specs:
+            source_outputs = source_op._cached_output_specs()
+            if from_output not in source_outputs:
                 raise ValueError(
                     f"Node '{from_node}' has no output '{from_output}'. "
-                    f"Available: {list(source_op.output_specs.keys())}"
+                    f"Available: {list(source_outputs.keys())}"
                 )
 
         # Validate input exists on destination
         dest_op = self._nodes[to_node].operator
-        if to_input not in dest_op.input_specs:
+        dest_inputs = dest_op._cached_input_specs()
+        if to_input not in dest_inputs:
             raise ValueError(
                 f"Node '{to_node}' has no input '{to_input}'. "
-                f"Available: {list(dest_op.input_specs.keys())}"
+                f"Available: {list(dest_inputs.keys())}"
             )
 
-        self._edges.append(Edge(from_node, from_output, to_node, to_input))
+        edge = Edge(from_node, from_output, to_node, to_input)
+        if edge in self._edges:
+            return
+        self._edges[edge] = None
+        if from_node != self._input_node:
+            preds = self._reverse_preds[to_node]
+            if from_node not in preds:
+                preds.add(from_node)
+                self._successors[from_node].append(to_node)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop cached structure derived from nodes and edges."""
         self._cached_order = None
+        self._incoming = None
+        self._compiled_plan = None
+        self._validated = {}
+        self._node_memo = {}
+        self._content_memo.clear()
+        self._numba_exec = None
+        self._python_exec = None
+        self._structure_cache = None
+
+    def _incoming_edges(self) -> dict[str, list[Edge]]:
+        """Return edges grouped by destination node, built on first use.
+
+        Returns:
+            A dict mapping each node name to the edges feeding into it.
+        """
+        if self._incoming is not None:
+            return self._incoming
+
+        incoming: dict[str, list[Edge]] = {name: [] for name in self._nodes}
+        for edge in self._edges:
+            incoming[edge.to_node].append(edge)
+
+        self._incoming = incoming
+        return incoming
 
     def _topological_sort(self) -> list[str]:
         """Return nodes in topological order (dependencies first).
@@ -141,31 +292,15 @@ class OperatorGraph:
         if self._cached_order is not None:
             return self._cached_order
 
-        # Build adjacency and in-degree
-        in_degree: dict[str, int] = {name: 0 for name in self._nodes}
-        adjacency: dict[str, list[str]] = defaultdict(list)
-
-        for edge in self._edges:
-            if edge.from_node != self._input_node:
-                if edge.to_node not in adjacency[edge.from_node]:
-                    adjacency[edge.from_node].append(edge.to_node)
-                in_degree[edge.to_node] += 1
-
-        # Adjust for duplicate edges (only count unique from_node -> to_node)
-        in_degree = {name: 0 for name in self._nodes}
-        unique_deps: dict[str, set[str]] = defaultdict(set)
-        for edge in self._edges:
-            if edge.from_node != self._input_node:
-                unique_deps[edge.to_node].add(edge.from_node)
-        for node, deps in unique_deps.items():
-            in_degree[node] = len(deps)
+        adjacency = self._successors
+        in_degree = {name: len(self._reverse_preds[name]) for name in self._nodes}
 
         # Kahn's algorithm
-        queue = [name for name, deg in in_degree.items() if deg == 0]
+        queue = deque(name for name, deg in in_degree.items() if deg == 0)
         result: list[str] = []
 
         while queue:
-            node = queue.pop(0)
+            node = queue.popleft()
             result.append(node)
             for neighbor in adjacency[node]:
                 in_degree[neighbor] -= 1
@@ -178,69 +313,446 @@ class OperatorGraph:
         self._cached_order = result
         return result
 
-    def execute(
+    def _compile(self) -> list[_PlanStep]:
+        """Flatten the graph into an execution plan, built on first use.
+
+        Every "<node>.<output>" key that flows along an edge or is produced by
+        a node is assigned an integer slot, with graph inputs first. Each plan
+        step is (node_name, operator, gathers, outputs), where gathers pairs a
+        source slot with the destination input name and outputs pairs each
+        declared output name with its slot. execute() then moves tensors
+        through a flat list instead of formatting and hashing string keys.
+
+        Returns:
+            The execution plan in topological order.
+
+        Raises:
+            ValueError: If the graph contains cycles.
+        """
+        if self._compiled_plan is not None:
+            return self._compiled_plan
+
+        execution_order = self._topological_sort()
+        incoming = self._incoming_edges()
+
+        slot_ids: dict[str, int] = {}
+        input_slots: dict[str, int] = {}
+        for edge in self._edges:
+            name = edge.from_output
+            if edge.from_node == self._input_node and name not in input_slots:
+                key = sys.intern(f"{self._input_node}.{name}")
+                input_slots[name] = slot_ids[key] = len(slot_ids)
+
+        plan = []
+        for node_name in execution_order:
+            operator = self._nodes[node_name].operator
+            outputs = []
+            for output_name in operator._cached_output_specs():
+                key = sys.intern(f"{node_name}.{output_name}")
+                slot_ids[key] = len(slot_ids)
+                outputs.append((output_name, slot_ids[key]))
+            plan.append((node_name, operator, (), tuple(outputs)))
+
+        # Gathers are resolved once every producer has a slot
+        for i, (node_name, operator, _, outputs) in enumerate(plan):
+            gathers = tuple(
+                (slot_ids[f"{edge.from_node}.{edge.from_output}"], edge.to_input)
+                for edge in incoming[node_name]
+            )
+            plan[i] = (node_name, operator, gathers, outputs)
+
+        self._slot_keys = list(slot_ids)
+        self._input_slots = input_slots
+        self._deterministic_nodes = frozenset(
+            node_name
+            for node_name, operator, _, _ in plan
+            if "deterministic" in operator._cached_tags()
+        )
+        self._compiled_plan = plan
+        return plan
+
+    def compile_numba(self) -> None:
+        """Fuse all node kernels into a single Numba-compiled function.
+
+        Every operator in the graph must implement NumbaKernelProvider.
+        After compiling, execute() runs the fused function on the raw input
+        arrays instead of dispatching each node's forward() from Python.
+        Output tensors are rebuilt from their output specs, so operator
+        tags are not propagated on this path. Editing the graph discards
+        the compiled function.
+
+        Raises:
+            ImportError: If numba is not installed.
+            TypeError: If any operator does not provide a Numba kernel.
+            ValueError: If the graph contains cycles, or a node input is not
+                connected.
+        """
+        try:
+            import numba
+        except ImportError as e:
+            raise ImportError(
+                "OperatorGraph.compile_numba() requires numba. "
+                "Install it with 'pip install tensorscope[numba]'."
+            ) from e
+
+        plan = self._compile()
+        namespace: dict[str, Any] = {}
+        params = [f"s{slot}" for slot in self._input_slots.values()]
+        body: list[str] = []
+
+        for i, (node_name, operator, gathers, output_slots) in enumerate(plan):
+            if not isinstance(operator, NumbaKernelProvider):
+                raise TypeError(
+                    f"Node '{node_name}' ({operator.name}) has no numba_kernel()"
+                )
+            namespace[f"k{i}"] = operator.numba_kernel()
+            by_input = {to_input: slot for slot, to_input in gathers}
+            input_names = operator._cached_input_specs()
+            # The fused call passes every kernel argument positionally, so
+            # even optional inputs must be connected
+            for name in input_names:
+                if name not in by_input:
+                    raise ValueError(
+                        f"Node '{node_name}' ({operator.name}): input '{name}' "
+                        "is not connected"
+                    )
+            args = ", ".join(f"s{by_input[name]}" for name in input_names)
+            targets = "".join(f"s{slot}, " for _, slot in output_slots)
+            call = f"k{i}({args})"
+            body.append(f"    {targets}= {call}" if targets else f"    {call}")
+
+        output_range = range(len(self._input_slots), len(self._slot_keys))
+        returned = "".join(f"s{slot}, " for slot in output_range)
+        source = "\n".join(
+            [f"def _fused({', '.join(params)}):", *body, f"    return ({returned})"]
+        )
+        exec(source, namespace)
+        self._numba_exec = numba.njit(namespace["_fused"])
+
+    def _execute_numba(
         self, inputs: dict[str, TrackedTensor]
+    ) -> dict[str, TrackedTensor]:
+        """Execute the graph through the function built by compile_numba()."""
+        plan = self._compile()
+        arrays = []
+        for name in self._input_slots:
+            if name not in inputs:
+                raise ValueError(f"Missing tensor '{self._input_node}.{name}'")
+            arrays.append(inputs[name].data)
+        results = self._numba_exec(*arrays)
+
+        tensors: dict[str, TrackedTensor] = {}
+        for name, tensor in inputs.items():
+            tensors[f"{self._input_node}.{name}"] = tensor
+
+        results_iter = iter(results)
+        for _, operator, _, output_slots in plan:
+            specs = operator._cached_output_specs()
+            for output_name, slot in output_slots:
+                data = next(results_iter)
+                kind = specs[output_name].kind
+                if kind is None:
+                    kind = TensorKind.VECTOR if data.ndim <= 1 else TensorKind.MATRIX
+                key = self._slot_keys[slot]
+                tensors[key] = TrackedTensor(data=data, name=key, kind=kind)
+
+        self._last_execution_tensors = tensors
+        self._last_inputs = dict(inputs)
+        return tensors
+
+    def compile_python(self) -> None:
+        """Generate a straight-line Python function that executes the graph.
+
+        The generated function calls each node's forward() in topological
+        order with tensors held in local variables, so execute() no longer
+        walks the plan or gathers inputs in a loop. Input validation works
+        as on the interpreted path. Editing the graph discards the function;
+        calling this again on an unchanged graph is a no-op.
+
+        Raises:
+            ValueError: If the graph contains cycles.
+        """
+        if self._python_exec is not None:
+            return
+
+        plan = self._compile()
+        namespace: dict[str, Any] = {
+            "check": self._check_node,
+            "check_outputs": _check_outputs,
+        }
+        params = [f"s{slot}" for slot in self._input_slots.values()]
+        body: list[str] = []
+
+        for i, (node_name, operator, gathers, output_slots) in enumerate(plan):
+            namespace[f"op{i}"] = operator
+            items = ", ".join(f"{to_input!r}: s{slot}" for slot, to_input in gathers)
+            args = _positional_args(operator, gathers)
+            if args is None:
+                namespace[f"f{i}"] = operator.forward
+                body.append(f"    n{i} = {{{items}}}")
+                body.append("    if validate:")
+                body.append(f"        check({node_name!r}, op{i}, n{i})")
+                call = f"f{i}(n{i})"
+            else:
+                # The input dict is only needed for validation
+                namespace[f"f{i}"] = operator._forward_fast
+                body.append("    if validate:")
+                body.append(f"        check({node_name!r}, op{i}, {{{items}}})")
+                call = f"f{i}({args})"
+            body.append(f"    o = {call}")
+            body.append(f"    check_outputs({node_name!r}, op{i}, o)")
+            body.extend(
+                f"    s{slot} = o[{output_name!r}]"
+                for output_name, slot in output_slots
+            )
+
+        output_range = range(len(self._input_slots), len(self._slot_keys))
+        returned = "".join(f"s{slot}, " for slot in output_range)
+        source = "\n".join(
+            [
+                f"def _graph_exec(validate, {''.join(p + ', ' for p in params)}):",
+                *body,
+                f"    return ({returned})",
+            ]
+        )
+        exec(source, namespace)
+        self._python_exec = namespace["_graph_exec"]
+
+    def _execute_python(
+        self, inputs: dict[str, TrackedTensor], validate: bool
+    ) -> dict[str, TrackedTensor]:
+        """Execute the graph through the function built by compile_python()."""
+        results = self._python_exec(
+            validate, *(inputs[name] for name in self._input_slots)
+        )
+        return self._collect_outputs(inputs, results)
+
+    def execute(
+        self,
+        inputs: dict[str, TrackedTensor],
+        validate: bool = True,
     ) -> dict[str, TrackedTensor]:
         """Execute the graph with given inputs.
 
+        Operator inputs are validated against their specs the first time a
+        node sees a given combination of input kinds and shapes; repeated
+        executions with same-typed inputs call forward() directly.
+
         Args:
             inputs: A dict mapping input names to TrackedTensors.
+            validate: If False, skip input validation entirely.
 
         Returns:
             A dict mapping "<node>.<output>" to TrackedTensors for all
             outputs of all nodes.
+
+        Raises:
+            ValueError: If an input is invalid, or a node's forward() does
+                not return exactly the outputs in its output_specs.
         """
-        execution_order = self._topological_sort()
+        if self._numba_exec is not None:
+            return self._execute_numba(inputs)
+        python_exec = self._python_exec
+        if python_exec is not None and self._input_slots.keys() <= inputs.keys():
+            return self._execute_python(inputs, validate)
+        return self._run(inputs, validate, reuse=False)
+
+    def execute_from(
+        self,
+        changed_inputs: dict[str, TrackedTensor],
+        validate: bool = True,
+    ) -> dict[str, TrackedTensor]:
+        """Re-execute the graph after some of the last inputs changed.
 
-        # Map of "node.output" -> tensor
-        tensors: dict[str, TrackedTensor] = {}
+        Inputs not in changed_inputs keep their values from the previous
+        execution. Nodes tagged 'deterministic' whose input tensors are the
+        same objects as last time reuse their previous outputs, so only the
+        subgraph downstream of the changed inputs is recomputed.
+
+        Args:
+            changed_inputs: A dict mapping input names to new TrackedTensors.
+            validate: If False, skip input validation entirely.
+
+        Returns:
+            A dict mapping "<node>.<output>" to TrackedTensors for all
+            outputs of all nodes.
+        """
+        inputs = {**self._last_inputs, **changed_inputs}
+        if self._numba_exec is not None:
+            return self._execute_numba(inputs)
+        return self._run(inputs, validate, reuse=True)
+
+    def execute_memoized(
+        self,
+        inputs: dict[str, TrackedTensor],
+        validate: bool = True,
+    ) -> dict[str, TrackedTensor]:
+        """Execute the graph, reusing outputs of nodes whose inputs are unchanged.
+
+        Unlike execute_from(), inputs are compared by content: a node tagged
+        'deterministic' whose input tensors match an earlier execution in
+        name, kind, tags and data returns that execution's output tensors,
+        even if the inputs were rebuilt as new objects. The last 128 such
+        results are kept, so returning to earlier parameter values is also
+        a cache hit.
+
+        Args:
+            inputs: A dict mapping input names to TrackedTensors.
+            validate: If False, skip input validation entirely.
+
+        Returns:
+            A dict mapping "<node>.<output>" to TrackedTensors for all
+            outputs of all nodes.
+        """
+        if self._numba_exec is not None:
+            return self._execute_numba(inputs)
+        return self._run(inputs, validate, reuse=True, by_content=True)
+
+    def _run(
+        self,
+        inputs: dict[str, TrackedTensor],
+        validate: bool,
+        reuse: bool,
+        by_content: bool = False,
+    ) -> dict[str, TrackedTensor]:
+        """Execute the compiled plan, optionally reusing memoized node outputs.
+
+        With reuse, deterministic nodes are matched against their last
+        inputs by identity; with by_content as well, against the content
+        memo by fingerprint.
+        """
+        plan = self._compile()
+        slot_keys = self._slot_keys
+        deterministic = self._deterministic_nodes
+        memo = self._node_memo
+        content_memo = self._content_memo
+        # Slot id -> fingerprint of its tensor, computed once per execution
+        fingerprints: dict[int, tuple[Any, ...]] = {}
+
+        # Slot id -> tensor
+        slots: list[TrackedTensor | None] = [None] * len(slot_keys)
 
         # Store graph inputs
+        input_slots = self._input_slots
         for name, tensor in inputs.items():
-            tensors[f"{self._input_node}.{name}"] = tensor
+            slot = input_slots.get(name)
+            if slot is not None:
+                slots[slot] = tensor
 
         # Execute nodes in order
-        for node_name in execution_order:
-            instance = self._nodes[node_name]
-            operator = instance.operator
-
-            # Gather inputs for this node
+        for node_name, operator, gathers, output_slots in plan:
             node_inputs: dict[str, TrackedTensor] = {}
-            for edge in self._edges:
-                if edge.to_node == node_name:
-                    source_key = f"{edge.from_node}.{edge.from_output}"
-                    if source_key not in tensors:
-                        raise ValueError(
-                            f"Missing tensor '{source_key}' for node '{node_name}'"
-                        )
-                    node_inputs[edge.to_input] = tensors[source_key]
-
-            # Execute the operator
-            outputs = operator(node_inputs)
-
-            # Store outputs
-            for output_name, tensor in outputs.items():
-                tensors[f"{node_name}.{output_name}"] = tensor
-
-        # Cache for get_all_tensors()
+            for slot, to_input in gathers:
+                tensor = slots[slot]
+                if tensor is None:
+                    raise ValueError(
+                        f"Missing tensor '{slot_keys[slot]}' for node '{node_name}'"
+                    )
+                node_inputs[to_input] = tensor
+
+            content_key = None
+            if node_name in deterministic:
+                input_tensors = tuple(node_inputs.values())
+                cached = memo.get(node_name)
+                if (
+                    reuse
+                    and cached is not None
+                    and len(cached[0]) == len(input_tensors)
+                    and all(a is b for a, b in zip(cached[0], input_tensors))
+                ):
+                    for output_name, slot in output_slots:
+                        slots[slot] = cached[1][output_name]
+                    continue
+                if by_content:
+                    for slot, _ in gathers:
+                        if slot not in fingerprints:
+                            fingerprints[slot] = _fingerprint(slots[slot])
+                    # Gathers are in a fixed order for each node
+                    content_key = (
+                        node_name,
+                        *(fingerprints[slot] for slot, _ in gathers),
+                    )
+                    outputs = content_memo.get(content_key)
+                    if outputs is not None:
+                        content_memo.move_to_end(content_key)
+                        memo[node_name] = (input_tensors, outputs)
+                        for output_name, slot in output_slots:
+                            slots[slot] = outputs[output_name]
+                        continue
+
+            if validate:
+                self._check_node(node_name, operator, node_inputs)
+
+            outputs = operator.forward(node_inputs)
+            _check_outputs(node_name, operator, outputs)
+            if node_name in deterministic:
+                memo[node_name] = (input_tensors, outputs)
+                if content_key is not None:
+                    content_memo[content_key] = outputs
+                    if len(content_memo) > _MAX_CONTENT_MEMO:
+                        content_memo.popitem(last=False)
+
+            for output_name, slot in output_slots:
+                slots[slot] = outputs[output_name]
+
+        return self._collect_outputs(inputs, slots[len(input_slots) :])
+
+    def _check_node(
+        self,
+        node_name: str,
+        operator: Operator,
+        node_inputs: dict[str, TrackedTensor],
+    ) -> None:
+        """Validate a node's inputs unless the same kinds and shapes passed."""
+        signature = tuple((t.kind, t.shape) for t in node_inputs.values())
+        if self._validated.get(node_name) != signature:
+            operator.validate_inputs(node_inputs)
+            self._validated[node_name] = signature
+
+    def _collect_outputs(
+        self,
+        inputs: dict[str, TrackedTensor],
+        outputs: Sequence[TrackedTensor | None],
+    ) -> dict[str, TrackedTensor]:
+        """Build the result mapping and record it as the last execution.
+
+        Args:
+            inputs: The graph inputs of this execution.
+            outputs: Node output tensors in slot order.
+
+        Returns:
+            A dict mapping "<node>.<output>" to tensors: all graph inputs,
+            then node outputs.
+        """
+        tensors: dict[str, TrackedTensor] = {}
+        input_keys = self._input_keys
+        for name, tensor in inputs.items():
+            key = input_keys.get(name)
+            if key is None:
+                key = input_keys[name] = sys.intern(f"{self._input_node}.{name}")
+            tensors[key] = tensor
+        tensors.update(zip(self._slot_keys[len(self._input_slots) :], outputs))
+
+        # Cache for get_all_tensors() and execute_from()
         self._last_execution_tensors = tensors
+        self._last_inputs = dict(inputs)
         return tensors
 
-    def get_all_tensors(self) -> dict[str, TrackedTensor]:
+    def get_all_tensors(self) -> Mapping[str, TrackedTensor]:
         """Get all tensors from the last execution.
 
         Returns:
-            A dict mapping "<node>.<output>" to TrackedTensors.
+            A read-only view mapping "<node>.<output>" to TrackedTensors.
         """
-        return self._last_execution_tensors.copy()
+        return MappingProxyType(self._last_execution_tensors)
 
-    def get_nodes(self) -> dict[str, OperatorInstance]:
+    def get_nodes(self) -> Mapping[str, OperatorInstance]:
         """Get all nodes in the graph.
 
         Returns:
-            A dict mapping node names to OperatorInstances.
+            A read-only view mapping node names to OperatorInstances.
         """
-        return self._nodes.copy()
+        return MappingProxyType(self._nodes)
 
     def get_edges(self) -> list[Edge]:
         """Get all edges in the graph.
@@ -248,22 +760,28 @@ class OperatorGraph:
         Returns:
             A list of Edge objects.
         """
-        return self._edges.copy()
+        return list(self._edges)
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize the graph structure for API responses.
 
+        The result is cached until the graph is edited, so callers share
+        the same dict and must not mutate it.
+
         Returns:
             A dict with 'nodes' and 'edges' lists.
         """
+        if self._structure_cache is not None:
+            return self._structure_cache
+
         nodes = []
         for name, instance in self._nodes.items():
             nodes.append({
                 "id": name,
                 "name": instance.operator.name,
-                "inputs": list(instance.operator.input_specs.keys()),
-                "outputs": list(instance.operator.output_specs.keys()),
-                "tags": sorted(instance.operator.tags),
+                "inputs": list(instance.operator._cached_input_specs().keys()),
+                "outputs": list(instance.operator._cached_output_specs().keys()),
+                "tags": list(_sorted_tags(instance.operator._cached_tags())),
             })
 
         edges = []
@@ -275,7 +793,8 @@ class OperatorGraph:
                 "to_input": edge.to_input,
             })
 
-        return {"nodes": nodes, "edges": edges}
+        self._structure_cache = {"nodes": nodes, "edges": edges}
+        return self._structure_cache
 
     def __repr__(self) -> str:
         return f"OperatorGraph(nodes={len(self._nodes)}, edges={len(self._edges)})"
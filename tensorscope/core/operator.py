@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Protocol, runtime_checkable
 
+from ._compat import DATACLASS_SLOTS
 from .tensor import TrackedTensor, TensorKind, TensorSummary, compute_summary
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TensorSpec:
     """Specification for an operator input or output tensor.
 
@@ -23,6 +25,8 @@ class TensorSpec:
                e.g., (-1, -1) means any 2D matrix, (3, -1) means 3 rows, any columns.
         optional: Whether this input is optional.
         description: Human-readable description of this tensor.
+        batched: Whether leading batch dimensions may precede the
+                 dimensions in shape, e.g. a (B, m, n) stack for (-1, -1).
     """
 
     name: str
@@ -30,6 +34,7 @@ class TensorSpec:
     shape: tuple[int, ...] | None = None
     optional: bool = False
     description: str = ""
+    batched: bool = False
 
     def validate(self, tensor: TrackedTensor | None) -> tuple[bool, str]:
         """Validate a tensor against this spec.
@@ -52,12 +57,19 @@ class TensorSpec:
             )
 
         if self.shape is not None:
-            if len(tensor.shape) != len(self.shape):
+            ndim = len(self.shape)
+            if len(tensor.shape) != ndim and not (
+                self.batched and len(tensor.shape) > ndim
+            ):
                 return False, (
-                    f"Input '{self.name}' expected {len(self.shape)}D tensor, "
+                    f"Input '{self.name}' expected {ndim}D tensor, "
                     f"got {len(tensor.shape)}D"
                 )
-            for i, (expected, actual) in enumerate(zip(self.shape, tensor.shape)):
+            # Batch dimensions are unconstrained; check the trailing ones
+            offset = len(tensor.shape) - ndim
+            for i, (expected, actual) in enumerate(
+                zip(self.shape, tensor.shape[offset:]), offset
+            ):
                 if expected != -1 and expected != actual:
                     return False, (
                         f"Input '{self.name}' expected dimension {i} to be {expected}, "
@@ -67,6 +79,48 @@ class TensorSpec:
         return True, ""
 
 
+# Tag sets shared by every operator class that declares the same _TAGS
+_INTERNED_TAGS: dict[frozenset[str], frozenset[str]] = {}
+
+
+def _positional_forward(
+    specs: Mapping[str, TensorSpec],
+) -> Callable[[Operator, dict[str, TrackedTensor]], dict[str, TrackedTensor]]:
+    """Generate a forward() that unpacks its inputs for _forward_fast()."""
+    args = ", ".join(
+        f"inputs.get({name!r})" if spec.optional else f"inputs[{name!r}]"
+        for name, spec in specs.items()
+    )
+    namespace: dict[str, Any] = {}
+    exec(
+        f"def forward(self, inputs):\n    return self._forward_fast({args})",
+        namespace,
+    )
+    forward = namespace["forward"]
+    forward.__doc__ = Operator.forward.__doc__
+    return forward
+
+
+def _class_input_specs(self: Operator) -> dict[str, TensorSpec]:
+    return self._INPUT_SPECS
+
+
+def _class_output_specs(self: Operator) -> dict[str, TensorSpec]:
+    return self._OUTPUT_SPECS
+
+
+def _class_tags(self: Operator) -> frozenset[str]:
+    return self._TAGS
+
+
+def _class_name(self: Operator) -> str:
+    return self._NAME
+
+
+def _class_description(self: Operator) -> str:
+    return self._DESCRIPTION
+
+
 class Operator(ABC):
     """Abstract base class for all operators in Tensorscope.
 
@@ -77,8 +131,60 @@ class Operator(ABC):
         - forward(): Execute the operation
         - input_specs: Define expected inputs
         - output_specs: Define expected outputs
+
+    Subclasses should declare ``__slots__`` for their own attributes (or
+    ``__slots__ = ()`` if they have none) so instances carry no ``__dict__``.
+
+    Operators whose specs don't depend on constructor arguments can declare
+    class-level ``_INPUT_SPECS``, ``_OUTPUT_SPECS``, ``_TAGS``, ``_NAME`` and
+    ``_DESCRIPTION`` instead of overriding the corresponding properties.
+
+    Such operators can also implement ``_forward_fast(self, A, B, ...)``,
+    taking the input tensors positionally in ``_INPUT_SPECS`` order (None
+    for missing optional inputs), instead of forward(). forward() is then
+    generated from it, and compiled graphs call ``_forward_fast`` directly
+    without building an input dict.
     """
 
+    # Per-instance caches for specs and tags, filled on first use
+    __slots__ = ("_input_spec_cache", "_output_spec_cache", "_tags_cache")
+
+    # Input names passed positionally to _forward_fast(), or None if the
+    # operator only implements forward()
+    _FORWARD_ARGS: tuple[str, ...] | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Install properties for class-level spec and tag declarations.
+
+        The declarations are frozen once per class, so every instance shares
+        the same read-only mappings, and equal tag sets are interned across
+        classes.
+        """
+        super().__init_subclass__(**kwargs)
+        namespace = vars(cls)
+        if "_INPUT_SPECS" in namespace:
+            cls._INPUT_SPECS = MappingProxyType(dict(cls._INPUT_SPECS))
+            if "input_specs" not in namespace:
+                cls.input_specs = property(_class_input_specs)
+        if "_OUTPUT_SPECS" in namespace:
+            cls._OUTPUT_SPECS = MappingProxyType(dict(cls._OUTPUT_SPECS))
+            if "output_specs" not in namespace:
+                cls.output_specs = property(_class_output_specs)
+        if "_TAGS" in namespace:
+            tags = frozenset(cls._TAGS)
+            cls._TAGS = _INTERNED_TAGS.setdefault(tags, tags)
+            if "tags" not in namespace:
+                cls.tags = property(_class_tags)
+        if "_NAME" in namespace and "name" not in namespace:
+            cls.name = property(_class_name)
+        if "_DESCRIPTION" in namespace and "description" not in namespace:
+            cls.description = property(_class_description)
+        if "forward" in namespace:
+            cls._FORWARD_ARGS = None
+        elif hasattr(cls, "_forward_fast") and hasattr(cls, "_INPUT_SPECS"):
+            cls._FORWARD_ARGS = tuple(cls._INPUT_SPECS)
+            cls.forward = _positional_forward(cls._INPUT_SPECS)
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -176,6 +282,44 @@ class Operator(ABC):
         """
         return None
 
+    def _input_spec_table(
+        self,
+    ) -> tuple[
+        dict[str, TensorSpec], tuple[tuple[str, TensorSpec], ...], frozenset[str]
+    ]:
+        """Return input specs with their flattened items and names, cached.
+
+        Operator specs are derived from constructor arguments only, so they
+        are resolved once instead of on every access from the hot path.
+
+        Returns:
+            A tuple of (specs, ((name, spec), ...), frozenset of names).
+        """
+        table = getattr(self, "_input_spec_cache", None)
+        if table is None:
+            specs = self.input_specs
+            table = (specs, tuple(specs.items()), frozenset(specs))
+            self._input_spec_cache = table
+        return table
+
+    def _cached_input_specs(self) -> dict[str, TensorSpec]:
+        """Return input_specs, computed once per instance."""
+        return self._input_spec_table()[0]
+
+    def _cached_output_specs(self) -> dict[str, TensorSpec]:
+        """Return output_specs, computed once per instance."""
+        specs = getattr(self, "_output_spec_cache", None)
+        if specs is None:
+            specs = self._output_spec_cache = self.output_specs
+        return specs
+
+    def _cached_tags(self) -> frozenset[str]:
+        """Return tags, computed once per instance."""
+        tags = getattr(self, "_tags_cache", None)
+        if tags is None:
+            tags = self._tags_cache = self.tags
+        return tags
+
     def validate_inputs(self, inputs: dict[str, TrackedTensor]) -> None:
         """Validate input tensors against input_specs.
 
@@ -185,17 +329,15 @@ class Operator(ABC):
         Raises:
             ValueError: If any input doesn't match its spec.
         """
-        for name, spec in self.input_specs.items():
-            tensor = inputs.get(name)
-            is_valid, error = spec.validate(tensor)
+        _, specs, expected_names = self._input_spec_table()
+        for name, spec in specs:
+            is_valid, error = spec.validate(inputs.get(name))
             if not is_valid:
                 raise ValueError(f"Operator '{self.name}': {error}")
 
         # Check for unexpected inputs
-        expected_names = set(self.input_specs.keys())
-        actual_names = set(inputs.keys())
-        unexpected = actual_names - expected_names
-        if unexpected:
+        if not expected_names.issuperset(inputs):
+            unexpected = set(inputs) - expected_names
             raise ValueError(
                 f"Operator '{self.name}': Unexpected inputs: {unexpected}"
             )
@@ -220,7 +362,7 @@ class Operator(ABC):
         return f"{self.__class__.__name__}(name={self.name!r})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OperatorInstance:
     """An operator instance in a graph with a unique node name.
 
@@ -238,3 +380,21 @@ class OperatorInstance:
 
     def __repr__(self) -> str:
         return f"OperatorInstance(node={self.node_name!r}, op={self.operator.name!r})"
+
+
+@runtime_checkable
+class NumbaKernelProvider(Protocol):
+    """Protocol for operators that can run inside a fused Numba graph.
+
+    Operators implementing this can be compiled together by
+    OperatorGraph.compile_numba() into a single nopython function,
+    removing per-node Python dispatch for graphs of small array ops.
+    """
+
+    def numba_kernel(self) -> Callable[..., tuple[Any, ...]]:
+        """Return an @njit function implementing forward() on raw arrays.
+
+        The kernel takes one array per input, in input_specs order, and
+        returns a tuple with one array per output, in output_specs order.
+        """
+        ...
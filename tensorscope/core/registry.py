@@ -30,6 +30,9 @@ class OperatorRegistry:
     _visualizer_rules: list[
         tuple[Callable[["TrackedTensor"], bool], list[str]]
     ] = []
+    _kinded_visualizer_rules: dict[
+        "TensorKind", list[tuple[Callable[["TrackedTensor"], bool], list[str]]]
+    ] = {}
 
     def __new__(cls) -> "OperatorRegistry":
         if cls._instance is None:
@@ -43,8 +46,14 @@ class OperatorRegistry:
         Can be used as a decorator:
             @OperatorRegistry.register
             class MyOperator(Operator):
+                name = "my_op"
                 ...
 
+        The registry name is read from a class-level ``name`` string, which
+        is the preferred pattern. Operators that define ``name`` as a
+        property are probed on an uninitialized instance instead, falling
+        back to the class name if that fails.
+
         Args:
             operator_class: The operator class to register.
 
@@ -54,14 +63,13 @@ class OperatorRegistry:
         Raises:
             ValueError: If an operator with this name is already registered.
         """
-        # Create a temporary instance to get the name
-        # This is a bit hacky but avoids requiring a class attribute
-        try:
-            instance = operator_class.__new__(operator_class)
-            name = instance.name
-        except Exception:
-            # If we can't instantiate, use the class name
-            name = operator_class.__name__
+        name = getattr(operator_class, "name", None)
+        if not isinstance(name, str):
+            try:
+                name = operator_class.__new__(operator_class).name
+            except Exception:
+                # If we can't instantiate, use the class name
+                name = operator_class.__name__
 
         if name in cls._operators:
             raise ValueError(f"Operator '{name}' is already registered")
@@ -100,6 +108,7 @@ class OperatorRegistry:
         cls,
         predicate: Callable[["TrackedTensor"], bool],
         visualizers: list[str],
+        kind: "TensorKind | None" = None,
     ) -> None:
         """Add a rule for recommending visualizers based on tensor properties.
 
@@ -107,15 +116,23 @@ class OperatorRegistry:
             predicate: A function that takes a TrackedTensor and returns True
                       if the visualizers should be recommended.
             visualizers: A list of visualizer names to recommend.
+            kind: If given, the rule is only evaluated for tensors of this
+                  kind. Rules without a kind are evaluated for every tensor.
         """
-        cls._visualizer_rules.append((predicate, visualizers))
+        if kind is None:
+            cls._visualizer_rules.append((predicate, visualizers))
+        else:
+            cls._kinded_visualizer_rules.setdefault(kind, []).append(
+                (predicate, visualizers)
+            )
 
     @classmethod
     def get_recommended_visualizers(cls, tensor: "TrackedTensor") -> list[str]:
         """Get recommended visualizers for a tensor.
 
-        Checks all registered rules and returns matching visualizers.
-        Also includes default recommendations based on tensor kind.
+        Checks rules registered for the tensor's kind, then rules registered
+        without a kind, and returns matching visualizers. Also includes
+        default recommendations based on tensor kind.
 
         Args:
             tensor: The tensor to get recommendations for.
@@ -140,15 +157,17 @@ class OperatorRegistry:
             visualizers.extend(kind_defaults[tensor.kind])
 
         # Apply custom rules
-        for predicate, viz_list in cls._visualizer_rules:
-            try:
-                if predicate(tensor):
-                    for v in viz_list:
-                        if v not in visualizers:
-                            visualizers.append(v)
-            except Exception:
-                # Ignore rule failures
-                pass
+        kinded_rules = cls._kinded_visualizer_rules.get(tensor.kind, ())
+        for rules in (kinded_rules, cls._visualizer_rules):
+            for predicate, viz_list in rules:
+                try:
+                    if predicate(tensor):
+                        for v in viz_list:
+                            if v not in visualizers:
+                                visualizers.append(v)
+                except Exception:
+                    # Ignore rule failures
+                    pass
 
         return visualizers
 
@@ -2,15 +2,41 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 from enum import Enum
+import os
+
 import numpy as np
 
-from .tensor import TrackedTensor, TensorKind, TensorSummary, compute_summary
+from .tensor import (
+    TrackedTensor,
+    TensorKind,
+    TensorSummary,
+    compute_summary,
+    discard_summaries,
+)
 from .graph import OperatorGraph
 
 
+# Worker threads for matrix decompositions in get_probed_summaries(); LAPACK
+# releases the GIL, so probes are factorized concurrently
+_summary_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="tensorscope-summary"
+)
+
+# Below this many matrix probes, decompositions run on the calling thread
+_MIN_PARALLEL_SUMMARIES = 3
+
+
+def _materialize_stats(summary: TensorSummary) -> None:
+    """Compute every lazily evaluated statistic of a summary."""
+    for _ in summary.stats:
+        pass
+
+
 class ParameterType(Enum):
     """Types of parameters that can be adjusted in scenarios."""
 
@@ -18,6 +44,49 @@ class ParameterType(Enum):
     DISCRETE = "discrete"  # Dropdown with options
 
 
+# Parameter fields that the compiled validator depends on
+_VALIDATION_FIELDS = frozenset({"param_type", "min_val", "max_val", "options"})
+
+
+def _accept_any(value: Any) -> tuple[bool, str]:
+    return True, ""
+
+
+def _continuous_validator(
+    min_val: float | None,
+    max_val: float | None,
+) -> Callable[[Any], tuple[bool, str]]:
+    def validate(value: Any) -> tuple[bool, str]:
+        if not isinstance(value, (int, float)):
+            return False, f"Expected numeric value, got {type(value).__name__}"
+        if min_val is not None and value < min_val:
+            return False, f"Value {value} is below minimum {min_val}"
+        if max_val is not None and value > max_val:
+            return False, f"Value {value} is above maximum {max_val}"
+        return True, ""
+
+    return validate
+
+
+def _discrete_validator(options: list[Any]) -> Callable[[Any], tuple[bool, str]]:
+    try:
+        allowed: frozenset[Any] | tuple[Any, ...] = frozenset(options)
+    except TypeError:
+        allowed = tuple(options)
+    options_repr = list(options)
+
+    def validate(value: Any) -> tuple[bool, str]:
+        try:
+            valid = value in allowed
+        except TypeError:
+            valid = value in options_repr
+        if not valid:
+            return False, f"Value {value} not in options {options_repr}"
+        return True, ""
+
+    return validate
+
+
 @dataclass
 class Parameter:
     """A tunable parameter in a scenario.
@@ -46,11 +115,20 @@ class Parameter:
     step: float | None = None
     options: list[Any] | None = None
     description: str = ""
+    _validator: Callable[[Any], tuple[bool, str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if not self.display_name:
             self.display_name = self.name.replace("_", " ").title()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Changing a constraint invalidates the compiled validator
+        object.__setattr__(self, name, value)
+        if name in _VALIDATION_FIELDS:
+            object.__setattr__(self, "_validator", None)
+
     def validate(self, value: Any) -> tuple[bool, str]:
         """Validate a parameter value.
 
@@ -60,17 +138,19 @@ class Parameter:
         Returns:
             A tuple of (is_valid, error_message).
         """
+        validator = self._validator
+        if validator is None:
+            validator = self._make_validator()
+            object.__setattr__(self, "_validator", validator)
+        return validator(value)
+
+    def _make_validator(self) -> Callable[[Any], tuple[bool, str]]:
+        """Build a validator closure specialized to this parameter's type."""
         if self.param_type == ParameterType.CONTINUOUS:
-            if not isinstance(value, (int, float)):
-                return False, f"Expected numeric value, got {type(value).__name__}"
-            if self.min_val is not None and value < self.min_val:
-                return False, f"Value {value} is below minimum {self.min_val}"
-            if self.max_val is not None and value > self.max_val:
-                return False, f"Value {value} is above maximum {self.max_val}"
-        elif self.param_type == ParameterType.DISCRETE:
-            if self.options is not None and value not in self.options:
-                return False, f"Value {value} not in options {self.options}"
-        return True, ""
+            return _continuous_validator(self.min_val, self.max_val)
+        if self.param_type == ParameterType.DISCRETE and self.options is not None:
+            return _discrete_validator(self.options)
+        return _accept_any
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize parameter for API responses."""
@@ -157,11 +237,15 @@ class Scenario:
         self.id = id or name.lower().replace(" ", "_")
 
         self._parameters: dict[str, Parameter] = {}
+        self._parameters_view = MappingProxyType(self._parameters)
         self._probes: list[ProbePoint] = []
+        self._probes_view: tuple[ProbePoint, ...] = ()
         self._graph: OperatorGraph | None = None
         self._input_generator: Callable[[dict[str, Any]], dict[str, TrackedTensor]] | None = None
         self._last_results: dict[str, TrackedTensor] = {}
         self._last_params: dict[str, Any] = {}
+        # Whether _last_results reflects the current graph and generator
+        self._results_current = False
 
     def param(
         self,
@@ -232,6 +316,7 @@ class Scenario:
             description=description,
         )
         self._probes.append(probe)
+        self._probes_view = tuple(self._probes)
         return probe
 
     def set_graph(self, graph: OperatorGraph) -> None:
@@ -241,6 +326,7 @@ class Scenario:
             graph: The configured OperatorGraph.
         """
         self._graph = graph
+        self._results_current = False
 
     def set_input_generator(
         self,
@@ -253,16 +339,17 @@ class Scenario:
                        a dict mapping input names to TrackedTensors.
         """
         self._input_generator = generator
+        self._results_current = False
 
     @property
-    def parameters(self) -> dict[str, Parameter]:
-        """Get all defined parameters."""
-        return self._parameters.copy()
+    def parameters(self) -> Mapping[str, Parameter]:
+        """Get all defined parameters as a read-only view."""
+        return self._parameters_view
 
     @property
-    def probes(self) -> list[ProbePoint]:
+    def probes(self) -> tuple[ProbePoint, ...]:
         """Get all probe points."""
-        return self._probes.copy()
+        return self._probes_view
 
     @property
     def graph(self) -> OperatorGraph | None:
@@ -299,11 +386,23 @@ class Scenario:
     def run(
         self,
         params: dict[str, Any] | None = None,
+        force: bool = False,
+        memoize: bool = False,
     ) -> dict[str, TrackedTensor]:
         """Execute the scenario with given parameters.
 
+        If the merged parameters equal those of the previous run, the
+        previous results are returned without regenerating inputs.
+
         Args:
             params: Parameter values. Missing parameters use defaults.
+            force: Re-run even if the parameters are unchanged, e.g. when
+                the input generator is not deterministic or the graph was
+                edited in place.
+            memoize: Reuse the outputs of deterministic nodes whose inputs
+                match an earlier run in content (see
+                OperatorGraph.execute_memoized), e.g. when a slider only
+                affects part of the graph.
 
         Returns:
             A dict mapping tensor keys to TrackedTensors for all outputs.
@@ -321,6 +420,9 @@ class Scenario:
         if params:
             full_params.update(params)
 
+        if not force and self._results_current and full_params == self._last_params:
+            return self._last_results
+
         # Validate
         is_valid, errors = self.validate_params(full_params)
         if not is_valid:
@@ -329,12 +431,24 @@ class Scenario:
         # Generate inputs
         inputs = self._input_generator(full_params)
 
-        # Execute graph
-        results = self._graph.execute(inputs)
-
-        # Cache results
+        if memoize:
+            results = self._graph.execute_memoized(inputs)
+        else:
+            # Execute graph through its generated straight-line function
+            self._graph.compile_python()
+            results = self._graph.execute(inputs)
+
+        # Cache results and drop summaries of this scenario's tensors that
+        # the new run replaced
+        live_ids = {tensor.id for tensor in results.values()}
+        discard_summaries(
+            tensor.id
+            for tensor in self._last_results.values()
+            if tensor.id not in live_ids
+        )
         self._last_results = results
         self._last_params = full_params
+        self._results_current = True
 
         return results
 
@@ -357,10 +471,22 @@ class Scenario:
             A dict mapping probe display names to TensorSummaries.
         """
         summaries: dict[str, TensorSummary] = {}
+        matrices: dict[str, TensorSummary] = {}
         for probe in self._probes:
             if probe.tensor_key in self._last_results:
                 tensor = self._last_results[probe.tensor_key]
-                summaries[probe.display_name] = compute_summary(tensor)
+                summary = compute_summary(tensor)
+                summaries[probe.display_name] = summary
+                if tensor.kind == TensorKind.MATRIX and tensor.data.ndim == 2:
+                    matrices[tensor.id] = summary
+
+        # Decompositions dominate matrix summaries, so compute those stats
+        # in the pool. Elementwise stats stay on this thread because the
+        # numba kernel already runs in parallel.
+        if len(matrices) >= _MIN_PARALLEL_SUMMARIES:
+            for summary in matrices.values():
+                summary.stats["norm"]
+            list(_summary_pool.map(_materialize_stats, matrices.values()))
         return summaries
 
     def to_dict(self) -> dict[str, Any]:
@@ -4,11 +4,26 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
-import uuid
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Mapping, Sequence
+import itertools
+import os
+import secrets
 
 import numpy as np
 
+try:
+    import scipy.linalg as scipy_linalg
+except ImportError:  # pragma: no cover - exercised only without scipy
+    scipy_linalg = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - exercised only without xxhash
+    xxhash = None
+
+from ._compat import DATACLASS_SLOTS
+from ._stats_kernels import basic_stats, is_symmetric
+
 
 class TensorKind(Enum):
     """Classification of tensor types for visualization selection."""
@@ -20,10 +35,41 @@ class TensorKind(Enum):
     POINTCLOUD = "pointcloud"
 
 
-@dataclass
+# Display names of dtypes; str() of a dtype costs microseconds
+_DTYPE_NAMES: dict[np.dtype, str] = {}
+
+
+# Tensor IDs are a per-process random prefix plus a counter, which keeps them
+# unique across server restarts without paying for uuid4() per tensor
+_ID_PREFIX = f"t{secrets.token_hex(4)}-"
+_id_counter = itertools.count()
+
+
+def _next_tensor_id() -> str:
+    """Return a new unique tensor ID."""
+    return f"{_ID_PREFIX}{next(_id_counter):x}"
+
+
+def _data_digest(data: np.ndarray) -> int:
+    """Return a hash of the contents of C-contiguous data.
+
+    The buffer is hashed in place with xxhash when installed and from a
+    bytes copy otherwise.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return hash(data.tobytes())
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TrackedTensor:
     """A tensor with metadata for tracking through operator graphs.
 
+    The data is stored as a read-only, C-contiguous array: a read-only view
+    of the given array when it is already contiguous, otherwise a copy.
+    Tensors can therefore share arrays with caches and other tensors
+    without defensive copies.
+
     Attributes:
         data: The underlying numpy array.
         name: Human-readable name for display.
@@ -36,7 +82,51 @@ class TrackedTensor:
     name: str
     kind: TensorKind
     tags: frozenset[str] = field(default_factory=frozenset)
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_next_tensor_id)
+
+    # dtype used by from_array(); summaries promote it for decompositions.
+    # TENSORSCOPE_FORCE_FP64=1 keeps full precision throughout.
+    DEFAULT_DTYPE: ClassVar[np.dtype] = np.dtype(
+        np.float64 if os.environ.get("TENSORSCOPE_FORCE_FP64") == "1" else np.float32
+    )
+
+    def __post_init__(self) -> None:
+        data = self.data
+        if isinstance(data, np.ndarray) and (
+            data.flags.writeable or not data.flags.c_contiguous
+        ):
+            if data.flags.c_contiguous:
+                data = data.view()
+            else:
+                data = np.ascontiguousarray(data)
+            data.flags.writeable = False
+            object.__setattr__(self, "data", data)
+
+    @classmethod
+    def from_array(
+        cls,
+        data: Any,
+        name: str,
+        kind: TensorKind,
+        tags: Iterable[str] = (),
+        dtype: Any = None,
+    ) -> TrackedTensor:
+        """Create a tensor, casting the data to DEFAULT_DTYPE.
+
+        Storing float32 halves memory and bandwidth for elementwise
+        statistics; compute_summary() still runs SVD, eigenvalue and
+        Cholesky factorizations in float64.
+
+        Args:
+            data: Array-like tensor data.
+            name: Human-readable name for display.
+            kind: Classification for visualization selection.
+            tags: Semantic tags.
+            dtype: Overrides DEFAULT_DTYPE, e.g. np.float64 for data whose
+                accuracy matters beyond the summary statistics.
+        """
+        array = np.asarray(data, dtype=cls.DEFAULT_DTYPE if dtype is None else dtype)
+        return cls(data=array, name=name, kind=kind, tags=frozenset(tags))
 
     @property
     def shape(self) -> tuple[int, ...]:
@@ -46,7 +136,11 @@ class TrackedTensor:
     @property
     def dtype(self) -> str:
         """Return the dtype of the underlying data as a string."""
-        return str(self.data.dtype)
+        dtype = self.data.dtype
+        name = _DTYPE_NAMES.get(dtype)
+        if name is None:
+            name = _DTYPE_NAMES[dtype] = str(dtype)
+        return name
 
     def with_tags(self, *new_tags: str) -> TrackedTensor:
         """Return a new TrackedTensor with additional tags."""
@@ -66,11 +160,13 @@ class TrackedTensor:
         )
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TensorSummary:
     """Summary statistics for a tensor, sent to the frontend.
 
     This is the serializable representation of a tensor for API responses.
+    Statistics and recommended views returned by compute_summary() are
+    computed on first access.
     """
 
     id: str
@@ -79,11 +175,55 @@ class TensorSummary:
     tags: list[str]
     shape: tuple[int, ...]
     dtype: str
-    stats: dict[str, Any]
-    recommended_views: list[str]
+    stats: Mapping[str, Any]
+    recommended_views: Sequence[str]
+    # to_dict() result with all statistics, built on first use
+    _full_dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to a dictionary for JSON serialization."""
+    def select_stats(
+        self,
+        names: Iterable[str] | None = None,
+        compact: bool = False,
+    ) -> dict[str, Any]:
+        """Return the named statistics, computing only what they need.
+
+        Args:
+            names: Statistic names to include. Names the tensor does not
+                have are skipped. If None, all statistics are returned.
+            compact: If True, round floats to 7 significant digits (about
+                float32 precision) and keep only the largest singular values,
+                for smaller JSON payloads.
+
+        Returns:
+            A plain dict of the selected statistics.
+        """
+        if names is None:
+            selected = dict(self.stats)
+        else:
+            selected = {name: self.stats[name] for name in names if name in self.stats}
+        if compact:
+            return {name: _compact_stat(value) for name, value in selected.items()}
+        return selected
+
+    def to_dict(self, stat_names: Iterable[str] | None = None) -> dict[str, Any]:
+        """Convert to a dictionary for JSON serialization.
+
+        Statistics are exported in compact form (see select_stats()). The
+        dict with all statistics is built once per summary and shared, so
+        callers must not modify it.
+
+        Args:
+            stat_names: Optional whitelist of statistics to include.
+        """
+        if stat_names is None:
+            if self._full_dict is None:
+                object.__setattr__(self, "_full_dict", self._build_dict(None))
+            return self._full_dict
+        return self._build_dict(stat_names)
+
+    def _build_dict(self, stat_names: Iterable[str] | None) -> dict[str, Any]:
         return {
             "id": self.id,
             "name": self.name,
@@ -91,82 +231,103 @@ class TensorSummary:
             "tags": self.tags,
             "shape": list(self.shape),
             "dtype": self.dtype,
-            "stats": self.stats,
-            "recommended_views": self.recommended_views,
+            "stats": self.select_stats(stat_names, compact=True),
+            "recommended_views": list(self.recommended_views),
         }
 
 
-def compute_summary(tensor: TrackedTensor) -> TensorSummary:
-    """Compute summary statistics for a tensor.
+# Precision and spectrum length of statistics exported to the frontend
+_EXPORT_DIGITS = 7
+_MAX_EXPORTED_SINGULAR_VALUES = 64
 
-    Args:
-        tensor: The tracked tensor to summarize.
 
-    Returns:
-        A TensorSummary with computed statistics.
-    """
+def _compact_stat(value: Any) -> Any:
+    """Round a statistic for export, truncating lists such as the spectrum."""
+    if isinstance(value, float):
+        return float(f"{value:.{_EXPORT_DIGITS}g}")
+    if isinstance(value, list):
+        return [_compact_stat(v) for v in value[:_MAX_EXPORTED_SINGULAR_VALUES]]
+    return value
+
+
+# Summaries keyed by tensor identity and the memory backing its data, so
+# repeated probe reads skip the matrix decompositions. A summary keeps its
+# tensor alive until all of its statistics are computed, so the cache is
+# also bounded by the bytes of data its entries were built from.
+_SUMMARY_CACHE_MAX = 1024
+_SUMMARY_CACHE_MAX_BYTES = 64 << 20
+# Cache key -> (summary, bytes of the summarized data)
+_summary_cache: dict[tuple[Any, ...], tuple[TensorSummary, int]] = {}
+
+
+def _summary_key(tensor: TrackedTensor) -> tuple[Any, ...]:
+    """Build the summary cache key for a tensor."""
     data = tensor.data
-    stats: dict[str, Any] = {}
+    return (
+        tensor.id,
+        data.__array_interface__["data"][0],
+        data.shape,
+        data.strides,
+        data.dtype.str,
+        tensor.name,
+        tensor.kind,
+        tensor.tags,
+    )
 
-    # Basic statistics
-    stats["min"] = float(np.min(data))
-    stats["max"] = float(np.max(data))
-    stats["mean"] = float(np.mean(data))
-    stats["std"] = float(np.std(data))
 
-    # Norm (Frobenius for matrices, L2 for vectors)
-    stats["norm"] = float(np.linalg.norm(data))
+def discard_summaries(tensor_ids: Iterable[str]) -> None:
+    """Drop cached summaries of the given tensors.
 
-    # Size information
-    stats["size"] = int(data.size)
-    stats["ndim"] = int(data.ndim)
+    Summaries of all other tensors, including those of other scenarios,
+    stay cached.
 
-    # Matrix-specific statistics
-    if tensor.kind == TensorKind.MATRIX and data.ndim == 2:
-        m, n = data.shape
+    Args:
+        tensor_ids: IDs of the tensors whose summaries are no longer needed.
+    """
+    drop = set(tensor_ids)
+    if drop:
+        for key in [key for key in _summary_cache if key[0] in drop]:
+            del _summary_cache[key]
 
-        # Rank (for reasonable-sized matrices)
-        if max(m, n) <= 1000:
-            stats["rank"] = int(np.linalg.matrix_rank(data))
 
-        # Condition number (for non-zero matrices)
-        if stats["norm"] > 1e-10:
-            try:
-                stats["condition_number"] = float(np.linalg.cond(data))
-            except np.linalg.LinAlgError:
-                stats["condition_number"] = float("inf")
-
-        # Check symmetry (for square matrices)
-        if m == n:
-            stats["is_symmetric"] = bool(np.allclose(data, data.T))
-
-            # Check positive definiteness (for symmetric matrices)
-            if stats.get("is_symmetric"):
-                try:
-                    eigvals = np.linalg.eigvalsh(data)
-                    stats["is_positive_definite"] = bool(np.all(eigvals > 0))
-                    stats["is_positive_semidefinite"] = bool(np.all(eigvals >= -1e-10))
-                    stats["min_eigenvalue"] = float(np.min(eigvals))
-                    stats["max_eigenvalue"] = float(np.max(eigvals))
-                except np.linalg.LinAlgError:
-                    pass
-
-        # Singular values (for reasonable-sized matrices)
-        if max(m, n) <= 500:
-            try:
-                singular_values = np.linalg.svd(data, compute_uv=False)
-                stats["singular_values"] = [float(s) for s in singular_values]
-                stats["max_singular_value"] = float(singular_values[0])
-                stats["min_singular_value"] = float(singular_values[-1])
-            except np.linalg.LinAlgError:
-                pass
+def compute_summary(
+    tensor: TrackedTensor,
+    full_spectrum: bool = False,
+) -> TensorSummary:
+    """Compute summary statistics for a tensor.
 
-    # Sparsity
-    zero_count = np.sum(np.abs(data) < 1e-10)
-    stats["sparsity"] = float(zero_count / data.size)
+    Summaries are cached per tensor ID and data buffer; arrays that are
+    modified in place must be given a new TrackedTensor to be re-summarized.
 
-    # Determine recommended views based on kind and tags
-    recommended_views = _get_recommended_views(tensor, stats)
+    Args:
+        tensor: The tracked tensor to summarize.
+        full_spectrum: If True, report all singular values of a matrix
+            regardless of its size.
+
+    Returns:
+        A TensorSummary with computed statistics.
+    """
+    key = (*_summary_key(tensor), full_spectrum)
+    cached = _summary_cache.get(key)
+    if cached is not None:
+        return cached[0]
+
+    summary = _compute_summary(tensor, full_spectrum)
+    nbytes = tensor.data.nbytes
+    # Evict the oldest entries until both bounds hold with the new one
+    held = nbytes + sum(size for _, size in _summary_cache.values())
+    while _summary_cache and (
+        len(_summary_cache) >= _SUMMARY_CACHE_MAX
+        or held > _SUMMARY_CACHE_MAX_BYTES
+    ):
+        held -= _summary_cache.pop(next(iter(_summary_cache)))[1]
+    _summary_cache[key] = (summary, nbytes)
+    return summary
+
+
+def _compute_summary(tensor: TrackedTensor, full_spectrum: bool) -> TensorSummary:
+    """Build a summary whose statistics are computed on first access."""
+    stats = _LazyStats(tensor, full_spectrum)
 
     return TensorSummary(
         id=tensor.id,
@@ -176,45 +337,360 @@ def compute_summary(tensor: TrackedTensor) -> TensorSummary:
         shape=tensor.shape,
         dtype=tensor.dtype,
         stats=stats,
-        recommended_views=recommended_views,
+        recommended_views=_LazyViews(tensor, stats, full_spectrum),
     )
 
 
-def _get_recommended_views(tensor: TrackedTensor, stats: dict[str, Any]) -> list[str]:
-    """Determine recommended visualization types for a tensor."""
-    views: list[str] = []
+# Statistic name -> group of statistics computed together, in the order the
+# statistics are reported
+_STAT_GROUPS: dict[str, str] = {
+    "min": "basic",
+    "max": "basic",
+    "mean": "basic",
+    "std": "basic",
+    "norm": "basic",
+    "size": "basic",
+    "ndim": "basic",
+    "rank": "spectral",
+    "condition_number": "spectral",
+    "is_symmetric": "symmetry",
+    "is_positive_definite": "symmetry",
+    "is_positive_semidefinite": "symmetry",
+    "min_eigenvalue": "symmetry",
+    "max_eigenvalue": "symmetry",
+    "singular_values": "spectral",
+    "max_singular_value": "spectral",
+    "min_singular_value": "spectral",
+    "sparsity": "basic",
+}
+
+
+class _LazyStats(Mapping[str, Any]):
+    """Read-only mapping of tensor statistics, computed group by group.
+
+    Reading a statistic computes only its group: elementwise statistics
+    are one pass over the data, while the spectral and symmetry groups run
+    matrix decompositions. Iterating computes every group.
+    """
 
-    if tensor.kind == TensorKind.VECTOR:
-        views.append("vector_stem")
-        if len(tensor.data) <= 50:
-            views.append("bar_chart")
+    __slots__ = ("_tensor", "_full_spectrum", "_values", "_done", "_singular_values")
+
+    def __init__(self, tensor: TrackedTensor, full_spectrum: bool) -> None:
+        self._tensor = tensor
+        self._full_spectrum = full_spectrum
+        self._values: dict[str, Any] = {}
+        self._done: set[str] = set()
+        self._singular_values: np.ndarray | None = None
+
+    def _ensure(self, group: str) -> None:
+        if group in self._done:
+            return
+        if group == "basic":
+            self._compute_basic()
+        elif group == "spectral":
+            self._compute_spectral()
+        else:
+            self._compute_symmetry()
+        self._done.add(group)
+        if len(self._done) == 3:
+            # Every statistic is known; let the tensor's data be freed
+            self._tensor = None
+
+    def _compute_basic(self) -> None:
+        data = self._tensor.data
+        # Basic statistics and norm (Frobenius for matrices, L2 for vectors),
+        # gathered in one sweep over the data
+        mn, mx, mean, std, norm, zero_count = basic_stats(data)
+        self._values.update(
+            min=mn,
+            max=mx,
+            mean=mean,
+            std=std,
+            norm=norm,
+            size=int(data.size),
+            ndim=int(data.ndim),
+            sparsity=float(zero_count / data.size),
+        )
+
+    def _compute_spectral(self) -> None:
+        data = self._tensor.data
+        if self._tensor.kind != TensorKind.MATRIX or data.ndim != 2:
+            return
+        m, n = data.shape
+        norm = self["norm"]
+        # The rank threshold follows the stored precision, not the working one
+        eps = np.finfo(data.dtype if data.dtype.kind in "fc" else np.float64).eps
+
+        # A single SVD feeds rank, conditioning and the reported spectrum
+        singular_values = None
+        if self._full_spectrum or max(m, n) <= 1000 or norm > 1e-10:
+            try:
+                singular_values = np.linalg.svd(_promoted(data), compute_uv=False)
+            except np.linalg.LinAlgError:
+                pass
+        self._singular_values = singular_values
+
+        # Rank (for reasonable-sized matrices), thresholding the singular
+        # values with matrix_rank's default tolerance
+        if max(m, n) <= 1000 and singular_values is not None:
+            tol = singular_values[0] * max(m, n) * eps
+            self._values["rank"] = int(np.count_nonzero(singular_values > tol))
+
+        # Condition number (for non-zero matrices); numerically singular
+        # matrices, whose smallest singular value is roundoff of the float64
+        # SVD, report inf. The stored precision's eps would cap float32
+        # matrices at a condition number of about 8e6.
+        if norm > 1e-10:
+            if singular_values is None or (
+                singular_values[-1]
+                <= singular_values[0] * np.finfo(singular_values.dtype).eps
+            ):
+                self._values["condition_number"] = float("inf")
+            else:
+                self._values["condition_number"] = float(
+                    singular_values[0] / singular_values[-1]
+                )
+
+        # Singular values (for reasonable-sized matrices unless requested)
+        if singular_values is not None and (
+            self._full_spectrum or max(m, n) <= 500
+        ):
+            self._values["singular_values"] = [float(s) for s in singular_values]
+            self._values["max_singular_value"] = float(singular_values[0])
+            self._values["min_singular_value"] = float(singular_values[-1])
+
+    def _compute_symmetry(self) -> None:
+        data = self._tensor.data
+        if self._tensor.kind != TensorKind.MATRIX or data.ndim != 2:
+            return
+        m, n = data.shape
+        if m != n:
+            return
+
+        # Check symmetry, then positive definiteness for symmetric matrices
+        self._values["is_symmetric"] = is_symmetric(data)
+        if self._values["is_symmetric"]:
+            self._ensure("spectral")
+            self._values.update(
+                _definiteness_stats(_promoted(data), self._singular_values)
+            )
+
+    def _all(self) -> dict[str, Any]:
+        for group in ("basic", "spectral", "symmetry"):
+            self._ensure(group)
+        return {key: self._values[key] for key in _STAT_GROUPS if key in self._values}
+
+    def __getitem__(self, key: str) -> Any:
+        group = _STAT_GROUPS.get(key)
+        if group is None:
+            raise KeyError(key)
+        self._ensure(group)
+        return self._values[key]
+
+    def __contains__(self, key: object) -> bool:
+        group = _STAT_GROUPS.get(key)  # type: ignore[call-overload]
+        if group is None:
+            return False
+        self._ensure(group)
+        return key in self._values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._all())
+
+    def __len__(self) -> int:
+        return len(self._all())
+
+    def __repr__(self) -> str:
+        return repr(self._all())
+
+
+class _LazyViews(Sequence[str]):
+    """Recommended views of a tensor, chosen on first access.
+
+    The eigenvalue view of a square matrix depends on its symmetry and
+    definiteness statistics, so choosing views eagerly would run the
+    matrix decompositions that _LazyStats defers.
+    """
+
+    __slots__ = ("_tensor", "_stats", "_full_spectrum", "_views")
+
+    def __init__(
+        self, tensor: TrackedTensor, stats: Mapping[str, Any], full_spectrum: bool
+    ) -> None:
+        self._tensor = tensor
+        self._stats = stats
+        self._full_spectrum = full_spectrum
+        self._views: list[str] | None = None
+
+    def _list(self) -> list[str]:
+        if self._views is None:
+            self._views = _get_recommended_views(
+                self._tensor, self._stats, self._full_spectrum
+            )
+            self._tensor = None
+            self._stats = None
+        return self._views
+
+    def __getitem__(self, index):  # type: ignore[override]
+        return self._list()[index]
+
+    def __len__(self) -> int:
+        return len(self._list())
+
+    def __eq__(self, other: object) -> bool:
+        return self._list() == other
+
+    def __repr__(self) -> str:
+        return repr(self._list())
 
-    elif tensor.kind == TensorKind.MATRIX:
-        views.append("heatmap")
 
-        # For 2x2 matrices, ellipse visualization is useful
-        if tensor.shape == (2, 2):
-            views.append("ellipse_2d")
+def _promoted(data: np.ndarray) -> np.ndarray:
+    """Return data in at least double precision for matrix factorizations."""
+    return data.astype(np.promote_types(data.dtype, np.float64), copy=False)
 
-        # If we have singular values, recommend that view
-        if "singular_values" in stats:
-            views.append("singular_values")
 
-        # For symmetric PSD matrices, eigenvalue view
-        if stats.get("is_symmetric") and stats.get("is_positive_semidefinite"):
-            views.append("eigenvalues")
+def _definiteness_stats(
+    data: np.ndarray,
+    singular_values: np.ndarray | None,
+) -> dict[str, Any]:
+    """Classify a symmetric matrix as positive (semi)definite.
 
-    elif tensor.kind == TensorKind.IMAGE:
-        views.append("image")
+    A successful Cholesky factorization proves positive definiteness, and
+    the eigenvalues of a positive definite matrix are its singular values,
+    so an eigensolver is only needed when the factorization fails.
 
-    elif tensor.kind == TensorKind.SPARSE_MATRIX:
-        views.append("sparsity_pattern")
-        views.append("heatmap")
+    Args:
+        data: A symmetric square matrix.
+        singular_values: Its singular values in descending order, if known.
+
+    Returns:
+        Definiteness flags and extreme eigenvalues, or an empty dict if the
+        eigendecomposition fails.
+    """
+    if singular_values is not None:
+        try:
+            np.linalg.cholesky(data)
+        except np.linalg.LinAlgError:
+            pass
+        else:
+            return {
+                "is_positive_definite": True,
+                "is_positive_semidefinite": True,
+                "min_eigenvalue": float(singular_values[-1]),
+                "max_eigenvalue": float(singular_values[0]),
+            }
+
+    try:
+        lo, hi = _extreme_eigenvalues(data, singular_values)
+    except np.linalg.LinAlgError:
+        return {}
+    # When Cholesky was attempted, its failure already rules out a positive
+    # definite matrix, whatever the roundoff in lo
+    return {
+        "is_positive_definite": singular_values is None and lo > 0,
+        "is_positive_semidefinite": lo >= -1e-10,
+        "min_eigenvalue": lo,
+        "max_eigenvalue": hi,
+    }
+
+
+def _extreme_eigenvalues(
+    data: np.ndarray,
+    singular_values: np.ndarray | None,
+) -> tuple[float, float]:
+    """Return the smallest and largest eigenvalues of a symmetric matrix.
+
+    With scipy installed, only the extreme eigenvalues are computed. The
+    largest eigenvalue magnitude equals the largest singular value, so
+    unless the smallest eigenvalue reaches -sigma_max, the largest
+    eigenvalue is sigma_max and needs no second solve.
+
+    Raises:
+        LinAlgError: If the eigensolver does not converge.
+    """
+    if scipy_linalg is None:
+        eigvals = np.linalg.eigvalsh(data)
+        return float(eigvals[0]), float(eigvals[-1])
+
+    n = data.shape[0]
+    lo = float(scipy_linalg.eigh(data, eigvals_only=True, subset_by_index=[0, 0])[0])
+    if singular_values is not None and lo > -singular_values[0] * (1 - 1e-8):
+        return lo, float(singular_values[0])
+    hi = scipy_linalg.eigh(data, eigvals_only=True, subset_by_index=[n - 1, n - 1])
+    return lo, float(hi[0])
+
+
+def _vector_views(
+    tensor: TrackedTensor, stats: Mapping[str, Any], full_spectrum: bool
+) -> list[str]:
+    views = ["vector_stem"]
+    if len(tensor.data) <= 50:
+        views.append("bar_chart")
+    return views
 
-    elif tensor.kind == TensorKind.POINTCLOUD:
-        if tensor.data.shape[-1] == 2:
-            views.append("scatter_2d")
-        elif tensor.data.shape[-1] == 3:
-            views.append("scatter_3d")
+
+def _matrix_views(
+    tensor: TrackedTensor, stats: Mapping[str, Any], full_spectrum: bool
+) -> list[str]:
+    views = ["heatmap"]
+
+    # For 2x2 matrices, ellipse visualization is useful
+    if tensor.shape == (2, 2):
+        views.append("ellipse_2d")
+
+    # If singular values are reported, recommend that view
+    if tensor.data.ndim == 2 and (full_spectrum or max(tensor.shape) <= 500):
+        views.append("singular_values")
+
+    # For symmetric PSD matrices, eigenvalue view
+    if stats.get("is_symmetric") and stats.get("is_positive_semidefinite"):
+        views.append("eigenvalues")
 
     return views
+
+
+def _image_views(
+    tensor: TrackedTensor, stats: Mapping[str, Any], full_spectrum: bool
+) -> list[str]:
+    return ["image"]
+
+
+def _sparse_matrix_views(
+    tensor: TrackedTensor, stats: Mapping[str, Any], full_spectrum: bool
+) -> list[str]:
+    return ["sparsity_pattern", "heatmap"]
+
+
+def _pointcloud_views(
+    tensor: TrackedTensor, stats: Mapping[str, Any], full_spectrum: bool
+) -> list[str]:
+    if tensor.data.shape[-1] == 2:
+        return ["scatter_2d"]
+    if tensor.data.shape[-1] == 3:
+        return ["scatter_3d"]
+    return []
+
+
+# TensorKind -> function choosing that kind's recommended views
+_VIEW_RULES: dict[
+    TensorKind, Callable[[TrackedTensor, Mapping[str, Any], bool], list[str]]
+] = {
+    TensorKind.VECTOR: _vector_views,
+    TensorKind.MATRIX: _matrix_views,
+    TensorKind.IMAGE: _image_views,
+    TensorKind.SPARSE_MATRIX: _sparse_matrix_views,
+    TensorKind.POINTCLOUD: _pointcloud_views,
+}
+
+
+def _get_recommended_views(
+    tensor: TrackedTensor,
+    stats: Mapping[str, Any],
+    full_spectrum: bool,
+) -> list[str]:
+    """Determine recommended visualization types for a tensor.
+
+    Only symmetric square matrices need decompositions here, to decide on
+    the eigenvalue view.
+    """
+    return _VIEW_RULES[tensor.kind](tensor, stats, full_spectrum)
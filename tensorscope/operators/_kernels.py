@@ -0,0 +1,93 @@
+"""Fallback kernels for operators.
+
+NumPy's matmul is only as fast as the BLAS it was built against. Builds
+linked to the unoptimized reference BLAS (or none) multiply matrices with
+a naive triple loop, so MatMul switches to the cache-blocked numba kernel
+below when it detects one. Unlike the summary kernels, this one is
+compiled lazily, since most installs never call it.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - exercised only without numba
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+# BLAS names reported by NumPy builds that use the reference implementation
+_REFERENCE_BLAS_NAMES = frozenset({"blas", "cblas", "netlib", "none"})
+
+# Tile edge length for the blocked matmul; tune to the cache size
+TILE_SIZE = int(os.environ.get("TENSORSCOPE_TILE", "64"))
+
+
+def has_optimized_blas() -> bool:
+    """Check whether NumPy was built against an optimized BLAS.
+
+    Returns:
+        False if NumPy reports no BLAS or the reference BLAS. True
+        otherwise, including on NumPy versions that cannot report it.
+    """
+    try:
+        config = np.show_config(mode="dicts")
+    except TypeError:  # NumPy < 1.25 can only print its configuration
+        return True
+    blas = (config or {}).get("Build Dependencies", {}).get("blas", {})
+    if not blas.get("found", True):
+        return False
+    return str(blas.get("name", "")).lower() not in _REFERENCE_BLAS_NAMES
+
+
+if HAVE_NUMBA:
+
+    @numba.njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def _tiled_matmul_kernel(a, b, c, tile):  # pragma: no cover - numba
+        # Row blocks run in parallel. Each output row is built one column
+        # tile at a time in a small accumulator that stays in cache while
+        # the matching tile of b is streamed row by row.
+        m, k_dim = a.shape
+        n = b.shape[1]
+        n_blocks = (m + tile - 1) // tile
+        for block in numba.prange(n_blocks):
+            i0 = block * tile
+            i1 = min(i0 + tile, m)
+            acc = np.empty(tile, dtype=c.dtype)
+            for j0 in range(0, n, tile):
+                width = min(tile, n - j0)
+                for i in range(i0, i1):
+                    acc[:width] = 0
+                    for k in range(k_dim):
+                        aik = a[i, k]
+                        for jj in range(width):
+                            acc[jj] += aik * b[k, j0 + jj]
+                    for jj in range(width):
+                        c[i, j0 + jj] = acc[jj]
+
+
+def tiled_matmul(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Multiply a matrix by a matrix or vector with the blocked kernel.
+
+    Args:
+        a: A 2D float32 or float64 array.
+        b: A 1D or 2D array of the same dtype with matching inner dimension.
+
+    Returns:
+        a @ b, up to floating-point summation order.
+    """
+    if b.shape[0] != a.shape[1]:
+        raise ValueError(
+            f"matmul: inner dimensions differ, got {a.shape} and {b.shape}"
+        )
+    vector = b.ndim == 1
+    b2 = b.reshape(-1, 1) if vector else b
+    c = np.empty((a.shape[0], b2.shape[1]), dtype=a.dtype)
+    _tiled_matmul_kernel(
+        np.ascontiguousarray(a), np.ascontiguousarray(b2), c, TILE_SIZE
+    )
+    return c.ravel() if vector else c
@@ -2,61 +2,169 @@
 
 from __future__ import annotations
 
+from typing import Any, Callable
+import weakref
+
 import numpy as np
 
+from ..core._stats_kernels import is_symmetric
 from ..core.operator import Operator, TensorSpec
 from ..core.tensor import TrackedTensor, TensorKind
+from ._kernels import HAVE_NUMBA, has_optimized_blas, tiled_matmul
+
+# NumPy linked against the reference BLAS multiplies with a naive triple
+# loop; the blocked numba kernel is much faster there
+_USE_TILED_MATMUL = HAVE_NUMBA and not has_optimized_blas()
+
+# Output tag sets shared by every result that carries them; tags are
+# immutable, so nothing is gained by building a fresh set per call
+_NO_TAGS: frozenset[str] = frozenset()
+_SYMMETRIC_TAGS = frozenset({"symmetric"})
+_GRAM_TAGS = frozenset({"symmetric", "psd"})
+_DEFINITE_TAGS = frozenset({"symmetric", "psd", "positive_definite"})
+_BATCHED_TAGS = frozenset({"batched"})
+_NORM_TAGS = frozenset({"scalar", "non_negative"})
+
+
+def _matmul(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Return a @ b, using the blocked kernel when BLAS is unoptimized."""
+    if (
+        _USE_TILED_MATMUL
+        and a.ndim == 2
+        and b.ndim in (1, 2)
+        and a.dtype == b.dtype
+        and a.dtype.char in "fd"
+    ):
+        return tiled_matmul(a, b)
+    # NumPy computes a product of an array with a transposed view of itself
+    # with syrk, at half the flops of gemm; a transpose that Transpose
+    # materialized is a separate buffer, so multiply by the view instead
+    if _is_transpose_of(a, b):
+        return b.T @ b
+    if _is_transpose_of(b, a):
+        return a @ a.T
+    return a @ b
+
+
+def _is_transpose_of(t: np.ndarray, data: np.ndarray) -> bool:
+    """Check whether t is the shared transpose of data made by _transpose()."""
+    ref = _transposes.get(id(data))
+    return ref is not None and ref() is t
+
+
+def _is_gram_pair(A: TrackedTensor, B: TrackedTensor) -> bool:
+    """Check whether A @ B has the form X^T X, e.g. A^T A or A A^T."""
+    if A.data.ndim != 2 or A.shape != B.shape[::-1]:
+        return False
+    if _is_transpose_of(A.data, B.data) or _is_transpose_of(B.data, A.data):
+        return True
+    return bool(np.array_equal(A.data, B.data.T))
+
+
+def _is_symmetric_sum(
+    A: TrackedTensor, B: TrackedTensor, result: np.ndarray
+) -> bool:
+    """Check whether a sum or difference of A and B is a symmetric matrix.
+
+    Sums of inputs tagged symmetric are symmetric by construction; other
+    square results are compared against their transpose, stopping at the
+    first mismatch.
+    """
+    if result.ndim != 2 or result.shape[0] != result.shape[1]:
+        return False
+    if "symmetric" in A.tags and "symmetric" in B.tags:
+        return True
+    return is_symmetric(result)
+
+
+def _gemm_update(
+    product: np.ndarray,
+    alpha: float,
+    beta: float,
+    Y: TrackedTensor | None,
+) -> np.ndarray:
+    """Return alpha * product + beta * Y, reusing the product's buffer.
+
+    The product is a fresh array, so it is scaled and accumulated in place
+    unless the result needs a wider dtype.
+    """
+    dtype = np.result_type(product, alpha)
+    if Y is not None:
+        dtype = np.result_type(dtype, Y.data, beta)
+    result = product if product.dtype == dtype else product.astype(dtype)
+    if alpha != 1.0:
+        result *= alpha
+    if Y is not None and beta != 0.0:
+        if beta == 1.0:
+            result += Y.data
+        else:
+            result += beta * Y.data
+    return result
 
 
 class MatMul(Operator):
     """Matrix multiplication operator.
 
     Computes A @ B where A and B are matrices (or matrix-vector products).
+    A may be a stack of matrices, in which case the product broadcasts
+    over its leading dimensions.
+    With the optional input Y connected, computes alpha * A @ B + beta * Y
+    in the product's buffer, as in a BLAS gemm update.
     """
 
-    @property
-    def name(self) -> str:
-        return "MatMul"
-
-    @property
-    def description(self) -> str:
-        return "Matrix multiplication: C = A @ B"
-
-    @property
-    def tags(self) -> frozenset[str]:
-        return frozenset({"linear", "deterministic", "differentiable"})
-
-    @property
-    def input_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "A": TensorSpec(
-                name="A",
-                kind=TensorKind.MATRIX,
-                shape=(-1, -1),
-                description="Left matrix",
-            ),
-            "B": TensorSpec(
-                name="B",
-                description="Right matrix or vector",
-            ),
-        }
+    __slots__ = ("_alpha", "_beta")
+
+    _NAME = "MatMul"
+    _DESCRIPTION = "Matrix multiplication: C = A @ B"
+    _TAGS = frozenset({"linear", "deterministic", "differentiable"})
+
+    _INPUT_SPECS = {
+        "A": TensorSpec(
+            name="A",
+            kind=TensorKind.MATRIX,
+            shape=(-1, -1),
+            description="Left matrix or stack of matrices",
+            batched=True,
+        ),
+        "B": TensorSpec(
+            name="B",
+            description="Right matrix or vector",
+        ),
+        "Y": TensorSpec(
+            name="Y",
+            optional=True,
+            description="Optional addend, scaled by beta",
+        ),
+    }
+
+    _OUTPUT_SPECS = {
+        "C": TensorSpec(
+            name="C",
+            description="Result of alpha * A @ B + beta * Y",
+        ),
+    }
+
+    def __init__(self, alpha: float = 1.0, beta: float = 1.0):
+        """Initialize with the scale factors of the update.
 
-    @property
-    def output_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "C": TensorSpec(
-                name="C",
-                description="Result of A @ B",
-            ),
-        }
+        Args:
+            alpha: Multiplier of the product A @ B.
+            beta: Multiplier of the addend Y, if connected.
+        """
+        self._alpha = alpha
+        self._beta = beta
 
-    def forward(
-        self, inputs: dict[str, TrackedTensor]
+    def _forward_fast(
+        self, A: TrackedTensor, B: TrackedTensor, Y: TrackedTensor | None = None
     ) -> dict[str, TrackedTensor]:
-        A = inputs["A"]
-        B = inputs["B"]
-
-        result = A.data @ B.data
+        result = _matmul(A.data, B.data)
+        name = f"{A.name}@{B.name}"
+        if self._alpha != 1.0 or Y is not None:
+            result = _gemm_update(result, self._alpha, self._beta, Y)
+            if self._alpha != 1.0:
+                name = f"{self._alpha}*{name}"
+            if Y is not None:
+                name = f"({name}+{self._beta}*{Y.name})"
 
         # Determine output kind
         if result.ndim == 1:
@@ -64,98 +172,157 @@ class MatMul(Operator):
         else:
             kind = TensorKind.MATRIX
 
-        # Determine output tags
-        tags: set[str] = set()
-
-        # Check if result is symmetric (only for square matrices)
-        if result.ndim == 2 and result.shape[0] == result.shape[1]:
-            if np.allclose(result, result.T):
-                tags.add("symmetric")
-                # Check positive definiteness
+        # Determine output tags; stacked products broadcast over the batch
+        # dimensions and are not checked for symmetry
+        batched = A.data.ndim > 2 or B.data.ndim > 2
+        tags = _BATCHED_TAGS if batched else _NO_TAGS
+
+        # Only products of a matrix with its own transpose, or of symmetric
+        # inputs, can be symmetric; skip the check for everything else.
+        # X^T X is symmetric PSD by construction, while a product of
+        # symmetric matrices is symmetric only when they commute.
+        if not batched and result.ndim == 2 and result.shape[0] == result.shape[1]:
+            if Y is not None or self._alpha <= 0:
+                # The structural rules below only hold for A @ B itself
+                if is_symmetric(result):
+                    tags = _SYMMETRIC_TAGS
+            elif _is_gram_pair(A, B):
+                tags = _GRAM_TAGS
+            elif (
+                "symmetric" in A.tags
+                and "symmetric" in B.tags
+                and is_symmetric(result)
+            ):
+                tags = _SYMMETRIC_TAGS
+            if tags:
+                # A successful Cholesky factorization proves definiteness
                 try:
-                    eigvals = np.linalg.eigvalsh(result)
-                    if np.all(eigvals > 0):
-                        tags.add("psd")
-                        tags.add("positive_definite")
-                    elif np.all(eigvals >= -1e-10):
-                        tags.add("psd")
+                    np.linalg.cholesky(result)
                 except np.linalg.LinAlgError:
                     pass
+                else:
+                    tags = _DEFINITE_TAGS
 
         return {
             "C": TrackedTensor(
                 data=result,
-                name=f"{A.name}@{B.name}",
+                name=name,
                 kind=kind,
-                tags=frozenset(tags),
+                tags=tags,
             )
         }
 
 
-class Transpose(Operator):
-    """Matrix transpose operator.
+# Read-only transposes by id() of the source array. Entries hold neither
+# array alive and are dropped when the source is collected, before its id
+# can be reused.
+_transposes: dict[int, weakref.ref[np.ndarray]] = {}
 
-    Computes A^T for a matrix A.
-    """
 
-    @property
-    def name(self) -> str:
-        return "Transpose"
+def _transpose(data: np.ndarray) -> np.ndarray:
+    """Return a read-only, C-contiguous transpose of data.
 
-    @property
-    def description(self) -> str:
-        return "Matrix transpose: B = A^T"
-
-    @property
-    def tags(self) -> frozenset[str]:
-        return frozenset({"linear", "deterministic", "differentiable"})
-
-    @property
-    def input_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "A": TensorSpec(
-                name="A",
-                kind=TensorKind.MATRIX,
-                shape=(-1, -1),
-                description="Input matrix",
-            ),
-        }
+    Tensor data is immutable, so a transpose materialized once is shared by
+    every later transpose of the same array while it is still alive.
+    """
+    key = id(data)
+    ref = _transposes.get(key)
+    result = ref() if ref is not None else None
+    if result is None:
+        result = np.ascontiguousarray(data.T)
+        result.flags.writeable = False
+        if key not in _transposes:
+            weakref.finalize(data, _transposes.pop, key, None)
+        _transposes[key] = weakref.ref(result)
+    return result
 
-    @property
-    def output_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "At": TensorSpec(
-                name="At",
-                kind=TensorKind.MATRIX,
-                description="Transposed matrix",
-            ),
-        }
 
-    def forward(
-        self, inputs: dict[str, TrackedTensor]
-    ) -> dict[str, TrackedTensor]:
-        A = inputs["A"]
-        result = A.data.T
+class Transpose(Operator):
+    """Matrix transpose operator.
 
-        # Preserve symmetry tag if present
-        tags = set(A.tags)
+    Computes A^T for a matrix A.
+    """
 
+    __slots__ = ()
+
+    _NAME = "Transpose"
+    _DESCRIPTION = "Matrix transpose: B = A^T"
+    _TAGS = frozenset({"linear", "deterministic", "differentiable"})
+
+    _INPUT_SPECS = {
+        "A": TensorSpec(
+            name="A",
+            kind=TensorKind.MATRIX,
+            shape=(-1, -1),
+            description="Input matrix",
+        ),
+    }
+
+    _OUTPUT_SPECS = {
+        "At": TensorSpec(
+            name="At",
+            kind=TensorKind.MATRIX,
+            description="Transposed matrix",
+        ),
+    }
+
+    def _forward_fast(self, A: TrackedTensor) -> dict[str, TrackedTensor]:
+        result = _transpose(A.data)
+
+        # Preserve tags; the frozenset is shared, not copied
         return {
             "At": TrackedTensor(
                 data=result,
                 name=f"{A.name}^T",
                 kind=TensorKind.MATRIX,
-                tags=frozenset(tags),
+                tags=A.tags,
             )
         }
 
 
+# Norm names accepted by Norm, mapped to np.linalg.norm orders
+_NORM_ORDS: dict[str, Any] = {
+    "fro": "fro",
+    "l1": 1,
+    "l2": 2,
+    "linf": np.inf,
+    "nuc": "nuc",
+}
+
+# Display names of the norms, for Norm.description
+_NORM_NAMES: dict[str, str] = {
+    "fro": "Frobenius",
+    "l1": "L1",
+    "l2": "L2 (spectral)",
+    "linf": "L-infinity",
+    "nuc": "Nuclear",
+}
+
+
 class Norm(Operator):
     """Norm computation operator.
 
     Computes various norms: Frobenius (default), L1, L2, Linf.
     """
 
+    __slots__ = ("_ord", "_numpy_ord")
+
+    _TAGS = frozenset({"deterministic"})
+
+    _INPUT_SPECS = {
+        "A": TensorSpec(
+            name="A",
+            description="Input tensor",
+        ),
+    }
+
+    _OUTPUT_SPECS = {
+        "norm": TensorSpec(
+            name="norm",
+            description="Computed norm (scalar)",
+        ),
+    }
+
     def __init__(self, ord: str = "fro"):
         """Initialize with norm type.
 
@@ -163,6 +330,7 @@ class Norm(Operator):
             ord: Norm type. One of 'fro', 'l1', 'l2', 'linf', 'nuc'.
         """
         self._ord = ord
+        self._numpy_ord = _NORM_ORDS.get(ord, "fro")
 
     @property
     def name(self) -> str:
@@ -170,59 +338,28 @@ class Norm(Operator):
 
     @property
     def description(self) -> str:
-        norm_names = {
-            "fro": "Frobenius",
-            "l1": "L1",
-            "l2": "L2 (spectral)",
-            "linf": "L-infinity",
-            "nuc": "Nuclear",
-        }
-        return f"{norm_names.get(self._ord, self._ord)} norm"
-
-    @property
-    def tags(self) -> frozenset[str]:
-        return frozenset({"deterministic"})
-
-    @property
-    def input_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "A": TensorSpec(
-                name="A",
-                description="Input tensor",
-            ),
-        }
-
-    @property
-    def output_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "norm": TensorSpec(
-                name="norm",
-                description="Computed norm (scalar)",
-            ),
-        }
-
-    def forward(
-        self, inputs: dict[str, TrackedTensor]
-    ) -> dict[str, TrackedTensor]:
-        A = inputs["A"]
-
-        ord_map = {
-            "fro": "fro",
-            "l1": 1,
-            "l2": 2,
-            "linf": np.inf,
-            "nuc": "nuc",
-        }
-        numpy_ord = ord_map.get(self._ord, "fro")
-
-        norm_value = np.linalg.norm(A.data, ord=numpy_ord)
+        return f"{_NORM_NAMES.get(self._ord, self._ord)} norm"
+
+    def _forward_fast(self, A: TrackedTensor) -> dict[str, TrackedTensor]:
+        numpy_ord = self._numpy_ord
+
+        if numpy_ord == "fro" or (numpy_ord == 2 and A.data.ndim == 1):
+            # Euclidean norm of the flattened data as one BLAS dot product.
+            # vdot accumulates in the input dtype, so other data is cast to
+            # float64 first, as np.linalg.norm does
+            flat = A.data.reshape(-1)
+            if flat.dtype.kind not in "fc":
+                flat = flat.astype(np.float64)
+            norm_value = np.sqrt(np.vdot(flat, flat).real)
+        else:
+            norm_value = np.linalg.norm(A.data, ord=numpy_ord)
 
         return {
             "norm": TrackedTensor(
                 data=np.array(norm_value),
                 name=f"||{A.name}||_{self._ord}",
                 kind=TensorKind.VECTOR,  # Scalar treated as 0-d vector
-                tags=frozenset({"scalar", "non_negative"}),
+                tags=_NORM_TAGS,
             )
         }
 
@@ -233,37 +370,24 @@ class Add(Operator):
     Computes A + B with broadcasting support.
     """
 
-    @property
-    def name(self) -> str:
-        return "Add"
-
-    @property
-    def description(self) -> str:
-        return "Element-wise addition: C = A + B"
+    __slots__ = ()
 
-    @property
-    def tags(self) -> frozenset[str]:
-        return frozenset({"linear", "deterministic", "differentiable"})
+    _NAME = "Add"
+    _DESCRIPTION = "Element-wise addition: C = A + B"
+    _TAGS = frozenset({"linear", "deterministic", "differentiable"})
 
-    @property
-    def input_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "A": TensorSpec(name="A", description="First operand"),
-            "B": TensorSpec(name="B", description="Second operand"),
-        }
+    _INPUT_SPECS = {
+        "A": TensorSpec(name="A", description="First operand"),
+        "B": TensorSpec(name="B", description="Second operand"),
+    }
 
-    @property
-    def output_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "C": TensorSpec(name="C", description="Sum A + B"),
-        }
+    _OUTPUT_SPECS = {
+        "C": TensorSpec(name="C", description="Sum A + B"),
+    }
 
-    def forward(
-        self, inputs: dict[str, TrackedTensor]
+    def _forward_fast(
+        self, A: TrackedTensor, B: TrackedTensor
     ) -> dict[str, TrackedTensor]:
-        A = inputs["A"]
-        B = inputs["B"]
-
         result = A.data + B.data
 
         # Determine output kind
@@ -275,17 +399,14 @@ class Add(Operator):
             kind = A.kind  # Preserve input kind for higher dimensions
 
         # Determine tags
-        tags: set[str] = set()
-        if result.ndim == 2 and result.shape[0] == result.shape[1]:
-            if np.allclose(result, result.T):
-                tags.add("symmetric")
+        symmetric = _is_symmetric_sum(A, B, result)
 
         return {
             "C": TrackedTensor(
                 data=result,
                 name=f"({A.name}+{B.name})",
                 kind=kind,
-                tags=frozenset(tags),
+                tags=_SYMMETRIC_TAGS if symmetric else _NO_TAGS,
             )
         }
 
@@ -296,37 +417,24 @@ class Subtract(Operator):
     Computes A - B with broadcasting support.
     """
 
-    @property
-    def name(self) -> str:
-        return "Subtract"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return "Element-wise subtraction: C = A - B"
+    _NAME = "Subtract"
+    _DESCRIPTION = "Element-wise subtraction: C = A - B"
+    _TAGS = frozenset({"linear", "deterministic", "differentiable"})
 
-    @property
-    def tags(self) -> frozenset[str]:
-        return frozenset({"linear", "deterministic", "differentiable"})
-
-    @property
-    def input_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "A": TensorSpec(name="A", description="First operand (minuend)"),
-            "B": TensorSpec(name="B", description="Second operand (subtrahend)"),
-        }
+    _INPUT_SPECS = {
+        "A": TensorSpec(name="A", description="First operand (minuend)"),
+        "B": TensorSpec(name="B", description="Second operand (subtrahend)"),
+    }
 
-    @property
-    def output_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "C": TensorSpec(name="C", description="Difference A - B"),
-        }
+    _OUTPUT_SPECS = {
+        "C": TensorSpec(name="C", description="Difference A - B"),
+    }
 
-    def forward(
-        self, inputs: dict[str, TrackedTensor]
+    def _forward_fast(
+        self, A: TrackedTensor, B: TrackedTensor
     ) -> dict[str, TrackedTensor]:
-        A = inputs["A"]
-        B = inputs["B"]
-
         result = A.data - B.data
 
         # Determine output kind
@@ -338,27 +446,48 @@ class Subtract(Operator):
             kind = A.kind
 
         # Determine tags
-        tags: set[str] = set()
-        if result.ndim == 2 and result.shape[0] == result.shape[1]:
-            if np.allclose(result, result.T):
-                tags.add("symmetric")
+        symmetric = _is_symmetric_sum(A, B, result)
 
         return {
             "C": TrackedTensor(
                 data=result,
                 name=f"({A.name}-{B.name})",
                 kind=kind,
-                tags=frozenset(tags),
+                tags=_SYMMETRIC_TAGS if symmetric else _NO_TAGS,
             )
         }
 
 
+def _share(data: np.ndarray) -> np.ndarray:
+    """Return tensor data unchanged; it is read-only, so it can be shared."""
+    return data
+
+
+# Exact shortcuts for floating-point data, by scale factor
+_SCALE_KERNELS: dict[float, Callable[[np.ndarray], np.ndarray]] = {
+    1.0: _share,
+    -1.0: np.negative,
+}
+
+
 class Scale(Operator):
     """Scalar multiplication operator.
 
     Computes alpha * A where alpha is a scalar.
     """
 
+    __slots__ = ("_alpha", "_kernel")
+
+    _TAGS = frozenset({"linear", "deterministic", "differentiable"})
+
+    _INPUT_SPECS = {
+        "A": TensorSpec(name="A", description="Input tensor"),
+    }
+
+    _OUTPUT_SPECS = {
+        "B": TensorSpec(name="B", description="Scaled tensor"),
+    }
+
     def __init__(self, alpha: float = 1.0):
         """Initialize with scale factor.
 
@@ -366,6 +495,7 @@ class Scale(Operator):
             alpha: The scalar multiplier.
         """
         self._alpha = alpha
+        self._kernel = _SCALE_KERNELS.get(alpha)
 
     @property
     def name(self) -> str:
@@ -375,45 +505,27 @@ class Scale(Operator):
     def description(self) -> str:
         return f"Scalar multiplication: B = {self._alpha} * A"
 
-    @property
-    def tags(self) -> frozenset[str]:
-        return frozenset({"linear", "deterministic", "differentiable"})
-
-    @property
-    def input_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "A": TensorSpec(name="A", description="Input tensor"),
-        }
-
-    @property
-    def output_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "B": TensorSpec(name="B", description="Scaled tensor"),
-        }
-
-    def forward(
-        self, inputs: dict[str, TrackedTensor]
-    ) -> dict[str, TrackedTensor]:
-        A = inputs["A"]
-        result = self._alpha * A.data
+    def _forward_fast(self, A: TrackedTensor) -> dict[str, TrackedTensor]:
+        if self._kernel is not None and A.data.dtype.kind in "fc":
+            result = self._kernel(A.data)
+        else:
+            result = self._alpha * A.data
 
         # Preserve tags (scaling preserves symmetry, etc.)
-        tags = set(A.tags)
+        tags = A.tags
 
         # Scaling by negative flips positive definiteness
         if self._alpha < 0:
             if "positive_definite" in tags:
-                tags.discard("positive_definite")
-                tags.add("negative_definite")
+                tags = tags - {"positive_definite"} | {"negative_definite"}
             elif "negative_definite" in tags:
-                tags.discard("negative_definite")
-                tags.add("positive_definite")
+                tags = tags - {"negative_definite"} | {"positive_definite"}
 
         return {
             "B": TrackedTensor(
                 data=result,
                 name=f"{self._alpha}*{A.name}",
                 kind=A.kind,
-                tags=frozenset(tags),
+                tags=tags,
             )
         }
@@ -2,10 +2,100 @@
 
 from __future__ import annotations
 
+import weakref
+from collections import OrderedDict
+from types import MappingProxyType
+
 import numpy as np
 
+try:
+    from scipy.linalg import solve_triangular
+    from scipy.linalg.blas import get_blas_funcs
+    from scipy.linalg.lapack import get_lapack_funcs
+except ImportError:  # pragma: no cover - exercised only without scipy
+    solve_triangular = None
+    get_blas_funcs = None
+    get_lapack_funcs = None
+
 from ..core.operator import Operator, TensorSpec
-from ..core.tensor import TrackedTensor, TensorKind
+from ..core.tensor import TensorKind, TrackedTensor, _data_digest
+
+# Output tag sets shared by every result that carries them; tags are
+# immutable, so nothing is gained by building a fresh set per call
+_NO_TAGS: frozenset[str] = frozenset()
+_LS_TAGS = frozenset({"least_squares_solution"})
+_EXACT_LS_TAGS = frozenset({"least_squares_solution", "exact_solution"})
+_EXACT_TAGS = frozenset({"exact_solution"})
+_RESIDUAL_TAGS = frozenset({"residual"})
+_NORM_TAGS = frozenset({"scalar", "non_negative"})
+_NORMAL_MATRIX_TAGS = frozenset({"symmetric", "psd", "normal_matrix"})
+_DEFINITE_NORMAL_MATRIX_TAGS = _NORMAL_MATRIX_TAGS | {"positive_definite"}
+_PINV_TAGS = frozenset({"pseudoinverse"})
+# Smallest eigenvalue of A^T A for it to be tagged positive definite
+_DEFINITE_EIGVAL_TOL = 1e-10
+# Inverse tags by whether A is tagged (symmetric, positive_definite)
+_INVERSE_TAGS = {
+    (False, False): frozenset({"inverse"}),
+    (True, False): frozenset({"inverse", "symmetric"}),
+    (False, True): frozenset({"inverse", "positive_definite"}),
+    (True, True): frozenset({"inverse", "symmetric", "positive_definite"}),
+}
+
+
+def _lstsq(data: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Return argmin_x ||data @ x - rhs||, via QR when data has full rank.
+
+    np.linalg.lstsq always runs the SVD-based gelsd. For a tall or square
+    matrix of full column rank the QR-based gels gives the same solution
+    several times faster. It is applied to the Fortran-ordered transpose
+    with trans="T", which factors data^T = L Q instead; diag(L) equals
+    diag(R) of data up to sign. Rank-deficient, nearly rank-deficient and
+    underdetermined systems still go through lstsq, which truncates small
+    singular values.
+    """
+    m, n = data.shape
+    if (
+        get_lapack_funcs is None
+        or data.dtype.char not in "fd"
+        or rhs.ndim != 1
+        or not np.can_cast(rhs.dtype, data.dtype)
+        or m < n
+        or n == 0
+    ):
+        return np.linalg.lstsq(data, rhs, rcond=None)[0]
+    (gels,) = get_lapack_funcs(("gels",), (data,))
+    lq, x, info = gels(data.T, rhs.astype(data.dtype), trans="T")
+    if info < 0:
+        raise ValueError(f"Illegal value in argument {-info} of gels")
+    # Without pivoting, diag(R) only bounds the condition number from
+    # below, so stay well clear of lstsq's max(m, n) * eps cutoff.
+    diag = np.abs(np.diagonal(lq))
+    if info > 0 or diag.min() <= np.sqrt(np.finfo(data.dtype).eps) * diag.max():
+        return np.linalg.lstsq(data, rhs, rcond=None)[0]
+    return x[:n]
+
+
+def _residual(
+    data: np.ndarray, x: np.ndarray, rhs: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return rhs - data @ x and its L2 norm.
+
+    For real vectors of one dtype, BLAS gemv writes -data @ x + rhs into a
+    copy of rhs in one pass, without the temporary for data @ x, and nrm2
+    takes the norm. gemv reads the Fortran-ordered data^T with trans=1.
+    """
+    if (
+        get_blas_funcs is None
+        or data.dtype.char not in "fd"
+        or x.dtype != data.dtype
+        or rhs.dtype != data.dtype
+        or rhs.ndim != 1
+    ):
+        residual = rhs - data @ x
+        return residual, np.array(np.linalg.norm(residual))
+    gemv, nrm2 = get_blas_funcs(("gemv", "nrm2"), (data,))
+    residual = gemv(-1.0, data.T, x, beta=1.0, y=rhs.copy(), trans=1, overwrite_y=1)
+    return residual, np.array(nrm2(residual), dtype=data.dtype)
 
 
 class LeastSquares(Operator):
@@ -18,159 +108,291 @@ class LeastSquares(Operator):
     this finds the minimum norm solution.
     """
 
-    @property
-    def name(self) -> str:
-        return "LeastSquares"
-
-    @property
-    def description(self) -> str:
-        return "Least squares solver: x = argmin ||Ax - b||"
-
-    @property
-    def tags(self) -> frozenset[str]:
-        return frozenset({"deterministic", "solver"})
-
-    @property
-    def input_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "A": TensorSpec(
-                name="A",
-                kind=TensorKind.MATRIX,
-                shape=(-1, -1),
-                description="Coefficient matrix (m x n)",
-            ),
-            "b": TensorSpec(
-                name="b",
-                kind=TensorKind.VECTOR,
-                description="Right-hand side vector (m,)",
-            ),
-        }
-
-    @property
-    def output_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "x": TensorSpec(
-                name="x",
-                kind=TensorKind.VECTOR,
-                description="Solution vector (n,)",
-            ),
-            "residual": TensorSpec(
-                name="residual",
-                kind=TensorKind.VECTOR,
-                description="Residual vector b - Ax",
-            ),
-            "residual_norm": TensorSpec(
-                name="residual_norm",
-                description="L2 norm of residual",
-            ),
-        }
-
-    def forward(
-        self, inputs: dict[str, TrackedTensor]
+    __slots__ = ()
+
+    _NAME = "LeastSquares"
+    _DESCRIPTION = "Least squares solver: x = argmin ||Ax - b||"
+    _TAGS = frozenset({"deterministic", "solver"})
+
+    _INPUT_SPECS = {
+        "A": TensorSpec(
+            name="A",
+            kind=TensorKind.MATRIX,
+            shape=(-1, -1),
+            description="Coefficient matrix (m x n)",
+        ),
+        "b": TensorSpec(
+            name="b",
+            kind=TensorKind.VECTOR,
+            description="Right-hand side vector (m,)",
+        ),
+    }
+
+    _OUTPUT_SPECS = {
+        "x": TensorSpec(
+            name="x",
+            kind=TensorKind.VECTOR,
+            description="Solution vector (n,)",
+        ),
+        "residual": TensorSpec(
+            name="residual",
+            kind=TensorKind.VECTOR,
+            description="Residual vector b - Ax",
+        ),
+        "residual_norm": TensorSpec(
+            name="residual_norm",
+            description="L2 norm of residual",
+        ),
+    }
+
+    def _forward_fast(
+        self, A: TrackedTensor, b: TrackedTensor
     ) -> dict[str, TrackedTensor]:
-        A = inputs["A"]
-        b = inputs["b"]
+        x = _lstsq(A.data, b.data)
 
-        # Use lstsq for robust least squares solution
-        x, residuals, rank, s = np.linalg.lstsq(A.data, b.data, rcond=None)
-
-        # Compute residual vector
-        residual = b.data - A.data @ x
-        residual_norm = np.linalg.norm(residual)
+        residual, residual_norm = _residual(A.data, x, b.data)
 
         # Tags for solution
-        x_tags: set[str] = {"least_squares_solution"}
-        if A.data.shape[0] == A.data.shape[1]:
-            x_tags.add("exact_solution")
+        x_tags = _EXACT_LS_TAGS if A.data.shape[0] == A.data.shape[1] else _LS_TAGS
 
         return {
             "x": TrackedTensor(
                 data=x,
                 name=f"x*({A.name},{b.name})",
                 kind=TensorKind.VECTOR,
-                tags=frozenset(x_tags),
+                tags=x_tags,
             ),
             "residual": TrackedTensor(
                 data=residual,
                 name=f"r({A.name},{b.name})",
                 kind=TensorKind.VECTOR,
-                tags=frozenset({"residual"}),
+                tags=_RESIDUAL_TAGS,
             ),
             "residual_norm": TrackedTensor(
-                data=np.array(residual_norm),
+                data=residual_norm,
                 name=f"||r||",
                 kind=TensorKind.VECTOR,
-                tags=frozenset({"scalar", "non_negative"}),
+                tags=_NORM_TAGS,
             ),
         }
 
 
-class LinearSolve(Operator):
-    """Direct linear system solver for square systems.
-
-    Solves Ax = b where A is a square invertible matrix.
-    Uses LU decomposition internally.
+# Matrix factorizations by (LAPACK routine, id() of the factored array),
+# most recently used last, each with a digest of the contents it was
+# computed from. Entries are dropped when the array is collected, before
+# its id can be reused.
+_factorizations: OrderedDict[
+    tuple[str, int], tuple[int, tuple[np.ndarray, ...]]
+] = OrderedDict()
+_MAX_FACTORIZATIONS = 8
+
+
+def _cached_factors(
+    routine: str, data: np.ndarray, digest: int
+) -> tuple[np.ndarray, ...] | None:
+    """Return the cached factorization of data by routine, if still current."""
+    key = (routine, id(data))
+    entry = _factorizations.get(key)
+    if entry is None or entry[0] != digest:
+        return None
+    _factorizations.move_to_end(key)
+    return entry[1]
+
+
+def _cache_factors(
+    routine: str, data: np.ndarray, digest: int, factors: tuple[np.ndarray, ...]
+) -> None:
+    """Cache the factorization of data by routine while data is alive."""
+    key = (routine, id(data))
+    if key not in _factorizations:
+        weakref.finalize(data, _factorizations.pop, key, None)
+    _factorizations[key] = (digest, factors)
+    _factorizations.move_to_end(key)
+    if len(_factorizations) > _MAX_FACTORIZATIONS:
+        _factorizations.popitem(last=False)
+
+
+def _lu_factor(data: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Return the cached LU factorization (lu, piv) of data^T.
+
+    The factorization of an array serves every later solve against it
+    while it is alive, e.g. when only the right-hand side of a scenario
+    changes. Tensor data is read-only but may be a view of an array its
+    owner still writes to, so the cached factors are reused only while a
+    digest of the contents matches. The transpose of the C-ordered data is
+    Fortran-ordered, so it is factored without reordering; callers apply
+    it with trans=1 or transpose the result.
+
+    Raises:
+        LinAlgError: If the matrix is singular.
     """
+    digest = _data_digest(data)
+    factors = _cached_factors("getrf", data, digest)
+    if factors is not None:
+        return factors
+    (getrf,) = get_lapack_funcs(("getrf",), (data,))
+    lu, piv, info = getrf(data.T, overwrite_a=False)
+    if info > 0:
+        raise np.linalg.LinAlgError("Singular matrix")
+    if info < 0:
+        raise ValueError(f"Illegal value in argument {-info} of getrf")
+    factors = (lu, piv)
+    _cache_factors("getrf", data, digest, factors)
+    return factors
+
+
+def _cho_factor(data: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Return the cached Cholesky factor (c,) of real symmetric data.
+
+    potrf reads the upper triangle of the Fortran-ordered data^T, i.e.
+    the lower triangle of data, which equals data^T for symmetric data.
+
+    Raises:
+        LinAlgError: If the matrix is not positive definite.
+    """
+    digest = _data_digest(data)
+    factors = _cached_factors("potrf", data, digest)
+    if factors is not None:
+        return factors
+    (potrf,) = get_lapack_funcs(("potrf",), (data,))
+    c, info = potrf(data.T, lower=0, overwrite_a=False, clean=0)
+    if info > 0:
+        raise np.linalg.LinAlgError("Matrix is not positive definite")
+    if info < 0:
+        raise ValueError(f"Illegal value in argument {-info} of potrf")
+    factors = (c,)
+    _cache_factors("potrf", data, digest, factors)
+    return factors
+
+
+def _has_lapack_lu(data: np.ndarray) -> bool:
+    """Check whether data can be factored with the cached LAPACK LU."""
+    return get_lapack_funcs is not None and data.dtype.char in "fdFD"
+
+
+def _lu_solve(data: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Solve data @ x = rhs, reusing the LU factorization of data.
+
+    A repeated solve against the same array costs an O(n^2) getrs instead
+    of an O(n^3) getrf.
+
+    Raises:
+        LinAlgError: If the matrix is singular.
+    """
+    if not _has_lapack_lu(data) or not np.can_cast(rhs.dtype, data.dtype):
+        return np.linalg.solve(data, rhs)
+    factors = _lu_factor(data)
+    (getrs,) = get_lapack_funcs(("getrs",), (data,))
+    x, info = getrs(*factors, rhs.astype(data.dtype, copy=False), trans=1)
+    if info < 0:
+        raise ValueError(f"Illegal value in argument {-info} of getrs")
+    return x
 
-    @property
-    def name(self) -> str:
-        return "LinearSolve"
 
-    @property
-    def description(self) -> str:
-        return "Linear system solver: x = A^{-1}b (for square A)"
+def _cho_solve(data: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Solve data @ x = rhs for symmetric positive definite data.
 
-    @property
-    def tags(self) -> frozenset[str]:
-        return frozenset({"deterministic", "solver"})
+    Cholesky takes half the flops of LU, and its factor is cached like
+    the LU factorization. Falls back to the LU solve if the matrix turns
+    out not to be positive definite.
 
-    @property
-    def input_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "A": TensorSpec(
-                name="A",
-                kind=TensorKind.MATRIX,
-                shape=(-1, -1),
-                description="Square coefficient matrix (n x n)",
-            ),
-            "b": TensorSpec(
-                name="b",
-                kind=TensorKind.VECTOR,
-                description="Right-hand side vector (n,)",
-            ),
-        }
+    Raises:
+        LinAlgError: If the matrix is singular.
+    """
+    if (
+        get_lapack_funcs is None
+        or data.dtype.char not in "fd"
+        or not np.can_cast(rhs.dtype, data.dtype)
+    ):
+        return _lu_solve(data, rhs)
+    try:
+        (c,) = _cho_factor(data)
+    except np.linalg.LinAlgError:
+        return _lu_solve(data, rhs)
+    (potrs,) = get_lapack_funcs(("potrs",), (data,))
+    x, info = potrs(c, rhs.astype(data.dtype, copy=False), lower=0)
+    if info < 0:
+        raise ValueError(f"Illegal value in argument {-info} of potrs")
+    return x
+
+
+def _lu_inverse(data: np.ndarray) -> np.ndarray:
+    """Return the inverse of data, reusing its cached LU factorization.
+
+    getri inverts data^T from its factors, and the transpose of that
+    Fortran-ordered result is the C-ordered inverse of data.
+
+    Raises:
+        LinAlgError: If the matrix is singular.
+    """
+    if not _has_lapack_lu(data):
+        return np.linalg.inv(data)
+    factors = _lu_factor(data)
+    (getri,) = get_lapack_funcs(("getri",), (data,))
+    inv_t, info = getri(*factors)
+    if info < 0:
+        raise ValueError(f"Illegal value in argument {-info} of getri")
+    return inv_t.T
 
-    @property
-    def output_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "x": TensorSpec(
-                name="x",
-                kind=TensorKind.VECTOR,
-                description="Solution vector (n,)",
-            ),
-        }
 
-    def forward(
-        self, inputs: dict[str, TrackedTensor]
-    ) -> dict[str, TrackedTensor]:
-        A = inputs["A"]
-        b = inputs["b"]
+class LinearSolve(Operator):
+    """Direct linear system solver for square systems.
 
+    Solves Ax = b where A is a square invertible matrix.
+    Uses Cholesky decomposition for A tagged "positive_definite" and LU
+    decomposition otherwise; the factorization of A is cached, so
+    re-solving with the same A and a new b skips it.
+    """
+
+    __slots__ = ()
+
+    _NAME = "LinearSolve"
+    _DESCRIPTION = "Linear system solver: x = A^{-1}b (for square A)"
+    _TAGS = frozenset({"deterministic", "solver"})
+
+    _INPUT_SPECS = {
+        "A": TensorSpec(
+            name="A",
+            kind=TensorKind.MATRIX,
+            shape=(-1, -1),
+            description="Square coefficient matrix (n x n)",
+        ),
+        "b": TensorSpec(
+            name="b",
+            kind=TensorKind.VECTOR,
+            description="Right-hand side vector (n,)",
+        ),
+    }
+
+    _OUTPUT_SPECS = {
+        "x": TensorSpec(
+            name="x",
+            kind=TensorKind.VECTOR,
+            description="Solution vector (n,)",
+        ),
+    }
+
+    def _forward_fast(
+        self, A: TrackedTensor, b: TrackedTensor
+    ) -> dict[str, TrackedTensor]:
         # Validate square matrix
         if A.data.shape[0] != A.data.shape[1]:
             raise ValueError(
                 f"LinearSolve requires square matrix, got shape {A.data.shape}"
             )
 
-        # Use solve for direct solution
-        x = np.linalg.solve(A.data, b.data)
+        # Cholesky for matrices MatMul has proven positive definite
+        if "positive_definite" in A.tags:
+            x = _cho_solve(A.data, b.data)
+        else:
+            x = _lu_solve(A.data, b.data)
 
         return {
             "x": TrackedTensor(
                 data=x,
                 name=f"solve({A.name},{b.name})",
                 kind=TensorKind.VECTOR,
-                tags=frozenset({"exact_solution"}),
+                tags=_EXACT_TAGS,
             ),
         }
 
@@ -182,99 +404,133 @@ class NormalEquations(Operator):
     problem min_x ||Ax - b||_2.
 
     This is useful for visualization as it exposes the intermediate
-    A^T A and A^T b quantities.
+    A^T A and A^T b quantities. The solution itself is computed from a QR
+    factorization A = QR as R x = Q^T b, which avoids squaring the
+    condition number of A.
     """
 
-    @property
-    def name(self) -> str:
-        return "NormalEquations"
-
-    @property
-    def description(self) -> str:
-        return "Normal equations solver: (A^T A)x = A^T b"
-
-    @property
-    def tags(self) -> frozenset[str]:
-        return frozenset({"deterministic", "solver"})
+    __slots__ = ("_emit_normal_tensors",)
+
+    _NAME = "NormalEquations"
+    _DESCRIPTION = "Normal equations solver: (A^T A)x = A^T b"
+    _TAGS = frozenset({"deterministic", "solver"})
+
+    _INPUT_SPECS = {
+        "A": TensorSpec(
+            name="A",
+            kind=TensorKind.MATRIX,
+            shape=(-1, -1),
+            description="Design matrix (m x n)",
+        ),
+        "b": TensorSpec(
+            name="b",
+            kind=TensorKind.VECTOR,
+            description="Observation vector (m,)",
+        ),
+    }
+
+    _OUTPUT_SPECS = {
+        "x": TensorSpec(
+            name="x",
+            kind=TensorKind.VECTOR,
+            description="Solution vector (n,)",
+        ),
+        "AtA": TensorSpec(
+            name="AtA",
+            kind=TensorKind.MATRIX,
+            description="Normal matrix A^T A",
+        ),
+        "Atb": TensorSpec(
+            name="Atb",
+            kind=TensorKind.VECTOR,
+            description="A^T b vector",
+        ),
+    }
+
+    # Outputs when emit_normal_tensors=False
+    _X_OUTPUT_SPECS = MappingProxyType({"x": _OUTPUT_SPECS["x"]})
+
+    def __init__(self, emit_normal_tensors: bool = True):
+        """Initialize normal equations operator.
 
-    @property
-    def input_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "A": TensorSpec(
-                name="A",
-                kind=TensorKind.MATRIX,
-                shape=(-1, -1),
-                description="Design matrix (m x n)",
-            ),
-            "b": TensorSpec(
-                name="b",
-                kind=TensorKind.VECTOR,
-                description="Observation vector (m,)",
-            ),
-        }
+        Args:
+            emit_normal_tensors: If False, only the solution x is output and
+                A^T A and A^T b are never formed.
+        """
+        self._emit_normal_tensors = emit_normal_tensors
 
     @property
     def output_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "x": TensorSpec(
-                name="x",
-                kind=TensorKind.VECTOR,
-                description="Solution vector (n,)",
-            ),
-            "AtA": TensorSpec(
-                name="AtA",
-                kind=TensorKind.MATRIX,
-                description="Normal matrix A^T A",
-            ),
-            "Atb": TensorSpec(
-                name="Atb",
-                kind=TensorKind.VECTOR,
-                description="A^T b vector",
-            ),
-        }
+        if not self._emit_normal_tensors:
+            return self._X_OUTPUT_SPECS
+        return self._OUTPUT_SPECS
 
-    def forward(
-        self, inputs: dict[str, TrackedTensor]
+    def _forward_fast(
+        self, A: TrackedTensor, b: TrackedTensor
     ) -> dict[str, TrackedTensor]:
-        A = inputs["A"]
-        b = inputs["b"]
-
-        At = A.data.T
-        AtA = At @ A.data
-        Atb = At @ b.data
-
-        # Solve the normal equations
-        x = np.linalg.solve(AtA, Atb)
-
-        # AtA is always symmetric and PSD
-        ata_tags: set[str] = {"symmetric", "psd", "normal_matrix"}
-
-        # Check positive definiteness
-        try:
-            eigvals = np.linalg.eigvalsh(AtA)
-            if np.all(eigvals > 1e-10):
-                ata_tags.add("positive_definite")
-        except np.linalg.LinAlgError:
-            pass
+        m, n = A.data.shape
+        R = Qtb = None
+        if m >= n:
+            # A^T A = R^T R, so R x = Q^T b solves the normal equations
+            Q, R = np.linalg.qr(A.data)
+            Qtb = Q.T @ b.data
+            if solve_triangular is not None:
+                x = solve_triangular(R, Qtb, check_finite=False)
+            else:
+                x = np.linalg.solve(R, Qtb)
+        else:
+            # A^T A is rank deficient; solve it directly as before
+            At = A.data.T
+            x = np.linalg.solve(At @ A.data, At @ b.data)
 
-        return {
+        outputs = {
             "x": TrackedTensor(
                 data=x,
                 name=f"x*({A.name})",
                 kind=TensorKind.VECTOR,
-                tags=frozenset({"least_squares_solution"}),
+                tags=_LS_TAGS,
             ),
+        }
+        if not self._emit_normal_tensors:
+            return outputs
+
+        if R is not None:
+            # R^T R and R^T Q^T b cost O(n^3) and O(n^2) instead of the
+            # O(mn^2) and O(mn) products with A; NumPy multiplies a matrix
+            # by its own transpose with syrk, so AtA is exactly symmetric
+            AtA = R.T @ R
+            Atb = R.T @ Qtb
+        else:
+            At = A.data.T
+            AtA = At @ A.data
+            Atb = At @ b.data
+
+        # AtA = R^T R is always symmetric and PSD, and its eigenvalues are
+        # the squared singular values of R; the n x n R is much cheaper to
+        # decompose than AtA when m >> n. diag(R) alone can stay far from
+        # zero while R is numerically singular (e.g. a Kahan matrix).
+        if (
+            R is not None
+            and n > 0
+            and np.linalg.svd(R, compute_uv=False)[-1] ** 2 > _DEFINITE_EIGVAL_TOL
+        ):
+            ata_tags = _DEFINITE_NORMAL_MATRIX_TAGS
+        else:
+            ata_tags = _NORMAL_MATRIX_TAGS
+
+        return {
+            **outputs,
             "AtA": TrackedTensor(
                 data=AtA,
                 name=f"{A.name}^T{A.name}",
                 kind=TensorKind.MATRIX,
-                tags=frozenset(ata_tags),
+                tags=ata_tags,
             ),
             "Atb": TrackedTensor(
                 data=Atb,
                 name=f"{A.name}^T{b.name}",
                 kind=TensorKind.VECTOR,
-                tags=frozenset(),
+                tags=_NO_TAGS,
             ),
         }
 
@@ -285,68 +541,83 @@ class Inverse(Operator):
     Computes A^{-1} for a square invertible matrix.
     """
 
-    @property
-    def name(self) -> str:
-        return "Inverse"
-
-    @property
-    def description(self) -> str:
-        return "Matrix inverse: B = A^{-1}"
-
-    @property
-    def tags(self) -> frozenset[str]:
-        return frozenset({"deterministic"})
-
-    @property
-    def input_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "A": TensorSpec(
-                name="A",
-                kind=TensorKind.MATRIX,
-                shape=(-1, -1),
-                description="Square invertible matrix",
-            ),
-        }
-
-    @property
-    def output_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "A_inv": TensorSpec(
-                name="A_inv",
-                kind=TensorKind.MATRIX,
-                description="Inverse matrix",
-            ),
-        }
-
-    def forward(
-        self, inputs: dict[str, TrackedTensor]
-    ) -> dict[str, TrackedTensor]:
-        A = inputs["A"]
-
+    __slots__ = ()
+
+    _NAME = "Inverse"
+    _DESCRIPTION = "Matrix inverse: B = A^{-1}"
+    _TAGS = frozenset({"deterministic"})
+
+    _INPUT_SPECS = {
+        "A": TensorSpec(
+            name="A",
+            kind=TensorKind.MATRIX,
+            shape=(-1, -1),
+            description="Square invertible matrix",
+        ),
+    }
+
+    _OUTPUT_SPECS = {
+        "A_inv": TensorSpec(
+            name="A_inv",
+            kind=TensorKind.MATRIX,
+            description="Inverse matrix",
+        ),
+    }
+
+    def _forward_fast(self, A: TrackedTensor) -> dict[str, TrackedTensor]:
         if A.data.shape[0] != A.data.shape[1]:
             raise ValueError(
                 f"Inverse requires square matrix, got shape {A.data.shape}"
             )
 
-        A_inv = np.linalg.inv(A.data)
+        A_inv = _lu_inverse(A.data)
 
         # Preserve symmetry if present
-        tags: set[str] = {"inverse"}
-        if "symmetric" in A.tags:
-            tags.add("symmetric")
-        if "positive_definite" in A.tags:
-            tags.add("positive_definite")
+        tags = _INVERSE_TAGS["symmetric" in A.tags, "positive_definite" in A.tags]
 
         return {
             "A_inv": TrackedTensor(
                 data=A_inv,
                 name=f"{A.name}^(-1)",
                 kind=TensorKind.MATRIX,
-                tags=frozenset(tags),
+                tags=tags,
             ),
         }
 
 
+def _pinv(data: np.ndarray, rcond: float | None) -> np.ndarray:
+    """Return the pseudoinverse of a real matrix via LAPACK gesdd.
+
+    Calling the routine directly skips np.linalg.pinv's generic dispatch,
+    which dominates for the small matrices of interactive scenarios. The
+    Fortran-ordered transpose A^T = U S Vt is factored without reordering
+    the data, and A^+ = U S^+ Vt.
+
+    Args:
+        data: Matrix to invert.
+        rcond: Relative cutoff for small singular values, or None for
+            max(m, n) * eps as in NumPy.
+
+    Raises:
+        LinAlgError: If the SVD does not converge.
+    """
+    if get_lapack_funcs is None or data.dtype.char not in "fd" or data.size == 0:
+        if rcond is None:
+            return np.linalg.pinv(data)
+        return np.linalg.pinv(data, rcond=rcond)
+    (gesdd,) = get_lapack_funcs(("gesdd",), (data,))
+    u, s, vt, info = gesdd(data.T, compute_uv=1, full_matrices=0)
+    if info > 0:
+        raise np.linalg.LinAlgError("SVD did not converge")
+    if info < 0:
+        raise ValueError(f"Illegal value in argument {-info} of gesdd")
+    if rcond is None:
+        rcond = max(data.shape) * np.finfo(data.dtype).eps
+    large = s > rcond * s[0]
+    s_inv = np.divide(1, s, out=np.zeros_like(s), where=large)
+    return (u * s_inv) @ vt
+
+
 class PseudoInverse(Operator):
     """Moore-Penrose pseudoinverse operator.
 
@@ -354,6 +625,29 @@ class PseudoInverse(Operator):
     Works for any matrix, including non-square and rank-deficient.
     """
 
+    __slots__ = ("_rcond",)
+
+    _NAME = "PseudoInverse"
+    _DESCRIPTION = "Moore-Penrose pseudoinverse: A^+"
+    _TAGS = frozenset({"deterministic"})
+
+    _INPUT_SPECS = {
+        "A": TensorSpec(
+            name="A",
+            kind=TensorKind.MATRIX,
+            shape=(-1, -1),
+            description="Input matrix (any shape)",
+        ),
+    }
+
+    _OUTPUT_SPECS = {
+        "A_pinv": TensorSpec(
+            name="A_pinv",
+            kind=TensorKind.MATRIX,
+            description="Pseudoinverse matrix",
+        ),
+    }
+
     def __init__(self, rcond: float | None = None):
         """Initialize pseudoinverse operator.
 
@@ -364,54 +658,14 @@ class PseudoInverse(Operator):
         """
         self._rcond = rcond
 
-    @property
-    def name(self) -> str:
-        return "PseudoInverse"
-
-    @property
-    def description(self) -> str:
-        return "Moore-Penrose pseudoinverse: A^+"
-
-    @property
-    def tags(self) -> frozenset[str]:
-        return frozenset({"deterministic"})
-
-    @property
-    def input_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "A": TensorSpec(
-                name="A",
-                kind=TensorKind.MATRIX,
-                shape=(-1, -1),
-                description="Input matrix (any shape)",
-            ),
-        }
-
-    @property
-    def output_specs(self) -> dict[str, TensorSpec]:
-        return {
-            "A_pinv": TensorSpec(
-                name="A_pinv",
-                kind=TensorKind.MATRIX,
-                description="Pseudoinverse matrix",
-            ),
-        }
-
-    def forward(
-        self, inputs: dict[str, TrackedTensor]
-    ) -> dict[str, TrackedTensor]:
-        A = inputs["A"]
-
-        if self._rcond is None:
-            A_pinv = np.linalg.pinv(A.data)
-        else:
-            A_pinv = np.linalg.pinv(A.data, rcond=self._rcond)
+    def _forward_fast(self, A: TrackedTensor) -> dict[str, TrackedTensor]:
+        A_pinv = _pinv(A.data, self._rcond)
 
         return {
             "A_pinv": TrackedTensor(
                 data=A_pinv,
                 name=f"{A.name}^+",
                 kind=TensorKind.MATRIX,
-                tags=frozenset({"pseudoinverse"}),
+                tags=_PINV_TAGS,
             ),
         }
@@ -13,6 +13,7 @@ Key concepts visualized:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -24,6 +25,52 @@ from ..operators.basic import MatMul, Transpose, Subtract
 from ..operators.solvers import LinearSolve
 
 
+# "True" solution used to generate b
+_X_TRUE = np.array([1.0, 2.0])
+
+
+@lru_cache(maxsize=32)
+def _seeded_draws(seed: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Draw the random parts of the inputs for a seed.
+
+    Returns:
+        (U, Vt, noise): singular vectors of a random 3x2 matrix and a
+        standard normal noise direction, in the order the generator drew
+        them.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Start with a well-conditioned matrix; its SVD controls conditioning
+    A_base = rng.standard_normal((3, 2))
+    U, _, Vt = np.linalg.svd(A_base, full_matrices=False)
+    noise = rng.standard_normal(3)
+    for array in (U, Vt, noise):
+        array.flags.writeable = False
+    return U, Vt, noise
+
+
+@lru_cache(maxsize=32)
+def _design_matrix(seed: int, condition_number: float) -> TrackedTensor:
+    """Build A for a seed and condition number.
+
+    Moving only the noise slider therefore reuses the same tensor, along
+    with its cached summary. Like b, A is stored in the visualization
+    dtype TrackedTensor.DEFAULT_DTYPE, so the graph's BLAS and LAPACK calls
+    run in single precision unless TENSORSCOPE_FORCE_FP64=1 is set.
+    """
+    U, Vt, _ = _seeded_draws(seed)
+
+    # Set singular values to achieve desired condition number
+    # s[0] / s[1] = condition_number
+    s_new = np.array([condition_number, 1.0])
+    return TrackedTensor.from_array(
+        (U * s_new) @ Vt,
+        name="A",
+        kind=TensorKind.MATRIX,
+        tags=frozenset({"design_matrix"}),
+    )
+
+
 def create_least_squares_2d_scenario() -> Scenario:
     """Create and configure the Least Squares 2D scenario.
 
@@ -131,40 +178,19 @@ def create_least_squares_2d_scenario() -> Scenario:
     def generate_inputs(params: dict[str, Any]) -> dict[str, TrackedTensor]:
         """Generate input tensors based on parameters."""
         noise_level = params["noise_level"]
-        condition_number = params["condition_number"]
+        condition_number = float(params["condition_number"])
         seed = int(params["seed"])
 
-        rng = np.random.default_rng(seed)
-
         # Create A with specified condition number
-        # Start with a well-conditioned matrix
-        A_base = rng.standard_normal((3, 2))
-
-        # Use SVD to control condition number
-        U, s, Vt = np.linalg.svd(A_base, full_matrices=False)
-
-        # Set singular values to achieve desired condition number
-        # s[0] / s[1] = condition_number
-        s_new = np.array([condition_number, 1.0])
-        A = U @ np.diag(s_new) @ Vt
-
-        # Create "true" solution
-        x_true = np.array([1.0, 2.0])
+        A = _design_matrix(seed, condition_number)
 
         # Create b = A @ x_true + noise
-        b_clean = A @ x_true
-        noise = noise_level * rng.standard_normal(3)
-        b = b_clean + noise
+        b = A.data @ _X_TRUE + noise_level * _seeded_draws(seed)[2]
 
         return {
-            "A": TrackedTensor(
-                data=A,
-                name="A",
-                kind=TensorKind.MATRIX,
-                tags=frozenset({"design_matrix"}),
-            ),
-            "b": TrackedTensor(
-                data=b,
+            "A": A,
+            "b": TrackedTensor.from_array(
+                b,
                 name="b",
                 kind=TensorKind.VECTOR,
                 tags=frozenset({"observation"}),
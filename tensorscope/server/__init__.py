@@ -1,7 +1,7 @@
 """FastAPI server for Tensorscope."""
 
 from .main import app
-from .state import state, ServerState
+from .state import state, get_state, ServerState
 from .schemas import (
     ScenarioInfo,
     ScenarioDetail,
@@ -14,6 +14,7 @@ from .schemas import (
 __all__ = [
     "app",
     "state",
+    "get_state",
     "ServerState",
     "ScenarioInfo",
     "ScenarioDetail",
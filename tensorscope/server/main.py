@@ -6,6 +6,7 @@ from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 
 from .routes import router
+from .schemas import prebuild_models
 from .state import state
 from .websocket import handle_websocket
 
@@ -18,6 +19,7 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown."""
     # Startup: Register scenarios
     state.register_scenario(least_squares_2d)
+    prebuild_models()
 
     yield
 
@@ -39,6 +41,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Shape", "X-Dtype"],  # Describe /raw tensor payloads
 )
 
 # Include REST API routes
@@ -2,34 +2,96 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import base64
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
-from fastapi import APIRouter, HTTPException, Query
+import numpy as np
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import TypeAdapter
 
-from .state import state
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+from ..core.scenario import Scenario
 from .schemas import (
-    ScenarioInfo,
-    ScenarioDetail,
+    GraphEdgeSchema,
+    GraphNodeSchema,
+    GraphSchema,
     ParameterSchema,
     ProbeSchema,
-    GraphSchema,
-    GraphNodeSchema,
-    GraphEdgeSchema,
-    TensorSummaryResponse,
-    TensorDataResponse,
-    TensorSliceResponse,
     RunScenarioRequest,
     RunScenarioResponse,
+    ScenarioDetail,
+    ScenarioInfo,
+    TensorDataResponse,
+    TensorSliceResponse,
+    TensorSummaryResponse,
 )
+from .state import state
 
 router = APIRouter(prefix="/api")
 
+# Encodings of the "data" field of the /data and /slice responses
+_DataEncoding = Literal["list", "base64"]
+
+
+def _array_default(obj: Any) -> Any:
+    """Convert arrays orjson cannot serialize natively to nested lists."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _tensor_json(payload: Dict[str, Any]) -> Response:
+    """Serialize a payload holding an ndarray under "data" with orjson.
+
+    orjson writes C-contiguous numeric arrays straight from their buffer,
+    skipping both .tolist() and response-model validation of the nested
+    lists; other arrays fall back to .tolist().
+    """
+    content = orjson.dumps(
+        payload, default=_array_default, option=orjson.OPT_SERIALIZE_NUMPY
+    )
+    return Response(content=content, media_type="application/json")
+
+
+def _base64_json(payload: Dict[str, Any], data: np.ndarray) -> Response:
+    """Serialize a payload with data as base64 little-endian C-ordered bytes.
+
+    The browser decodes the string once into a typed array matching the
+    payload's dtype, instead of parsing one JSON number per element.
+    """
+    data = np.ascontiguousarray(data, dtype=data.dtype.newbyteorder("<"))
+    payload = {
+        **payload,
+        "data": base64.b64encode(data.tobytes()).decode("ascii"),
+        "encoding": "base64",
+    }
+    content = orjson.dumps(payload) if orjson is not None else json.dumps(payload)
+    return Response(content=content, media_type="application/json")
+
 
 @router.get("/scenarios", response_model=List[ScenarioInfo])
-async def list_scenarios() -> List[ScenarioInfo]:
+async def list_scenarios() -> Response:
     """List all available scenarios."""
-    scenarios = state.list_scenarios()
-    return [
+    return Response(
+        content=_scenario_list_json(tuple(state.list_scenarios())),
+        media_type="application/json",
+    )
+
+
+@lru_cache(maxsize=1)
+def _scenario_list_json(scenarios: Tuple[Scenario, ...]) -> bytes:
+    """Build the encoded scenario list for the registered scenarios.
+
+    Keyed by the scenario objects themselves, so registering a scenario
+    produces a new key, as in _scenario_detail_json().
+    """
+    infos = [
         ScenarioInfo(
             id=s.id,
             name=s.name,
@@ -37,15 +99,29 @@ async def list_scenarios() -> List[ScenarioInfo]:
         )
         for s in scenarios
     ]
+    return TypeAdapter(List[ScenarioInfo]).dump_json(infos)
 
 
 @router.get("/scenarios/{scenario_id}", response_model=ScenarioDetail)
-async def get_scenario(scenario_id: str) -> ScenarioDetail:
+async def get_scenario(scenario_id: str) -> Response:
     """Get detailed information about a scenario."""
     scenario = state.get_scenario(scenario_id)
     if scenario is None:
         raise HTTPException(status_code=404, detail=f"Scenario '{scenario_id}' not found")
 
+    return Response(
+        content=_scenario_detail_json(scenario), media_type="application/json"
+    )
+
+
+@lru_cache(maxsize=32)
+def _scenario_detail_json(scenario: Scenario) -> bytes:
+    """Build the encoded ScenarioDetail of a registered scenario.
+
+    Scenarios are fully configured before they are registered, so the
+    response is built and serialized once per scenario object. A scenario
+    registered again under the same ID is a new object and a new entry.
+    """
     # Build parameter schemas
     parameters = [
         ParameterSchema(
@@ -97,7 +173,7 @@ async def get_scenario(scenario_id: str) -> ScenarioDetail:
         ]
         graph_schema = GraphSchema(nodes=nodes, edges=edges)
 
-    return ScenarioDetail(
+    detail = ScenarioDetail(
         id=scenario.id,
         name=scenario.name,
         description=scenario.description,
@@ -105,6 +181,7 @@ async def get_scenario(scenario_id: str) -> ScenarioDetail:
         probes=probes,
         graph=graph_schema,
     )
+    return detail.model_dump_json().encode()
 
 
 @router.post("/scenarios/{scenario_id}/run", response_model=RunScenarioResponse)
@@ -125,48 +202,44 @@ async def run_scenario(
     # Convert summaries to response format
     tensor_responses: Dict[str, TensorSummaryResponse] = {}
     for key, summary in summaries.items():
-        tensor_responses[key] = TensorSummaryResponse(
-            id=summary.id,
-            name=summary.name,
-            kind=summary.kind,
-            tags=summary.tags,
-            shape=list(summary.shape),
-            dtype=summary.dtype,
-            stats=summary.stats,
-            recommended_views=summary.recommended_views,
+        # Server-built summaries are already well typed; skip validation
+        tensor_responses[key] = TensorSummaryResponse.model_construct(
+            **summary.to_dict()
         )
 
-    return RunScenarioResponse(
+    return RunScenarioResponse.model_construct(
         scenario_id=scenario_id,
-        parameters=state.current_params,
+        parameters=dict(state.current_params),
         tensors=tensor_responses,
     )
 
 
 @router.get("/tensors/{tensor_id}/summary", response_model=TensorSummaryResponse)
-async def get_tensor_summary(tensor_id: str) -> TensorSummaryResponse:
+async def get_tensor_summary(
+    tensor_id: str,
+    full_spectrum: bool = Query(
+        default=False, description="Include all singular values of large matrices"
+    ),
+    stats: Optional[List[str]] = Query(
+        default=None, description="Statistics to compute (default: all)"
+    ),
+) -> TensorSummaryResponse:
     """Get summary statistics for a tensor."""
-    summary = state.get_tensor_summary(tensor_id)
+    summary = state.get_tensor_summary(tensor_id, full_spectrum=full_spectrum)
     if summary is None:
         raise HTTPException(status_code=404, detail=f"Tensor '{tensor_id}' not found")
 
-    return TensorSummaryResponse(
-        id=summary.id,
-        name=summary.name,
-        kind=summary.kind,
-        tags=summary.tags,
-        shape=list(summary.shape),
-        dtype=summary.dtype,
-        stats=summary.stats,
-        recommended_views=summary.recommended_views,
-    )
+    return TensorSummaryResponse.model_construct(**summary.to_dict(stats))
 
 
 @router.get("/tensors/{tensor_id}/data", response_model=TensorDataResponse)
 async def get_tensor_data(
     tensor_id: str,
     max_size: int = Query(default=10000, description="Maximum number of elements"),
-) -> TensorDataResponse:
+    encoding: _DataEncoding = Query(
+        default="list", description="Send data as nested lists or base64 bytes"
+    ),
+) -> Union[TensorDataResponse, Response]:
     """Get full tensor data (for small tensors only)."""
     tensor = state.get_tensor(tensor_id)
     if tensor is None:
@@ -178,57 +251,127 @@ async def get_tensor_data(
             detail=f"Tensor too large ({tensor.data.size} elements). Use /slice endpoint.",
         )
 
-    return TensorDataResponse(
-        id=tensor.id,
-        name=tensor.name,
-        shape=list(tensor.shape),
-        dtype=tensor.dtype,
-        data=tensor.data.tolist(),
-    )
+    payload = {
+        "id": tensor.id,
+        "name": tensor.name,
+        "shape": list(tensor.shape),
+        "dtype": tensor.dtype,
+    }
+    if encoding == "base64":
+        return _base64_json(payload, tensor.data)
+    if orjson is not None:
+        return _tensor_json({**payload, "data": tensor.data})
+    return TensorDataResponse(**payload, data=tensor.data.tolist())
 
 
 @router.get("/tensors/{tensor_id}/slice", response_model=TensorSliceResponse)
 async def get_tensor_slice(
     tensor_id: str,
     row_start: int = Query(default=0, ge=0),
-    row_end: Optional[int] = Query(default=None),
+    row_end: Optional[int] = Query(default=None, ge=1),
     col_start: int = Query(default=0, ge=0),
-    col_end: Optional[int] = Query(default=None),
-) -> TensorSliceResponse:
+    col_end: Optional[int] = Query(default=None, ge=1),
+    encoding: _DataEncoding = Query(
+        default="list", description="Send data as nested lists or base64 bytes"
+    ),
+) -> Union[TensorSliceResponse, Response]:
     """Get a slice of a tensor."""
     tensor = state.get_tensor(tensor_id)
     if tensor is None:
         raise HTTPException(status_code=404, detail=f"Tensor '{tensor_id}' not found")
 
+    sliced, row_range, col_range = _slice_tensor_data(
+        tensor.data, row_start, row_end, col_start, col_end
+    )
+
+    payload = {
+        "id": tensor.id,
+        "name": tensor.name,
+        "full_shape": list(tensor.shape),
+        "slice_shape": list(sliced.shape),
+        "row_range": row_range,
+        "col_range": col_range,
+        "dtype": tensor.dtype,
+    }
+    if encoding == "base64":
+        return _base64_json(payload, sliced)
+    if orjson is not None:
+        return _tensor_json({**payload, "data": np.ascontiguousarray(sliced)})
+    return TensorSliceResponse(**payload, data=sliced.tolist())
+
+
+@router.get("/tensors/{tensor_id}/raw")
+async def get_tensor_raw(
+    tensor_id: str,
+    row_start: int = Query(default=0, ge=0),
+    row_end: Optional[int] = Query(default=None, ge=1),
+    col_start: int = Query(default=0, ge=0),
+    col_end: Optional[int] = Query(default=None, ge=1),
+) -> Response:
+    """Get tensor data, or a slice of it, as raw little-endian bytes.
+
+    The body is the C-ordered array buffer, which the browser can wrap in
+    a typed array directly; the X-Shape and X-Dtype headers describe it.
+    Without slice parameters the whole tensor is returned. This skips
+    building nested Python lists and formatting every element as JSON.
+    """
+    tensor = state.get_tensor(tensor_id)
+    if tensor is None:
+        raise HTTPException(status_code=404, detail=f"Tensor '{tensor_id}' not found")
+
     data = tensor.data
+    if data.ndim in (1, 2):
+        data, _, _ = _slice_tensor_data(data, row_start, row_end, col_start, col_end)
+    data = np.ascontiguousarray(data, dtype=data.dtype.newbyteorder("<"))
 
-    # Handle different tensor dimensions
-    if data.ndim == 1:
-        # For 1D tensors, only use row_start/row_end as the slice
-        actual_row_end = row_end if row_end is not None else len(data)
-        sliced = data[row_start:actual_row_end]
-        slice_shape = list(sliced.shape)
-        row_range = (row_start, actual_row_end)
-        col_range = (0, 0)
-    elif data.ndim == 2:
-        actual_row_end = row_end if row_end is not None else data.shape[0]
-        actual_col_end = col_end if col_end is not None else data.shape[1]
-        sliced = data[row_start:actual_row_end, col_start:actual_col_end]
-        slice_shape = list(sliced.shape)
-        row_range = (row_start, actual_row_end)
-        col_range = (col_start, actual_col_end)
-    else:
+    return Response(
+        content=data.tobytes(),
+        media_type="application/octet-stream",
+        headers={
+            "X-Shape": json.dumps(list(data.shape)),
+            "X-Dtype": data.dtype.name,
+        },
+    )
+
+
+def _slice_tensor_data(
+    data: np.ndarray,
+    row_start: int,
+    row_end: Optional[int],
+    col_start: int,
+    col_end: Optional[int],
+) -> tuple[np.ndarray, tuple[int, int], tuple[int, int]]:
+    """Slice 1D or 2D tensor data for the slice endpoints.
+
+    Ends past the data are clamped to its shape, so the returned ranges
+    match the slice.
+
+    Returns:
+        (sliced, row_range, col_range); col_range is (0, 0) for 1D data.
+
+    Raises:
+        HTTPException: If the data has more than two dimensions, or an end
+            index does not exceed its start index.
+    """
+    if data.ndim not in (1, 2):
         raise HTTPException(
             status_code=400,
             detail=f"Slicing not supported for {data.ndim}D tensors",
         )
+    # Reject empty ranges before touching the data; for 1D tensors only
+    # row_start/row_end are used
+    if row_end is not None and row_end <= row_start:
+        raise HTTPException(
+            status_code=400, detail="row_end must be greater than row_start"
+        )
+    if data.ndim == 2 and col_end is not None and col_end <= col_start:
+        raise HTTPException(
+            status_code=400, detail="col_end must be greater than col_start"
+        )
 
-    return TensorSliceResponse(
-        id=tensor.id,
-        name=tensor.name,
-        full_shape=list(tensor.shape),
-        slice_shape=slice_shape,
-        row_range=row_range,
-        col_range=col_range,
-        data=sliced.tolist(),
-    )
+    actual_row_end = data.shape[0] if row_end is None else min(row_end, data.shape[0])
+    if data.ndim == 1:
+        return data[row_start:actual_row_end], (row_start, actual_row_end), (0, 0)
+    actual_col_end = data.shape[1] if col_end is None else min(col_end, data.shape[1])
+    sliced = data[row_start:actual_row_end, col_start:actual_col_end]
+    return sliced, (row_start, actual_row_end), (col_start, actual_col_end)
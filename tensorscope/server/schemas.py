@@ -4,10 +4,21 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
-class ParameterSchema(BaseModel):
+class _Schema(BaseModel):
+    """Base for the API models.
+
+    Instances are immutable and reject unknown fields. Validators are built
+    on first use rather than at import, so models that are never validated,
+    such as the WebSocket message types, cost nothing.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
+
+
+class ParameterSchema(_Schema):
     """Schema for a scenario parameter."""
 
     name: str
@@ -21,7 +32,7 @@ class ParameterSchema(BaseModel):
     options: Optional[List[Any]] = None
 
 
-class ProbeSchema(BaseModel):
+class ProbeSchema(_Schema):
     """Schema for a probe point."""
 
     key: str
@@ -29,7 +40,7 @@ class ProbeSchema(BaseModel):
     description: str = ""
 
 
-class GraphNodeSchema(BaseModel):
+class GraphNodeSchema(_Schema):
     """Schema for a node in the operator graph."""
 
     id: str
@@ -39,7 +50,7 @@ class GraphNodeSchema(BaseModel):
     tags: List[str] = Field(default_factory=list)
 
 
-class GraphEdgeSchema(BaseModel):
+class GraphEdgeSchema(_Schema):
     """Schema for an edge in the operator graph."""
 
     from_node: str
@@ -48,14 +59,14 @@ class GraphEdgeSchema(BaseModel):
     to_input: str
 
 
-class GraphSchema(BaseModel):
+class GraphSchema(_Schema):
     """Schema for the operator graph."""
 
     nodes: List[GraphNodeSchema]
     edges: List[GraphEdgeSchema]
 
 
-class ScenarioInfo(BaseModel):
+class ScenarioInfo(_Schema):
     """Summary info for listing scenarios."""
 
     id: str
@@ -63,7 +74,7 @@ class ScenarioInfo(BaseModel):
     description: str
 
 
-class ScenarioDetail(BaseModel):
+class ScenarioDetail(_Schema):
     """Full scenario details including parameters and graph."""
 
     id: str
@@ -74,7 +85,7 @@ class ScenarioDetail(BaseModel):
     graph: Optional[GraphSchema] = None
 
 
-class TensorSummaryResponse(BaseModel):
+class TensorSummaryResponse(_Schema):
     """Tensor summary for API responses."""
 
     id: str
@@ -87,26 +98,40 @@ class TensorSummaryResponse(BaseModel):
     recommended_views: List[str]
 
 
-class TensorDataResponse(BaseModel):
+class TensorDataResponse(_Schema):
     """Full tensor data for API responses (small tensors only)."""
 
     id: str
     name: str
     shape: List[int]
     dtype: str
-    data: List[Any]  # Nested list representing the tensor
+    # Nested list representing the tensor, or for encoding="base64" its
+    # little-endian C-ordered bytes, base64-encoded
+    data: Union[List[Any], str]
+    encoding: str = "list"
+
+
+class TensorSliceRequest(_Schema):
+    """Request for a tensor slice.
 
+    Indices must be non-negative and each end must exceed its start.
+    """
 
-class TensorSliceRequest(BaseModel):
-    """Request for a tensor slice."""
+    row_start: int = Field(default=0, ge=0)
+    row_end: Optional[int] = Field(default=None, ge=1)
+    col_start: int = Field(default=0, ge=0)
+    col_end: Optional[int] = Field(default=None, ge=1)
 
-    row_start: int = 0
-    row_end: Optional[int] = None
-    col_start: int = 0
-    col_end: Optional[int] = None
+    @model_validator(mode="after")
+    def _check_ranges(self) -> TensorSliceRequest:
+        if self.row_end is not None and self.row_end <= self.row_start:
+            raise ValueError("row_end must be greater than row_start")
+        if self.col_end is not None and self.col_end <= self.col_start:
+            raise ValueError("col_end must be greater than col_start")
+        return self
 
 
-class TensorSliceResponse(BaseModel):
+class TensorSliceResponse(_Schema):
     """Response containing a tensor slice."""
 
     id: str
@@ -115,23 +140,25 @@ class TensorSliceResponse(BaseModel):
     slice_shape: List[int]
     row_range: Tuple[int, int]
     col_range: Tuple[int, int]
-    data: List[Any]
+    dtype: str
+    data: Union[List[Any], str]  # As in TensorDataResponse
+    encoding: str = "list"
 
 
-class ParameterUpdate(BaseModel):
+class ParameterUpdate(_Schema):
     """Request to update a parameter value."""
 
     name: str
     value: Union[float, int, str]
 
 
-class RunScenarioRequest(BaseModel):
+class RunScenarioRequest(_Schema):
     """Request to run a scenario with specific parameters."""
 
     parameters: Dict[str, Union[float, int, str]] = Field(default_factory=dict)
 
 
-class RunScenarioResponse(BaseModel):
+class RunScenarioResponse(_Schema):
     """Response from running a scenario."""
 
     scenario_id: str
@@ -142,7 +169,7 @@ class RunScenarioResponse(BaseModel):
 # WebSocket message types
 
 
-class WSSubscribeMessage(BaseModel):
+class WSSubscribeMessage(_Schema):
     """WebSocket message to subscribe to tensor updates."""
 
     type: str = "subscribe"
@@ -150,23 +177,24 @@ class WSSubscribeMessage(BaseModel):
     view: Optional[str] = None
 
 
-class WSUnsubscribeMessage(BaseModel):
+class WSUnsubscribeMessage(_Schema):
     """WebSocket message to unsubscribe from tensor updates."""
 
     type: str = "unsubscribe"
     tensor_id: str
 
 
-class WSUpdateParamMessage(BaseModel):
+class WSUpdateParamMessage(_Schema):
     """WebSocket message to update a parameter."""
 
     type: str = "update_param"
     scenario_id: str
     param: str
     value: Union[float, int, str]
+    stream: bool = False
 
 
-class WSTensorUpdateMessage(BaseModel):
+class WSTensorUpdateMessage(_Schema):
     """WebSocket message sent when a tensor is updated."""
 
     type: str = "tensor_update"
@@ -174,7 +202,14 @@ class WSTensorUpdateMessage(BaseModel):
     summary: TensorSummaryResponse
 
 
-class WSGraphUpdateMessage(BaseModel):
+class WSStreamEndMessage(_Schema):
+    """WebSocket message sent after the last streamed tensor update."""
+
+    type: str = "stream_end"
+    count: int
+
+
+class WSGraphUpdateMessage(_Schema):
     """WebSocket message sent when the graph is updated."""
 
     type: str = "graph_update"
@@ -182,8 +217,35 @@ class WSGraphUpdateMessage(BaseModel):
     edges: List[GraphEdgeSchema]
 
 
-class WSErrorMessage(BaseModel):
+class WSErrorMessage(_Schema):
     """WebSocket error message."""
 
     type: str = "error"
     message: str
+
+
+# Models the server itself constructs and validates while answering
+# requests. FastAPI builds its own validators for route bodies and
+# responses, and the WebSocket message models are never validated, so
+# those stay deferred.
+_SERVER_BUILT_MODELS = (
+    ParameterSchema,
+    ProbeSchema,
+    GraphNodeSchema,
+    GraphEdgeSchema,
+    GraphSchema,
+    ScenarioInfo,
+    ScenarioDetail,
+    TensorDataResponse,
+    TensorSliceResponse,
+)
+
+
+def prebuild_models() -> None:
+    """Build the validators of models the server constructs directly.
+
+    Called at application startup, so the first requests do not pay for
+    the validators that defer_build postpones.
+    """
+    for model in _SERVER_BUILT_MODELS:
+        model.model_rebuild(force=True)
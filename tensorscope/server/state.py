@@ -2,46 +2,65 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Set
 import asyncio
+import json
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set
 
 from fastapi import WebSocket
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 from ..core.scenario import Scenario
-from ..core.tensor import TrackedTensor, TensorSummary, compute_summary
+from ..core.tensor import TensorSummary, TrackedTensor, compute_summary
+
+# Connections written to concurrently per broadcast batch
+_BROADCAST_BATCH = 50
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def encode_message(message: Dict[str, Any]) -> str:
+    """Encode a WebSocket message as JSON text, with orjson if installed.
+
+    Without orjson this matches WebSocket.send_json(). With it, numpy arrays
+    and scalars are encoded natively, and non-string keys are stringified as
+    json.dumps would.
+    """
+    if orjson is None:
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+    return orjson.dumps(message, option=_ORJSON_OPTIONS).decode()
 
 
 class ServerState:
     """Manages server-side state for scenarios and WebSocket connections.
 
-    This singleton class holds:
+    The server uses the single module-level instance `state` (also returned
+    by get_state()), which holds:
     - Loaded scenarios
     - Current tensor cache (from last execution)
     - Active WebSocket connections and their subscriptions
     """
 
-    _instance: Optional["ServerState"] = None
-
-    def __new__(cls) -> ServerState:
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
     def __init__(self) -> None:
-        if self._initialized:
-            return
-        self._initialized = True
-
         self._scenarios: Dict[str, Scenario] = {}
+        # Both caches are keyed by tensor ID only; _key_to_id resolves
+        # "node.output" keys to those IDs
         self._tensor_cache: Dict[str, TrackedTensor] = {}
         self._summary_cache: Dict[str, TensorSummary] = {}
+        self._key_to_id: Dict[str, str] = {}
         self._active_scenario_id: Optional[str] = None
         self._current_params: Dict[str, Any] = {}
 
         # WebSocket management
         self._connections: Set[WebSocket] = set()
         self._subscriptions: Dict[WebSocket, Set[str]] = {}  # ws -> set of tensor_ids
+        # Reverse index of _subscriptions: tensor_id -> subscribed connections
+        self._tensor_subscribers: Dict[str, Set[WebSocket]] = {}
 
     def register_scenario(self, scenario: Scenario) -> None:
         """Register a scenario for use by the API.
@@ -77,6 +96,10 @@ class ServerState:
     ) -> Dict[str, TensorSummary]:
         """Run a scenario and cache the results.
 
+        All summaries are computed before the caches are replaced, so other
+        requests never see a mix of two runs or a partly filled cache, and a
+        failure leaves the previous results in place.
+
         Args:
             scenario_id: The scenario ID to run.
             params: Optional parameter overrides.
@@ -91,24 +114,22 @@ class ServerState:
         if scenario is None:
             raise ValueError(f"Scenario '{scenario_id}' not found")
 
-        # Run the scenario
-        tensors = scenario.run(params)
+        # Run the scenario; nodes unaffected by the changed parameters
+        # return their previous output tensors
+        tensors = scenario.run(params, memoize=True)
+        summaries = {key: compute_summary(tensor) for key, tensor in tensors.items()}
 
         # Update caches
         self._active_scenario_id = scenario_id
-        self._current_params = scenario._last_params.copy()
-        self._tensor_cache.clear()
-        self._summary_cache.clear()
-
-        for key, tensor in tensors.items():
-            self._tensor_cache[tensor.id] = tensor
-            self._tensor_cache[key] = tensor  # Also index by key
-            summary = compute_summary(tensor)
-            self._summary_cache[tensor.id] = summary
-            self._summary_cache[key] = summary
+        # Scenario.run replaces _last_params on each run, never mutates it
+        self._current_params = scenario._last_params
+        self._tensor_cache = {tensor.id: tensor for tensor in tensors.values()}
+        self._summary_cache = {
+            tensors[key].id: summary for key, summary in summaries.items()
+        }
+        self._key_to_id = {key: tensor.id for key, tensor in tensors.items()}
 
-        # Return summaries
-        return {key: compute_summary(tensor) for key, tensor in tensors.items()}
+        return summaries
 
     def get_tensor(self, tensor_id: str) -> Optional[TrackedTensor]:
         """Get a cached tensor by ID or key.
@@ -119,17 +140,27 @@ class ServerState:
         Returns:
             The tensor, or None if not found.
         """
-        return self._tensor_cache.get(tensor_id)
+        return self._tensor_cache.get(self._key_to_id.get(tensor_id, tensor_id))
 
-    def get_tensor_summary(self, tensor_id: str) -> Optional[TensorSummary]:
+    def get_tensor_summary(
+        self,
+        tensor_id: str,
+        full_spectrum: bool = False,
+    ) -> Optional[TensorSummary]:
         """Get a cached tensor summary by ID or key.
 
         Args:
             tensor_id: The tensor ID or key.
+            full_spectrum: If True, recompute the summary with all singular
+                values of the tensor, regardless of its size.
 
         Returns:
             The summary, or None if not found.
         """
+        tensor_id = self._key_to_id.get(tensor_id, tensor_id)
+        if full_spectrum:
+            tensor = self._tensor_cache.get(tensor_id)
+            return None if tensor is None else compute_summary(tensor, True)
         return self._summary_cache.get(tensor_id)
 
     def get_all_summaries(self) -> Dict[str, TensorSummary]:
@@ -138,14 +169,7 @@ class ServerState:
         Returns:
             Dict mapping tensor IDs to summaries.
         """
-        # Return only summaries indexed by tensor ID (not key duplicates)
-        seen_ids: Set[str] = set()
-        result: Dict[str, TensorSummary] = {}
-        for key, summary in self._summary_cache.items():
-            if summary.id not in seen_ids:
-                result[summary.id] = summary
-                seen_ids.add(summary.id)
-        return result
+        return dict(self._summary_cache)
 
     @property
     def active_scenario_id(self) -> Optional[str]:
@@ -153,9 +177,9 @@ class ServerState:
         return self._active_scenario_id
 
     @property
-    def current_params(self) -> Dict[str, Any]:
-        """Get the current parameter values."""
-        return self._current_params.copy()
+    def current_params(self) -> Mapping[str, Any]:
+        """Get a read-only view of the current parameter values."""
+        return MappingProxyType(self._current_params)
 
     # WebSocket management
 
@@ -176,7 +200,8 @@ class ServerState:
             websocket: The WebSocket connection.
         """
         self._connections.discard(websocket)
-        self._subscriptions.pop(websocket, None)
+        for tensor_id in self._subscriptions.pop(websocket, ()):
+            self._remove_subscriber(tensor_id, websocket)
 
     def subscribe(self, websocket: WebSocket, tensor_id: str) -> None:
         """Subscribe a connection to tensor updates.
@@ -187,6 +212,7 @@ class ServerState:
         """
         if websocket in self._subscriptions:
             self._subscriptions[websocket].add(tensor_id)
+            self._tensor_subscribers.setdefault(tensor_id, set()).add(websocket)
 
     def unsubscribe(self, websocket: WebSocket, tensor_id: str) -> None:
         """Unsubscribe a connection from tensor updates.
@@ -197,6 +223,15 @@ class ServerState:
         """
         if websocket in self._subscriptions:
             self._subscriptions[websocket].discard(tensor_id)
+            self._remove_subscriber(tensor_id, websocket)
+
+    def _remove_subscriber(self, tensor_id: str, websocket: WebSocket) -> None:
+        """Drop a connection from the reverse index entry of a tensor."""
+        subscribers = self._tensor_subscribers.get(tensor_id)
+        if subscribers is not None:
+            subscribers.discard(websocket)
+            if not subscribers:
+                del self._tensor_subscribers[tensor_id]
 
     def get_subscriptions(self, websocket: WebSocket) -> Set[str]:
         """Get all tensor subscriptions for a connection.
@@ -220,29 +255,91 @@ class ServerState:
             tensor_id: The tensor ID that was updated.
             summary: The updated tensor summary.
         """
-        message = {
+        targets = self._tensor_subscribers.get(tensor_id)
+        if not targets:
+            return
+
+        # Encoded once for all subscribers
+        text = encode_message({
             "type": "tensor_update",
             "tensor_id": tensor_id,
             "summary": summary.to_dict(),
-        }
+        })
+        await self._send_all({ws: [text] for ws in targets})
 
-        disconnected: List[WebSocket] = []
+    async def broadcast_all_updates(self) -> None:
+        """Broadcast cached tensor updates to all subscribers.
+
+        Each connection receives a single tensors_update message with
+        "partial": true, holding the summaries of just the tensors it
+        subscribes to. Every summary is encoded once and spliced into each
+        message that includes it.
+        """
+        members: Dict[str, Optional[str]] = {}  # tensor_id -> '"id":{...}'
+        outgoing: Dict[WebSocket, List[str]] = {}
         for ws in self._connections:
-            if tensor_id in self._subscriptions.get(ws, set()):
-                try:
-                    await ws.send_json(message)
-                except Exception:
-                    disconnected.append(ws)
+            parts: List[str] = []
+            for tensor_id in self._subscriptions.get(ws, ()):
+                if tensor_id not in members:
+                    summary = self.get_tensor_summary(tensor_id)
+                    members[tensor_id] = (
+                        None
+                        if summary is None
+                        else encode_message({tensor_id: summary.to_dict()})[1:-1]
+                    )
+                part = members[tensor_id]
+                if part is not None:
+                    parts.append(part)
+            if parts:
+                outgoing[ws] = [
+                    '{"type":"tensors_update","partial":true,"tensors":{'
+                    + ",".join(parts)
+                    + "}}"
+                ]
+        await self._send_all(outgoing)
+
+    async def _send_all(self, outgoing: Dict[WebSocket, List[str]]) -> None:
+        """Send messages to many connections concurrently.
+
+        Each connection receives its messages in order, while connections
+        are written to concurrently in batches of _BROADCAST_BATCH,
+        yielding to the event loop between batches. Connections whose send
+        fails are disconnected.
+
+        Args:
+            outgoing: Encoded messages to send, by connection.
+        """
+        items = list(outgoing.items())
+        disconnected: List[WebSocket] = []
+        for start in range(0, len(items), _BROADCAST_BATCH):
+            if start:
+                await asyncio.sleep(0)
+            batch = items[start : start + _BROADCAST_BATCH]
+            results = await asyncio.gather(
+                *(_send_texts(ws, texts) for ws, texts in batch),
+                return_exceptions=True,
+            )
+            disconnected.extend(
+                ws
+                for (ws, _), result in zip(batch, results)
+                if isinstance(result, Exception)
+            )
 
         # Clean up disconnected clients
         for ws in disconnected:
             self.disconnect(ws)
 
-    async def broadcast_all_updates(self) -> None:
-        """Broadcast all cached tensor updates to all subscribers."""
-        for tensor_id, summary in self._summary_cache.items():
-            await self.broadcast_tensor_update(tensor_id, summary)
+
+async def _send_texts(websocket: WebSocket, texts: List[str]) -> None:
+    """Send text frames to one connection in order."""
+    for text in texts:
+        await websocket.send_text(text)
 
 
 # Global singleton instance
 state = ServerState()
+
+
+def get_state() -> ServerState:
+    """Return the global server state, e.g. for FastAPI's Depends()."""
+    return state
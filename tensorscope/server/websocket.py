@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict
 
 from fastapi import WebSocket, WebSocketDisconnect
 
-from .state import state
-from .schemas import TensorSummaryResponse
+from .state import encode_message, state
 
 
 async def handle_websocket(websocket: WebSocket) -> None:
@@ -18,10 +17,13 @@ async def handle_websocket(websocket: WebSocket) -> None:
         Client -> Server:
             { "type": "subscribe", "tensor_id": "..." }
             { "type": "unsubscribe", "tensor_id": "..." }
-            { "type": "update_param", "scenario_id": "...", "param": "...", "value": ... }
+            { "type": "update_param", "scenario_id": "...", "param": "...", "value": ...,
+              "stream": false }
 
         Server -> Client:
             { "type": "tensor_update", "tensor_id": "...", "summary": {...} }
+            { "type": "tensors_update", "tensors": {...}, "partial": true }
+            { "type": "stream_end", "count": ... }
             { "type": "error", "message": "..." }
 
     Args:
@@ -41,21 +43,18 @@ async def handle_websocket(websocket: WebSocket) -> None:
                 continue
 
             msg_type = message.get("type")
-
-            if msg_type == "subscribe":
-                await handle_subscribe(websocket, message)
-            elif msg_type == "unsubscribe":
-                await handle_unsubscribe(websocket, message)
-            elif msg_type == "update_param":
-                await handle_update_param(websocket, message)
-            else:
+            handler = _HANDLERS.get(msg_type) if isinstance(msg_type, str) else None
+            if handler is None:
                 await send_error(websocket, f"Unknown message type: {msg_type}")
+                continue
+            await handler(websocket, message)
 
     except WebSocketDisconnect:
+        pass
+    finally:
+        # Also runs on errors and task cancellation, which is not an
+        # Exception, so closed connections never stay registered
         state.disconnect(websocket)
-    except Exception as e:
-        state.disconnect(websocket)
-        raise
 
 
 async def handle_subscribe(websocket: WebSocket, message: Dict[str, Any]) -> None:
@@ -97,7 +96,11 @@ async def handle_update_param(websocket: WebSocket, message: Dict[str, Any]) ->
     """Handle a parameter update message.
 
     This triggers a scenario re-run with updated parameters and sends
-    the updated tensor summaries back to the requesting client.
+    the updated tensor summaries back to the requesting client: in one
+    tensors_update message, or with "stream": true as one tensor_update
+    message per tensor followed by a stream_end message with their count.
+    Streamed summaries come from the completed run, so a later update
+    cannot interleave with them.
 
     Args:
         websocket: The WebSocket connection.
@@ -117,16 +120,22 @@ async def handle_update_param(websocket: WebSocket, message: Dict[str, Any]) ->
         await send_error(websocket, "Missing value in update_param message")
         return
 
-    # Get current parameters and update
-    current_params = state.current_params
-    current_params[param_name] = param_value
+    # Current parameters with the update applied
+    current_params = {**state.current_params, param_name: param_value}
 
     try:
         # Re-run scenario with updated parameters
         summaries = state.run_scenario(scenario_id, current_params)
 
-        # Send bulk update with all tensors to requesting client
-        await send_tensors_update(websocket, summaries)
+        if message.get("stream"):
+            for key, summary in summaries.items():
+                await send_tensor_update(websocket, key, summary)
+            await send_message(
+                websocket, {"type": "stream_end", "count": len(summaries)}
+            )
+        else:
+            # Send bulk update with all tensors to requesting client
+            await send_tensors_update(websocket, summaries)
 
         # Also broadcast to other subscribed clients
         await state.broadcast_all_updates()
@@ -135,6 +144,14 @@ async def handle_update_param(websocket: WebSocket, message: Dict[str, Any]) ->
         await send_error(websocket, str(e))
 
 
+# Client message handlers by message type
+_HANDLERS: Dict[str, Callable[[WebSocket, Dict[str, Any]], Awaitable[None]]] = {
+    "subscribe": handle_subscribe,
+    "unsubscribe": handle_unsubscribe,
+    "update_param": handle_update_param,
+}
+
+
 async def send_tensor_update(
     websocket: WebSocket,
     tensor_id: str,
@@ -147,21 +164,10 @@ async def send_tensor_update(
         tensor_id: The tensor ID.
         summary: The tensor summary.
     """
-    response = TensorSummaryResponse(
-        id=summary.id,
-        name=summary.name,
-        kind=summary.kind,
-        tags=summary.tags,
-        shape=list(summary.shape),
-        dtype=summary.dtype,
-        stats=summary.stats,
-        recommended_views=summary.recommended_views,
-    )
-
-    await websocket.send_json({
+    await send_message(websocket, {
         "type": "tensor_update",
         "tensor_id": tensor_id,
-        "summary": response.model_dump(),
+        "summary": summary.to_dict(),
     })
 
 
@@ -175,21 +181,9 @@ async def send_tensors_update(
         websocket: The WebSocket connection.
         summaries: Dict of tensor key to TensorSummary.
     """
-    tensors_dict = {}
-    for key, summary in summaries.items():
-        response = TensorSummaryResponse(
-            id=summary.id,
-            name=summary.name,
-            kind=summary.kind,
-            tags=summary.tags,
-            shape=list(summary.shape),
-            dtype=summary.dtype,
-            stats=summary.stats,
-            recommended_views=summary.recommended_views,
-        )
-        tensors_dict[key] = response.model_dump()
-
-    await websocket.send_json({
+    tensors_dict = {key: summary.to_dict() for key, summary in summaries.items()}
+
+    await send_message(websocket, {
         "type": "tensors_update",
         "tensors": tensors_dict,
     })
@@ -202,7 +196,17 @@ async def send_error(websocket: WebSocket, message: str) -> None:
         websocket: The WebSocket connection.
         message: The error message.
     """
-    await websocket.send_json({
+    await send_message(websocket, {
         "type": "error",
         "message": message,
     })
+
+
+async def send_message(websocket: WebSocket, message: Dict[str, Any]) -> None:
+    """Send a message as a JSON text frame, encoded with orjson if installed.
+
+    Args:
+        websocket: The WebSocket connection.
+        message: The message to send.
+    """
+    await websocket.send_text(encode_message(message))
@@ -1,5 +1,8 @@
 """Tests for core types: TrackedTensor, Operator, OperatorGraph."""
 
+import gc
+import weakref
+
 import numpy as np
 import pytest
 
@@ -62,6 +65,37 @@ class TestTrackedTensor:
         assert "psd" in tagged.tags
         assert tensor.id == tagged.id  # Same tensor, same ID
 
+    def test_data_is_read_only_and_contiguous(self):
+        """TrackedTensor stores its data as a read-only C-contiguous array."""
+        source = np.arange(6.0).reshape(2, 3)
+        tensor = TrackedTensor(data=source, name="M", kind=TensorKind.MATRIX)
+        transposed = TrackedTensor(data=source.T, name="Mt", kind=TensorKind.MATRIX)
+
+        with pytest.raises(ValueError):
+            tensor.data[0, 0] = 1.0
+        assert np.shares_memory(tensor.data, source)
+        assert source.flags.writeable
+        assert transposed.data.flags.c_contiguous
+        assert np.array_equal(transposed.data, source.T)
+
+    def test_ids_are_unique(self):
+        """Each new TrackedTensor gets a distinct ID."""
+        tensors = [
+            TrackedTensor(data=np.zeros(1), name="z", kind=TensorKind.VECTOR)
+            for _ in range(100)
+        ]
+
+        assert len({t.id for t in tensors}) == 100
+
+    def test_tensor_is_immutable(self):
+        """TrackedTensor fields cannot be reassigned."""
+        import dataclasses
+
+        tensor = TrackedTensor(data=np.eye(2), name="I", kind=TensorKind.MATRIX)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            tensor.name = "renamed"
+
 
 class TestTensorSummary:
     """Tests for compute_summary()."""
@@ -101,6 +135,50 @@ class TestTensorSummary:
         assert "heatmap" in summary.recommended_views
         assert "ellipse_2d" in summary.recommended_views
 
+    def test_summary_cache_releases_data(self, monkeypatch):
+        """Cached summaries do not keep dropped tensors' data alive."""
+        # A fully computed summary no longer references its tensor
+        tensor = TrackedTensor(
+            data=np.arange(16.0).reshape(4, 4), name="M", kind=TensorKind.MATRIX
+        )
+        compute_summary(tensor).to_dict()
+        ref = weakref.ref(tensor.data)
+        del tensor
+        gc.collect()
+        assert ref() is None
+
+        # Unread summaries are evicted once their data exceeds the byte bound
+        monkeypatch.setattr("tensorscope.core.tensor._SUMMARY_CACHE_MAX_BYTES", 1024)
+        refs = []
+        for _ in range(10):
+            tensor = TrackedTensor(
+                data=np.ones((8, 8)), name="M", kind=TensorKind.MATRIX
+            )
+            refs.append(weakref.ref(tensor.data))  # 512 bytes each
+            compute_summary(tensor)
+        del tensor
+        gc.collect()
+        assert sum(ref() is not None for ref in refs) <= 2
+
+    def test_summary_defers_decompositions(self, monkeypatch):
+        """compute_summary() runs no SVD until a stat or view needs one."""
+        calls = []
+        svd = np.linalg.svd
+
+        def counting_svd(*args, **kwargs):
+            calls.append(args[0].shape)
+            return svd(*args, **kwargs)
+
+        monkeypatch.setattr(np.linalg, "svd", counting_svd)
+        data = np.array([[4.0, 2.0], [2.0, 3.0]])
+        tensor = TrackedTensor(data=data, name="S", kind=TensorKind.MATRIX)
+        summary = compute_summary(tensor)
+        assert calls == []
+
+        # The eigenvalue view of a symmetric PSD matrix needs definiteness
+        assert "eigenvalues" in summary.recommended_views
+        assert calls == [(2, 2)]
+
     def test_condition_number(self):
         """compute_summary() computes condition number correctly."""
         # Diagonal matrix with known condition number
@@ -114,6 +192,172 @@ class TestTensorSummary:
 
         assert abs(summary.stats["condition_number"] - 10.0) < 1e-10
 
+    def test_condition_number_of_singular_matrix(self):
+        """Numerically singular matrices report an infinite condition number."""
+        v = np.array([1.0, 2.0, 3.0])
+        tensor = TrackedTensor(data=np.outer(v, v), name="vvT", kind=TensorKind.MATRIX)
+
+        assert compute_summary(tensor).stats["condition_number"] == float("inf")
+
+    def test_condition_number_of_ill_conditioned_float32(self):
+        """float32 matrices report condition numbers past 1 / eps(float32)."""
+        data = np.diag(np.array([1.0, 1e-7], dtype=np.float32))
+        tensor = TrackedTensor(data=data, name="D", kind=TensorKind.MATRIX)
+        cond = compute_summary(tensor).stats["condition_number"]
+
+        assert np.isclose(cond, 1.0 / np.float64(np.float32(1e-7)))
+
+    def test_from_array_stores_float32(self):
+        """from_array() stores float32 data but factorizes in float64."""
+        data = np.diag([4.0, 2.0, 1.0])
+        tensor = TrackedTensor.from_array(data, name="D", kind=TensorKind.MATRIX)
+        stats = compute_summary(tensor).stats
+
+        # float32 unless TENSORSCOPE_FORCE_FP64=1 is set
+        assert tensor.dtype == str(TrackedTensor.DEFAULT_DTYPE)
+        assert stats["rank"] == 3
+        assert stats["condition_number"] == 4.0
+        assert stats["is_positive_definite"]
+        exact = TrackedTensor.from_array(data, "D", TensorKind.MATRIX, dtype=np.float64)
+        assert exact.dtype == "float64"
+
+    def test_basic_stats_match_numpy(self):
+        """Fused summary statistics agree with the NumPy reductions."""
+        data = np.random.default_rng(0).standard_normal((40, 30)) + 3.0
+        data[0, :5] = 0.0
+        tensor = TrackedTensor(data=data, name="M", kind=TensorKind.MATRIX)
+        stats = compute_summary(tensor).stats
+
+        assert stats["min"] == np.min(data)
+        assert stats["max"] == np.max(data)
+        assert np.isclose(stats["mean"], np.mean(data))
+        assert np.isclose(stats["std"], np.std(data))
+        assert np.isclose(stats["norm"], np.linalg.norm(data))
+        assert stats["sparsity"] == 5 / data.size
+
+        # NaN and inf propagate as they do through the NumPy reductions
+        for values in ([1.0, np.nan, 3.0], [1.0, np.inf, 3.0], [np.nan, np.nan]):
+            vector = np.array(values)
+            tensor = TrackedTensor(data=vector, name="v", kind=TensorKind.VECTOR)
+            stats = compute_summary(tensor).stats
+            with np.errstate(invalid="ignore"):
+                expected = [
+                    np.min(vector),
+                    np.max(vector),
+                    np.mean(vector),
+                    np.std(vector),
+                    np.linalg.norm(vector),
+                ]
+            np.testing.assert_equal(
+                [stats[name] for name in ("min", "max", "mean", "std", "norm")],
+                expected,
+            )
+            assert stats["sparsity"] == 0.0
+
+    def test_singular_value_stats_consistent(self):
+        """Rank, condition number and spectrum come from the same SVD."""
+        data = np.diag([4.0, 2.0, 0.0])
+        tensor = TrackedTensor(data=data, name="D", kind=TensorKind.MATRIX)
+        stats = compute_summary(tensor).stats
+
+        assert stats["rank"] == np.linalg.matrix_rank(data)
+        assert stats["singular_values"] == [4.0, 2.0, 0.0]
+        assert stats["condition_number"] == float("inf")
+
+    def test_full_spectrum_for_large_matrix(self):
+        """full_spectrum=True reports singular values past the size cap."""
+        data = np.ones((2, 501))
+        tensor = TrackedTensor(data=data, name="wide", kind=TensorKind.MATRIX)
+
+        assert "singular_values" not in compute_summary(tensor).stats
+        summary = compute_summary(tensor, full_spectrum=True)
+        assert len(summary.stats["singular_values"]) == 2
+
+    def test_symmetry_tolerance_matches_allclose(self):
+        """is_symmetric uses the same tolerance as np.allclose."""
+        nearly = np.array([[2.0, 1.0], [1.0 + 1e-9, 3.0]])
+        skewed = np.array([[2.0, 1.0], [1.1, 3.0]])
+        # Larger than one comparison tile, with the mismatch far off-diagonal
+        large = np.eye(70)
+        large[3, 65] = 1e-3
+        # NaN never compares close, on or off the diagonal
+        nan_diagonal = np.array([[np.nan, 1.0], [1.0, 2.0]])
+        nan_pair = np.array([[2.0, np.nan], [np.nan, 3.0]])
+
+        for data in (nearly, skewed, large, large + large.T, nan_diagonal, nan_pair):
+            tensor = TrackedTensor(data=data, name="S", kind=TensorKind.MATRIX)
+            stats = compute_summary(tensor).stats
+            assert stats["is_symmetric"] == np.allclose(data, data.T)
+
+    def test_definiteness_stats(self):
+        """Definiteness and extreme eigenvalues match eigvalsh."""
+        cases = {
+            "pd": np.array([[4.0, 1.0], [1.0, 3.0]]),
+            "psd": np.array([[1.0, 1.0], [1.0, 1.0]]),
+            "indefinite": np.array([[1.0, 2.0], [2.0, 1.0]]),
+        }
+        for name, data in cases.items():
+            tensor = TrackedTensor(data=data, name=name, kind=TensorKind.MATRIX)
+            stats = compute_summary(tensor).stats
+            eigvals = np.linalg.eigvalsh(data)
+
+            assert stats["is_positive_definite"] == (name == "pd")
+            assert stats["is_positive_semidefinite"] == (name != "indefinite")
+            assert np.isclose(stats["min_eigenvalue"], eigvals[0], atol=1e-12)
+            assert np.isclose(stats["max_eigenvalue"], eigvals[-1])
+
+    def test_stats_computed_on_demand(self, monkeypatch):
+        """Reading elementwise stats does not run matrix decompositions."""
+        svd_calls = []
+        svd = np.linalg.svd
+
+        def counting_svd(*args, **kwargs):
+            svd_calls.append(args)
+            return svd(*args, **kwargs)
+
+        monkeypatch.setattr(np.linalg, "svd", counting_svd)
+        data = np.arange(12.0).reshape(3, 4)
+        tensor = TrackedTensor(data=data, name="M", kind=TensorKind.MATRIX)
+        summary = compute_summary(tensor)
+
+        assert summary.select_stats(["mean", "norm"]) == {
+            "mean": 5.5,
+            "norm": float(np.linalg.norm(data)),
+        }
+        assert svd_calls == []
+        assert summary.stats["rank"] == 2
+        assert len(svd_calls) == 1
+
+    def test_compact_export(self):
+        """to_dict() rounds floats and truncates the spectrum."""
+        data = np.diag(np.linspace(1.0, 2.0, 100)) / 3.0
+        tensor = TrackedTensor(data=data, name="D", kind=TensorKind.MATRIX)
+        summary = compute_summary(tensor)
+
+        exported = summary.to_dict()["stats"]
+        assert len(exported["singular_values"]) == 64
+        assert exported["singular_values"][0] == float(f"{2.0 / 3.0:.7g}")
+        assert exported["rank"] == 100
+        assert len(summary.stats["singular_values"]) == 100
+
+    def test_export_is_cached(self):
+        """to_dict() builds the full export once; selections are fresh."""
+        tensor = TrackedTensor(data=np.eye(2), name="I", kind=TensorKind.MATRIX)
+        summary = compute_summary(tensor)
+
+        assert summary.to_dict() is summary.to_dict()
+        assert summary.to_dict(["mean"])["stats"] == {"mean": 0.5}
+        assert "rank" in summary.to_dict()["stats"]
+
+    def test_summary_is_cached(self):
+        """compute_summary() reuses results for the same tensor and data."""
+        tensor = TrackedTensor(data=np.eye(3), name="I", kind=TensorKind.MATRIX)
+
+        assert compute_summary(tensor) is compute_summary(tensor)
+
+        retagged = tensor.with_tags("identity")
+        assert compute_summary(retagged).tags == ["identity"]
+
 
 class TestOperator:
     """Tests for Operator ABC."""
@@ -205,6 +449,22 @@ class TestOperator:
         assert not is_valid
         assert "dimension" in error
 
+    def test_batched_tensor_spec_validation(self):
+        """Batched specs accept leading dimensions and check trailing ones."""
+        spec = TensorSpec(name="stack", shape=(-1, 2), batched=True)
+
+        def tensor(shape):
+            return TrackedTensor(
+                data=np.zeros(shape), name="t", kind=TensorKind.MATRIX
+            )
+
+        assert spec.validate(tensor((5, 2)))[0]
+        assert spec.validate(tensor((4, 5, 2)))[0]
+        is_valid, error = spec.validate(tensor((4, 5, 3)))
+        assert not is_valid
+        assert "dimension 2" in error
+        assert not TensorSpec(name="m", shape=(-1, 2)).validate(tensor((4, 5, 2)))[0]
+
 
 class TestOperatorGraph:
     """Tests for OperatorGraph."""
@@ -345,6 +605,402 @@ class TestOperatorGraph:
         assert "_input.x" in all_tensors
         assert "node1.output" in all_tensors
 
+    def test_execute_after_graph_edit(self):
+        """Editing the graph after execution invalidates the cached plan."""
+
+        class DoubleOperator(Operator):
+            @property
+            def name(self) -> str:
+                return "double"
+
+            @property
+            def input_specs(self) -> dict[str, TensorSpec]:
+                return {"input": TensorSpec(name="input")}
+
+            @property
+            def output_specs(self) -> dict[str, TensorSpec]:
+                return {"output": TensorSpec(name="output")}
+
+            def forward(
+                self, inputs: dict[str, TrackedTensor]
+            ) -> dict[str, TrackedTensor]:
+                inp = inputs["input"]
+                return {
+                    "output": TrackedTensor(
+                        data=inp.data * 2,
+                        name=f"2*{inp.name}",
+                        kind=inp.kind,
+                    )
+                }
+
+        graph = OperatorGraph()
+        graph.add_node(DoubleOperator(), "first")
+        graph.connect("_input", "x", "first", "input")
+
+        x = TrackedTensor(
+            data=np.array([1.0, 2.0]),
+            name="x",
+            kind=TensorKind.VECTOR,
+        )
+        results = graph.execute({"x": x})
+        assert "second.output" not in results
+
+        graph.add_node(DoubleOperator(), "second")
+        graph.connect("first", "output", "second", "input")
+
+        results = graph.execute({"x": x})
+        assert np.array_equal(results["second.output"].data, np.array([4.0, 8.0]))
+
+    def test_missing_input_raises(self):
+        """Executing without a required graph input raises ValueError."""
+
+        class IdentityOperator(Operator):
+            @property
+            def name(self) -> str:
+                return "identity"
+
+            @property
+            def input_specs(self) -> dict[str, TensorSpec]:
+                return {"input": TensorSpec(name="input")}
+
+            @property
+            def output_specs(self) -> dict[str, TensorSpec]:
+                return {"output": TensorSpec(name="output")}
+
+            def forward(
+                self, inputs: dict[str, TrackedTensor]
+            ) -> dict[str, TrackedTensor]:
+                return {"output": inputs["input"]}
+
+        graph = OperatorGraph()
+        graph.add_node(IdentityOperator(), "node1")
+        graph.connect("_input", "x", "node1", "input")
+
+        with pytest.raises(ValueError, match="Missing tensor '_input.x'"):
+            graph.execute({})
+
+    def test_duplicate_connect_is_ignored(self):
+        """Connecting the same ports twice stores a single edge."""
+
+        class IdentityOperator(Operator):
+            @property
+            def name(self) -> str:
+                return "identity"
+
+            @property
+            def input_specs(self) -> dict[str, TensorSpec]:
+                return {"input": TensorSpec(name="input")}
+
+            @property
+            def output_specs(self) -> dict[str, TensorSpec]:
+                return {"output": TensorSpec(name="output")}
+
+            def forward(
+                self, inputs: dict[str, TrackedTensor]
+            ) -> dict[str, TrackedTensor]:
+                return {"output": inputs["input"]}
+
+        graph = OperatorGraph()
+        graph.add_node(IdentityOperator(), "node1")
+        graph.connect("_input", "x", "node1", "input")
+        graph.connect("_input", "x", "node1", "input")
+
+        assert len(graph.get_edges()) == 1
+
+    def test_validation_rechecked_on_new_input_kind(self):
+        """A node re-validates when its input kind or shape changes."""
+
+        class VectorIdentity(Operator):
+            @property
+            def name(self) -> str:
+                return "vector_identity"
+
+            @property
+            def input_specs(self) -> dict[str, TensorSpec]:
+                return {"input": TensorSpec(name="input", kind=TensorKind.VECTOR)}
+
+            @property
+            def output_specs(self) -> dict[str, TensorSpec]:
+                return {"output": TensorSpec(name="output")}
+
+            def forward(
+                self, inputs: dict[str, TrackedTensor]
+            ) -> dict[str, TrackedTensor]:
+                return {"output": inputs["input"]}
+
+        graph = OperatorGraph()
+        graph.add_node(VectorIdentity(), "node1")
+        graph.connect("_input", "x", "node1", "input")
+
+        vector = TrackedTensor(
+            data=np.array([1.0, 2.0]),
+            name="v",
+            kind=TensorKind.VECTOR,
+        )
+        matrix = TrackedTensor(
+            data=np.eye(2),
+            name="M",
+            kind=TensorKind.MATRIX,
+        )
+        graph.execute({"x": vector})
+        graph.execute({"x": vector})
+
+        with pytest.raises(ValueError, match="expected kind"):
+            graph.execute({"x": matrix})
+
+        # Validation can be skipped entirely
+        results = graph.execute({"x": matrix}, validate=False)
+        assert results["node1.output"] is matrix
+
+    def test_compile_numba(self):
+        """compile_numba() fuses kernel-providing operators into one function."""
+        numba = pytest.importorskip("numba")
+
+        class AddOneOperator(Operator):
+            @property
+            def name(self) -> str:
+                return "add_one"
+
+            @property
+            def input_specs(self) -> dict[str, TensorSpec]:
+                return {"input": TensorSpec(name="input")}
+
+            @property
+            def output_specs(self) -> dict[str, TensorSpec]:
+                return {"output": TensorSpec(name="output")}
+
+            def forward(
+                self, inputs: dict[str, TrackedTensor]
+            ) -> dict[str, TrackedTensor]:
+                inp = inputs["input"]
+                return {
+                    "output": TrackedTensor(
+                        data=inp.data + 1,
+                        name=f"{inp.name}_plus_1",
+                        kind=inp.kind,
+                    )
+                }
+
+            def numba_kernel(self):
+                @numba.njit
+                def kernel(x):
+                    return (x + 1.0,)
+
+                return kernel
+
+        graph = OperatorGraph()
+        graph.add_node(AddOneOperator(), "first")
+        graph.add_node(AddOneOperator(), "second")
+        graph.connect("_input", "x", "first", "input")
+        graph.connect("first", "output", "second", "input")
+        graph.compile_numba()
+
+        x = TrackedTensor(
+            data=np.array([1.0, 2.0, 3.0]),
+            name="x",
+            kind=TensorKind.VECTOR,
+        )
+        results = graph.execute({"x": x})
+
+        assert results["_input.x"] is x
+        assert np.array_equal(results["first.output"].data, np.array([2.0, 3.0, 4.0]))
+        assert np.array_equal(results["second.output"].data, np.array([3.0, 4.0, 5.0]))
+        assert results["second.output"].kind == TensorKind.VECTOR
+
+        unconnected = OperatorGraph()
+        unconnected.add_node(AddOneOperator(), "first")
+        with pytest.raises(ValueError, match="'first'.*'input' is not connected"):
+            unconnected.compile_numba()
+
+    def test_compile_python(self):
+        """compile_python() runs the graph through generated code."""
+
+        class AddOneOperator(Operator):
+            @property
+            def name(self) -> str:
+                return "add_one"
+
+            @property
+            def input_specs(self) -> dict[str, TensorSpec]:
+                return {"input": TensorSpec(name="input", kind=TensorKind.VECTOR)}
+
+            @property
+            def output_specs(self) -> dict[str, TensorSpec]:
+                return {"output": TensorSpec(name="output")}
+
+            def forward(
+                self, inputs: dict[str, TrackedTensor]
+            ) -> dict[str, TrackedTensor]:
+                inp = inputs["input"]
+                return {
+                    "output": TrackedTensor(
+                        data=inp.data + 1, name=f"{inp.name}_plus_1", kind=inp.kind
+                    )
+                }
+
+        graph = OperatorGraph()
+        graph.add_node(AddOneOperator(), "first")
+        graph.add_node(AddOneOperator(), "second")
+        graph.connect("_input", "x", "first", "input")
+        graph.connect("first", "output", "second", "input")
+        graph.compile_python()
+
+        x = TrackedTensor(data=np.array([1.0, 2.0]), name="x", kind=TensorKind.VECTOR)
+        results = graph.execute({"x": x})
+
+        assert list(results) == ["_input.x", "first.output", "second.output"]
+        assert np.array_equal(results["second.output"].data, np.array([3.0, 4.0]))
+        assert graph.get_all_tensors()["first.output"] is results["first.output"]
+
+        # Validation still applies on the generated path
+        bad = TrackedTensor(data=np.eye(2), name="M", kind=TensorKind.MATRIX)
+        with pytest.raises(ValueError):
+            graph.execute({"x": bad})
+
+        # Editing the graph falls back to the interpreted plan
+        graph.add_node(AddOneOperator(), "third")
+        graph.connect("second", "output", "third", "input")
+        results = graph.execute({"x": x})
+        assert np.array_equal(results["third.output"].data, np.array([4.0, 5.0]))
+
+    @pytest.mark.parametrize("returned", [{}, {"output": 0, "extra": 0}])
+    @pytest.mark.parametrize("compiled", [False, True])
+    def test_outputs_must_match_output_specs(self, returned, compiled):
+        """A node returning missing or undeclared outputs raises ValueError."""
+
+        class MismatchedOperator(Operator):
+            @property
+            def name(self) -> str:
+                return "mismatched"
+
+            @property
+            def input_specs(self) -> dict[str, TensorSpec]:
+                return {"input": TensorSpec(name="input")}
+
+            @property
+            def output_specs(self) -> dict[str, TensorSpec]:
+                return {"output": TensorSpec(name="output")}
+
+            def forward(
+                self, inputs: dict[str, TrackedTensor]
+            ) -> dict[str, TrackedTensor]:
+                return {name: inputs["input"] for name in returned}
+
+        graph = OperatorGraph()
+        graph.add_node(MismatchedOperator(), "node")
+        graph.connect("_input", "x", "node", "input")
+        if compiled:
+            graph.compile_python()
+
+        x = TrackedTensor(data=np.array([1.0, 2.0]), name="x", kind=TensorKind.VECTOR)
+        with pytest.raises(ValueError, match="'node'.*do not match its output_specs"):
+            graph.execute({"x": x})
+
+    def test_execute_from_reuses_unchanged_nodes(self):
+        """execute_from() only recomputes nodes downstream of changed inputs."""
+        calls: list[str] = []
+
+        class CountingDouble(Operator):
+            @property
+            def name(self) -> str:
+                return "double"
+
+            @property
+            def tags(self) -> frozenset[str]:
+                return frozenset({"deterministic"})
+
+            @property
+            def input_specs(self) -> dict[str, TensorSpec]:
+                return {"input": TensorSpec(name="input")}
+
+            @property
+            def output_specs(self) -> dict[str, TensorSpec]:
+                return {"output": TensorSpec(name="output")}
+
+            def forward(
+                self, inputs: dict[str, TrackedTensor]
+            ) -> dict[str, TrackedTensor]:
+                inp = inputs["input"]
+                calls.append(inp.name)
+                return {
+                    "output": TrackedTensor(
+                        data=inp.data * 2, name=f"2*{inp.name}", kind=inp.kind
+                    )
+                }
+
+        graph = OperatorGraph()
+        graph.add_node(CountingDouble(), "dx")
+        graph.add_node(CountingDouble(), "dy")
+        graph.connect("_input", "x", "dx", "input")
+        graph.connect("_input", "y", "dy", "input")
+
+        x = TrackedTensor(data=np.array([1.0]), name="x", kind=TensorKind.VECTOR)
+        y = TrackedTensor(data=np.array([2.0]), name="y", kind=TensorKind.VECTOR)
+        first = graph.execute({"x": x, "y": y})
+        assert calls == ["x", "y"]
+
+        y2 = TrackedTensor(data=np.array([5.0]), name="y2", kind=TensorKind.VECTOR)
+        second = graph.execute_from({"y": y2})
+
+        assert calls == ["x", "y", "y2"]
+        assert second["dx.output"] is first["dx.output"]
+        assert second["dy.output"].data[0] == 10.0
+
+    def test_execute_memoized_matches_inputs_by_content(self):
+        """execute_memoized() reuses outputs for rebuilt but equal inputs."""
+
+        class Negate(Operator):
+            @property
+            def name(self) -> str:
+                return "negate"
+
+            @property
+            def tags(self) -> frozenset[str]:
+                return frozenset({"deterministic"})
+
+            @property
+            def input_specs(self) -> dict[str, TensorSpec]:
+                return {"input": TensorSpec(name="input")}
+
+            @property
+            def output_specs(self) -> dict[str, TensorSpec]:
+                return {"output": TensorSpec(name="output")}
+
+            def forward(
+                self, inputs: dict[str, TrackedTensor]
+            ) -> dict[str, TrackedTensor]:
+                inp = inputs["input"]
+                return {
+                    "output": TrackedTensor(
+                        data=-inp.data, name=f"-{inp.name}", kind=inp.kind
+                    )
+                }
+
+        graph = OperatorGraph()
+        graph.add_node(Negate(), "nx")
+        graph.add_node(Negate(), "ny")
+        graph.connect("_input", "x", "nx", "input")
+        graph.connect("_input", "y", "ny", "input")
+
+        def inputs(y_value: float) -> dict[str, TrackedTensor]:
+            return {
+                "x": TrackedTensor(
+                    data=np.array([1.0]), name="x", kind=TensorKind.VECTOR
+                ),
+                "y": TrackedTensor(
+                    data=np.array([y_value]), name="y", kind=TensorKind.VECTOR
+                ),
+            }
+
+        first = graph.execute_memoized(inputs(1.0))
+        second = graph.execute_memoized(inputs(3.0))
+        assert second["nx.output"] is first["nx.output"]
+        assert second["ny.output"].data[0] == -3.0
+
+        # Earlier results stay cached, not just the last execution's
+        third = graph.execute_memoized(inputs(1.0))
+        assert third["ny.output"] is first["ny.output"]
+
 
 class TestOperatorRegistry:
     """Tests for OperatorRegistry."""
@@ -377,3 +1033,129 @@ class TestOperatorRegistry:
 
         all_ops = OperatorRegistry.get_all()
         assert "test_op" in all_ops
+
+    def test_register_with_class_attribute_name(self):
+        """A class-level name attribute is used as the registry name."""
+        OperatorRegistry.clear()
+
+        @register_operator
+        class NamedOperator(Operator):
+            name = "named_op"
+
+            @property
+            def input_specs(self) -> dict[str, TensorSpec]:
+                return {}
+
+            @property
+            def output_specs(self) -> dict[str, TensorSpec]:
+                return {}
+
+            def forward(
+                self, inputs: dict[str, TrackedTensor]
+            ) -> dict[str, TrackedTensor]:
+                return {}
+
+        assert OperatorRegistry.get("named_op") is NamedOperator
+        assert NamedOperator().name == "named_op"
+
+    def test_kinded_visualizer_rule(self):
+        """Rules registered for a kind only apply to tensors of that kind."""
+        OperatorRegistry.add_visualizer_rule(
+            lambda t: True, ["custom_view"], kind=TensorKind.MATRIX
+        )
+        try:
+            matrix = TrackedTensor(
+                data=np.eye(2), name="M", kind=TensorKind.MATRIX
+            )
+            vector = TrackedTensor(
+                data=np.ones(2), name="v", kind=TensorKind.VECTOR
+            )
+
+            matrix_views = OperatorRegistry.get_recommended_visualizers(matrix)
+            vector_views = OperatorRegistry.get_recommended_visualizers(vector)
+
+            assert matrix_views == ["heatmap", "custom_view"]
+            assert "custom_view" not in vector_views
+        finally:
+            OperatorRegistry._kinded_visualizer_rules.pop(TensorKind.MATRIX)
+
+
+class TestClassLevelSpecs:
+    """Tests for operators declaring specs and tags as class attributes."""
+
+    def test_class_level_declarations(self):
+        """Class-level declarations back the spec, tag and name properties."""
+
+        class NegateOperator(Operator):
+            __slots__ = ()
+
+            _NAME = "negate"
+            _DESCRIPTION = "Negation: B = -A"
+            _INPUT_SPECS = {"input": TensorSpec(name="input")}
+            _OUTPUT_SPECS = {"output": TensorSpec(name="output")}
+            _TAGS = {"linear", "deterministic"}
+
+            def forward(
+                self, inputs: dict[str, TrackedTensor]
+            ) -> dict[str, TrackedTensor]:
+                inp = inputs["input"]
+                return {
+                    "output": TrackedTensor(
+                        data=-inp.data, name=f"-{inp.name}", kind=inp.kind
+                    )
+                }
+
+        class OtherOperator(NegateOperator):
+            __slots__ = ()
+            _TAGS = frozenset({"deterministic", "linear"})
+
+        first, second = NegateOperator(), NegateOperator()
+        assert (first.name, first.description) == ("negate", "Negation: B = -A")
+        assert first.input_specs is second.input_specs
+        assert list(first.output_specs) == ["output"]
+        assert first.tags == frozenset({"linear", "deterministic"})
+        assert OtherOperator().tags is first.tags
+
+        x = TrackedTensor(data=np.array([1.0]), name="x", kind=TensorKind.VECTOR)
+        assert first({"input": x})["output"].data[0] == -1.0
+
+    def test_positional_forward(self):
+        """_forward_fast() backs forward() and compiled graph execution."""
+        calls: list[tuple[str, str | None]] = []
+
+        class ShiftOperator(Operator):
+            __slots__ = ()
+
+            _INPUT_SPECS = {
+                "input": TensorSpec(name="input"),
+                "offset": TensorSpec(name="offset", optional=True),
+            }
+            _OUTPUT_SPECS = {"output": TensorSpec(name="output")}
+
+            @property
+            def name(self) -> str:
+                return "shift"
+
+            def _forward_fast(
+                self, input: TrackedTensor, offset: TrackedTensor | None = None
+            ) -> dict[str, TrackedTensor]:
+                calls.append((input.name, offset and offset.name))
+                shift = 1.0 if offset is None else offset.data
+                return {
+                    "output": TrackedTensor(
+                        data=input.data + shift, name="shifted", kind=input.kind
+                    )
+                }
+
+        x = TrackedTensor(data=np.array([1.0]), name="x", kind=TensorKind.VECTOR)
+        assert ShiftOperator()({"input": x})["output"].data[0] == 2.0
+        assert ShiftOperator()({"input": x, "offset": x})["output"].data[0] == 2.0
+
+        graph = OperatorGraph()
+        graph.add_node(ShiftOperator(), "shift")
+        graph.connect("_input", "x", "shift", "input")
+        graph.compile_python()
+        results = graph.execute({"x": x})
+
+        assert results["shift.output"].data[0] == 2.0
+        assert calls == [("x", None), ("x", "x"), ("x", None)]
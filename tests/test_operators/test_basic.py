@@ -1,9 +1,12 @@
 """Tests for basic linear algebra operators."""
 
+import math
+
 import numpy as np
 import pytest
 
 from tensorscope.core.tensor import TrackedTensor, TensorKind
+from tensorscope.operators._kernels import HAVE_NUMBA
 from tensorscope.operators import (
     MatMul,
     Transpose,
@@ -28,48 +31,90 @@ from tensorscope.operators import (
 # ============================================================================
 
 
+def _frozen(values, dtype=np.float64):
+    """Build a read-only array, which TrackedTensor stores as is."""
+    array = np.array(values, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+# Fixture data, built once; each fixture wraps it in a fresh TrackedTensor
+_MATRIX_3X2 = _frozen([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+_MATRIX_2X3 = _frozen([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+_MATRIX_2X2 = _frozen([[4.0, 2.0], [2.0, 3.0]])  # Symmetric positive definite
+# SPD matrix: A A^T + I
+_MATRIX_3X3_SYMMETRIC = _frozen(_MATRIX_3X2 @ _MATRIX_3X2.T + np.eye(3))
+_VECTOR_3 = _frozen([1.0, 2.0, 3.0])
+# Single precision copies for tests that only check shapes and tags
+_MATRIX_3X2_F32 = _frozen(_MATRIX_3X2, dtype=np.float32)
+_MATRIX_2X2_F32 = _frozen(_MATRIX_2X2, dtype=np.float32)
+_VECTOR_2 = _frozen([1.0, 2.0])
+# Normal equations of _MATRIX_3X2 and _VECTOR_3
+_ATA_3X2 = _frozen(_MATRIX_3X2.T @ _MATRIX_3X2)
+_ATB_3X2 = _frozen(_MATRIX_3X2.T @ _VECTOR_3)
+
+# Identity matrices for assertions
+_EYE = {n: _frozen(np.eye(n)) for n in (2, 3)}
+
+
 @pytest.fixture
 def matrix_3x2():
     """A 3x2 matrix for testing."""
-    data = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
-    return TrackedTensor(data=data, name="A", kind=TensorKind.MATRIX)
+    return TrackedTensor(data=_MATRIX_3X2, name="A", kind=TensorKind.MATRIX)
 
 
 @pytest.fixture
 def matrix_2x3():
     """A 2x3 matrix for testing."""
-    data = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
-    return TrackedTensor(data=data, name="B", kind=TensorKind.MATRIX)
+    return TrackedTensor(data=_MATRIX_2X3, name="B", kind=TensorKind.MATRIX)
 
 
 @pytest.fixture
 def matrix_2x2():
-    """A 2x2 matrix for testing."""
-    data = np.array([[4.0, 2.0], [2.0, 3.0]])  # Symmetric positive definite
-    return TrackedTensor(data=data, name="M", kind=TensorKind.MATRIX)
+    """A 2x2 symmetric positive definite matrix for testing."""
+    return TrackedTensor(data=_MATRIX_2X2, name="M", kind=TensorKind.MATRIX)
+
+
+@pytest.fixture
+def matrix_3x2_f32():
+    """matrix_3x2 in single precision, for shape and tag checks."""
+    return TrackedTensor(data=_MATRIX_3X2_F32, name="A", kind=TensorKind.MATRIX)
+
+
+@pytest.fixture
+def matrix_2x2_f32():
+    """matrix_2x2 in single precision, for shape and tag checks."""
+    return TrackedTensor(data=_MATRIX_2X2_F32, name="M", kind=TensorKind.MATRIX)
 
 
 @pytest.fixture
 def matrix_3x3_symmetric():
     """A 3x3 symmetric positive definite matrix."""
-    # Create SPD matrix: A^T A + I
-    A = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
-    data = A @ A.T + np.eye(3)
-    return TrackedTensor(data=data, name="S", kind=TensorKind.MATRIX)
+    return TrackedTensor(data=_MATRIX_3X3_SYMMETRIC, name="S", kind=TensorKind.MATRIX)
 
 
 @pytest.fixture
 def vector_3():
     """A 3-element vector."""
-    data = np.array([1.0, 2.0, 3.0])
-    return TrackedTensor(data=data, name="v", kind=TensorKind.VECTOR)
+    return TrackedTensor(data=_VECTOR_3, name="v", kind=TensorKind.VECTOR)
 
 
 @pytest.fixture
 def vector_2():
     """A 2-element vector."""
-    data = np.array([1.0, 2.0])
-    return TrackedTensor(data=data, name="u", kind=TensorKind.VECTOR)
+    return TrackedTensor(data=_VECTOR_2, name="u", kind=TensorKind.VECTOR)
+
+
+@pytest.fixture(scope="module")
+def lstsq_3x2():
+    """Reference least squares solution for matrix_3x2 and vector_3."""
+    return _frozen(np.linalg.lstsq(_MATRIX_3X2, _VECTOR_3, rcond=None)[0])
+
+
+@pytest.fixture(scope="module")
+def inv_2x2():
+    """Reference inverse of matrix_2x2, factorized once for all tests."""
+    return _frozen(np.linalg.inv(_MATRIX_2X2))
 
 
 # ============================================================================
@@ -121,6 +166,71 @@ class TestMatMul:
         assert "symmetric" in C.tags
         assert "psd" in C.tags
 
+    def test_gram_product_of_shared_transpose(self, matrix_3x2):
+        """Test A^T A where A^T comes from the Transpose operator."""
+        At = Transpose()({"A": matrix_3x2})["At"]
+        for A, B in ((At, matrix_3x2), (matrix_3x2, At)):
+            C = MatMul()({"A": A, "B": B})["C"]
+            np.testing.assert_allclose(C.data, A.data @ B.data)
+            assert np.array_equal(C.data, C.data.T)
+            assert "psd" in C.tags
+
+    def test_symmetry_tags_need_symmetric_structure(self):
+        """Test that only Gram products or symmetric inputs are tagged."""
+        S = np.array([[2.0, 1.0], [1.0, 2.0]])
+        sym = TrackedTensor(
+            data=S, name="S", kind=TensorKind.MATRIX, tags=frozenset({"symmetric"})
+        )
+        plain = TrackedTensor(
+            data=np.array([[1.0, 2.0], [0.0, 1.0]]), name="P", kind=TensorKind.MATRIX
+        )
+
+        op = MatMul()
+        assert "positive_definite" in op({"A": sym, "B": sym})["C"].tags
+        assert op({"A": plain, "B": plain})["C"].tags == frozenset()
+
+    def test_gemm_update(self, matrix_3x2, matrix_2x3):
+        """Test alpha * A @ B + beta * Y with the optional addend."""
+        Y = TrackedTensor(data=np.ones((3, 3)), name="Y", kind=TensorKind.MATRIX)
+        op = MatMul(alpha=2.0, beta=-0.5)
+        C = op({"A": matrix_3x2, "B": matrix_2x3, "Y": Y})["C"]
+
+        expected = 2.0 * matrix_3x2.data @ matrix_2x3.data - 0.5 * Y.data
+        np.testing.assert_allclose(C.data, expected)
+        assert C.name == "(2.0*A@B+-0.5*Y)"
+
+        # Without Y only alpha applies
+        scaled = op({"A": matrix_3x2, "B": matrix_2x3})["C"]
+        expected = 2.0 * matrix_3x2.data @ matrix_2x3.data
+        np.testing.assert_allclose(scaled.data, expected)
+
+    @pytest.mark.skipif(not HAVE_NUMBA, reason="numba not installed")
+    def test_tiled_matmul_fallback(self, monkeypatch):
+        """Test the blocked kernel used when NumPy lacks an optimized BLAS."""
+        from tensorscope.operators import basic
+
+        monkeypatch.setattr(basic, "_USE_TILED_MATMUL", True)
+        rng = np.random.default_rng(0)
+        a = rng.standard_normal((70, 40))
+        A = TrackedTensor(data=a, name="A", kind=TensorKind.MATRIX)
+        for b in (rng.standard_normal((40, 90)), rng.standard_normal(40)):
+            kind = TensorKind.MATRIX if b.ndim == 2 else TensorKind.VECTOR
+            B = TrackedTensor(data=b, name="B", kind=kind)
+            np.testing.assert_allclose(MatMul()({"A": A, "B": B})["C"].data, a @ b)
+
+    def test_specs_shared_across_instances(self):
+        """Test that operator specs and tags are built once per class."""
+        first, second = MatMul(), MatMul()
+        assert first.input_specs is second.input_specs
+        assert first.output_specs is second.output_specs
+        assert first.tags is Add().tags
+
+    def test_unexpected_input_raises(self, matrix_3x2, matrix_2x3):
+        """Test that inputs not declared in input_specs are rejected."""
+        op = MatMul()
+        with pytest.raises(ValueError, match="Unexpected inputs"):
+            op({"A": matrix_3x2, "B": matrix_2x3, "C": matrix_2x3})
+
 
 class TestTranspose:
     """Tests for Transpose operator."""
@@ -132,7 +242,17 @@ class TestTranspose:
 
         At = result["At"]
         assert At.shape == (2, 3)
-        np.testing.assert_allclose(At.data, matrix_3x2.data.T)
+        np.testing.assert_array_equal(At.data, matrix_3x2.data.T)
+
+    def test_transpose_is_shared(self, matrix_3x2):
+        """Test that repeated transposes of one array share a single copy."""
+        op = Transpose()
+        first = op({"A": matrix_3x2})["At"]
+        second = op({"A": matrix_3x2})["At"]
+
+        assert first.data is second.data
+        assert first.data.flags.c_contiguous
+        assert not first.data.flags.writeable
 
     def test_transpose_preserves_tags(self):
         """Test that transpose preserves relevant tags."""
@@ -161,7 +281,7 @@ class TestNorm:
 
         norm = result["norm"]
         expected = np.linalg.norm(matrix_3x2.data, ord="fro")
-        np.testing.assert_allclose(norm.data, expected)
+        assert math.isclose(norm.data, expected, rel_tol=1e-7)
         assert "scalar" in norm.tags
         assert "non_negative" in norm.tags
 
@@ -171,7 +291,30 @@ class TestNorm:
         result = op({"A": vector_3})
 
         expected = np.linalg.norm(vector_3.data, ord=2)
-        np.testing.assert_allclose(result["norm"].data, expected)
+        assert math.isclose(result["norm"].data, expected, rel_tol=1e-7)
+
+    @pytest.mark.parametrize(
+        "ord, numpy_ord", [("l1", 1), ("l2", 2), ("linf", np.inf), ("nuc", "nuc")]
+    )
+    def test_matrix_norms(self, matrix_3x2, ord, numpy_ord):
+        """Test that matrix norms keep np.linalg.norm semantics."""
+        result = Norm(ord=ord)({"A": matrix_3x2})
+
+        expected = np.linalg.norm(matrix_3x2.data, ord=numpy_ord)
+        assert math.isclose(result["norm"].data, expected, rel_tol=1e-7)
+
+    @pytest.mark.parametrize(
+        "values, dtype", [([100, 100, 100], np.int8), ([3e9, 4e9], np.int64)]
+    )
+    @pytest.mark.parametrize("ord", ["fro", "l2"])
+    def test_integer_input_does_not_overflow(self, values, dtype, ord):
+        """Test that integer data is not squared in its own dtype."""
+        data = np.array(values, dtype=dtype)
+        A = TrackedTensor(data=data, name="v", kind=TensorKind.VECTOR)
+        result = Norm(ord=ord)({"A": A})
+
+        expected = np.linalg.norm(data.astype(np.float64))
+        assert math.isclose(result["norm"].data, expected, rel_tol=1e-7)
 
 
 class TestAdd:
@@ -184,7 +327,7 @@ class TestAdd:
 
         C = result["C"]
         expected = matrix_3x2.data + matrix_3x2.data
-        np.testing.assert_allclose(C.data, expected)
+        np.testing.assert_array_equal(C.data, expected)
 
     def test_add_vectors(self, vector_3):
         """Test vector addition."""
@@ -193,7 +336,18 @@ class TestAdd:
 
         C = result["C"]
         assert C.kind == TensorKind.VECTOR
-        np.testing.assert_allclose(C.data, vector_3.data * 2)
+        np.testing.assert_array_equal(C.data, vector_3.data * 2)
+
+    def test_symmetric_sum_tagged(self, matrix_3x3_symmetric):
+        """Test that symmetric sums are tagged and asymmetric ones are not."""
+        upper = TrackedTensor(
+            data=np.triu(np.ones((3, 3))), name="U", kind=TensorKind.MATRIX
+        )
+        op = Add()
+
+        sym_sum = op({"A": matrix_3x3_symmetric, "B": matrix_3x3_symmetric})["C"]
+        assert "symmetric" in sym_sum.tags
+        assert "symmetric" not in op({"A": matrix_3x3_symmetric, "B": upper})["C"].tags
 
 
 class TestSubtract:
@@ -205,7 +359,8 @@ class TestSubtract:
         result = op({"A": matrix_3x2, "B": matrix_3x2})
 
         C = result["C"]
-        np.testing.assert_allclose(C.data, np.zeros_like(matrix_3x2.data))
+        assert C.shape == matrix_3x2.shape
+        assert not C.data.any()
 
 
 class TestScale:
@@ -217,7 +372,16 @@ class TestScale:
         result = op({"A": matrix_3x2})
 
         B = result["B"]
-        np.testing.assert_allclose(B.data, 2.5 * matrix_3x2.data)
+        np.testing.assert_array_equal(B.data, 2.5 * matrix_3x2.data)
+
+    @pytest.mark.parametrize("alpha", [1.0, -1.0])
+    def test_scale_shortcuts(self, matrix_3x2, alpha):
+        """Test that unit scale factors match plain multiplication."""
+        B = Scale(alpha=alpha)({"A": matrix_3x2})["B"]
+        np.testing.assert_array_equal(B.data, alpha * matrix_3x2.data)
+
+        ints = TrackedTensor(data=np.arange(4), name="n", kind=TensorKind.VECTOR)
+        assert Scale(alpha=alpha)({"A": ints})["B"].dtype == "float64"
 
 
 # ============================================================================
@@ -228,10 +392,10 @@ class TestScale:
 class TestSVD:
     """Tests for SVD operator."""
 
-    def test_svd_shapes(self, matrix_3x2):
+    def test_svd_shapes(self, matrix_3x2_f32):
         """Test SVD output shapes."""
         op = SVD()
-        result = op({"A": matrix_3x2})
+        result = op({"A": matrix_3x2_f32})
 
         U = result["U"]
         S = result["S"]
@@ -251,19 +415,57 @@ class TestSVD:
         S = result["S"].data
         Vt = result["Vt"].data
 
-        reconstructed = U @ np.diag(S) @ Vt
+        reconstructed = (U * S) @ Vt
         np.testing.assert_allclose(reconstructed, matrix_3x2.data, atol=1e-10)
 
-    def test_svd_tags(self, matrix_3x2):
+    def test_svd_tags(self, matrix_3x2_f32):
         """Test that SVD outputs have correct tags."""
         op = SVD()
-        result = op({"A": matrix_3x2})
+        result = op({"A": matrix_3x2_f32})
 
         assert "orthogonal" in result["U"].tags
         assert "orthogonal" in result["Vt"].tags
         assert "singular_values" in result["S"].tags
         assert "sorted_descending" in result["S"].tags
 
+    @pytest.mark.parametrize("shape", [(40, 30), (6, 5)])
+    def test_truncated_svd(self, shape):
+        """Test that k keeps the leading singular triples in order."""
+        data = np.random.default_rng(0).standard_normal(shape)
+        A = TrackedTensor(data=data, name="A", kind=TensorKind.MATRIX)
+        result = SVD(k=2)({"A": A})
+
+        U, S, Vt = (result[name].data for name in ("U", "S", "Vt"))
+        expected = np.linalg.svd(data, compute_uv=False)[:2]
+        np.testing.assert_allclose(S, expected)
+        assert U.shape == (shape[0], 2)
+        assert Vt.shape == (2, shape[1])
+        np.testing.assert_allclose(U.T @ data @ Vt.T, np.diag(S), atol=1e-10)
+
+    @pytest.mark.parametrize("shape", [(3, 3), (4, 3), (3, 4)])
+    def test_diagonal_svd(self, shape):
+        """Test the LAPACK-free path for inputs tagged diagonal."""
+        data = np.zeros(shape)
+        np.fill_diagonal(data, [2.0, -5.0, 0.5])
+        A = TrackedTensor(
+            data=data, name="D", kind=TensorKind.MATRIX, tags=frozenset({"diagonal"})
+        )
+        result = SVD()({"A": A})
+
+        U, S, Vt = (result[name].data for name in ("U", "S", "Vt"))
+        np.testing.assert_allclose(S, [5.0, 2.0, 0.5])
+        np.testing.assert_allclose((U * S) @ Vt, data)
+        np.testing.assert_allclose(U.T @ U, _EYE[3])
+
+    def test_singular_values_only(self, matrix_3x2):
+        """Test that compute_uv=False outputs only S."""
+        op = SVD(compute_uv=False)
+        result = op({"A": matrix_3x2})
+
+        assert set(result) == set(op.output_specs) == {"S"}
+        expected = np.linalg.svd(matrix_3x2.data, compute_uv=False)
+        np.testing.assert_allclose(result["S"].data, expected)
+
 
 class TestEigendecomposition:
     """Tests for Eigendecomposition operator."""
@@ -279,19 +481,49 @@ class TestEigendecomposition:
         # Verify reconstruction: V @ diag(λ) @ V^T = A
         V = eigenvectors.data
         L = eigenvalues.data
-        reconstructed = V @ np.diag(L) @ V.T
+        reconstructed = (V * L) @ V.T
 
         np.testing.assert_allclose(reconstructed, matrix_2x2.data, atol=1e-10)
 
-    def test_eigenvalues_sorted(self, matrix_2x2):
+    def test_eigenvalues_sorted(self, matrix_2x2_f32):
         """Test that eigenvalues are sorted ascending."""
         op = Eigendecomposition()
-        result = op({"A": matrix_2x2})
+        result = op({"A": matrix_2x2_f32})
 
         eigenvalues = result["eigenvalues"].data
-        assert np.all(eigenvalues[:-1] <= eigenvalues[1:])
+        assert (np.diff(eigenvalues) >= 0).all()
         assert "sorted_ascending" in result["eigenvalues"].tags
 
+    @pytest.mark.parametrize(
+        "diagonal, tag",
+        [
+            ([1.0, 2.0], "all_positive"),
+            ([0.0, 2.0], "all_non_negative"),
+            ([-2.0, -1.0], "all_negative"),
+        ],
+    )
+    def test_eigenvalue_sign_tags(self, diagonal, tag):
+        """Test eigenvalue sign classification."""
+        A = TrackedTensor(data=np.diag(diagonal), name="D", kind=TensorKind.MATRIX)
+        result = Eigendecomposition()({"A": A})
+        assert tag in result["eigenvalues"].tags
+
+
+    def test_diagonal_eigendecomposition(self):
+        """Test that a diagonal-tagged input skips eigh."""
+        A = TrackedTensor(
+            data=np.diag([3.0, -1.0, 2.0]),
+            name="D",
+            kind=TensorKind.MATRIX,
+            tags=frozenset({"diagonal"}),
+        )
+        result = Eigendecomposition()({"A": A})
+
+        V = result["eigenvectors"].data
+        L = result["eigenvalues"].data
+        np.testing.assert_allclose(L, [-1.0, 2.0, 3.0])
+        np.testing.assert_allclose((V * L) @ V.T, A.data)
+
 
 class TestQR:
     """Tests for QR decomposition operator."""
@@ -314,7 +546,7 @@ class TestQR:
 
         Q = result["Q"].data
         QtQ = Q.T @ Q
-        np.testing.assert_allclose(QtQ, np.eye(Q.shape[1]), atol=1e-10)
+        np.testing.assert_allclose(QtQ, _EYE[Q.shape[1]], atol=1e-10)
         assert "orthogonal" in result["Q"].tags
 
 
@@ -331,6 +563,74 @@ class TestCholesky:
         np.testing.assert_allclose(reconstructed, matrix_2x2.data, atol=1e-10)
         assert "lower_triangular" in result["L"].tags
 
+    def test_cholesky_matches_numpy(self, matrix_3x3_symmetric):
+        """Test that only the lower triangle is read, as in NumPy."""
+        data = np.tril(matrix_3x3_symmetric.data)
+        A = TrackedTensor(data=data, name="A", kind=TensorKind.MATRIX)
+
+        L = Cholesky()({"A": A})["L"].data
+        np.testing.assert_allclose(L, np.linalg.cholesky(data))
+
+    def test_cholesky_not_positive_definite_raises(self):
+        """Test that indefinite input raises LinAlgError."""
+        A = TrackedTensor(data=-np.eye(2), name="A", kind=TensorKind.MATRIX)
+        with pytest.raises(np.linalg.LinAlgError):
+            Cholesky()({"A": A})
+
+
+class TestComputeDtype:
+    """Tests for the compute_dtype option of decompositions."""
+
+    @pytest.mark.parametrize("op_class", [SVD, Eigendecomposition, QR, Cholesky])
+    def test_float32_compute(self, op_class, matrix_3x3_symmetric):
+        """Test that float64 input is factored in single precision."""
+        data = matrix_3x3_symmetric.data.astype(np.float64)
+        A = TrackedTensor(data=data, name="A", kind=TensorKind.MATRIX)
+
+        fast = op_class(compute_dtype=np.float32)({"A": A})
+        exact = op_class()({"A": A})
+        for name, output in fast.items():
+            assert output.data.dtype == np.float32
+            assert "fp32_computed" in output.tags
+            assert "fp32_computed" not in exact[name].tags
+            np.testing.assert_allclose(
+                np.abs(output.data), np.abs(exact[name].data), atol=1e-5
+            )
+
+    def test_invalid_compute_dtype_raises(self):
+        """Test that dtypes LAPACK cannot factor are rejected."""
+        with pytest.raises(ValueError):
+            QR(compute_dtype=np.int32)
+
+
+class TestBatched:
+    """Tests for stacks of matrices in decompositions and MatMul."""
+
+    @pytest.fixture
+    def stack(self):
+        rng = np.random.default_rng(0)
+        X = rng.standard_normal((4, 3, 3))
+        data = X @ np.swapaxes(X, -1, -2) + np.eye(3)
+        return TrackedTensor(data=data, name="S", kind=TensorKind.MATRIX)
+
+    @pytest.mark.parametrize("op_class", [SVD, Eigendecomposition, QR, Cholesky])
+    def test_matches_per_matrix(self, op_class, stack):
+        """Test that a stack is factored as each matrix would be."""
+        result = op_class()({"A": stack})
+        for i, matrix in enumerate(stack.data):
+            single = TrackedTensor(data=matrix, name="M", kind=TensorKind.MATRIX)
+            for name, expected in op_class()({"A": single}).items():
+                assert "batched" in result[name].tags
+                np.testing.assert_allclose(
+                    np.abs(result[name].data[i]), np.abs(expected.data), atol=1e-10
+                )
+
+    def test_batched_matmul(self, stack, matrix_3x2):
+        """Test that MatMul broadcasts a stack over a single matrix."""
+        C = MatMul()({"A": stack, "B": matrix_3x2})["C"]
+        np.testing.assert_allclose(C.data, stack.data @ matrix_3x2.data)
+        assert C.tags == frozenset({"batched"})
+
 
 # ============================================================================
 # Solver Operators
@@ -340,7 +640,7 @@ class TestCholesky:
 class TestLeastSquares:
     """Tests for LeastSquares operator."""
 
-    def test_overdetermined(self, matrix_3x2, vector_3):
+    def test_overdetermined(self, matrix_3x2, vector_3, lstsq_3x2):
         """Test least squares for overdetermined system."""
         op = LeastSquares()
         result = op({"A": matrix_3x2, "b": vector_3})
@@ -349,10 +649,7 @@ class TestLeastSquares:
         residual = result["residual"]
 
         # Verify solution matches numpy
-        expected_x, _, _, _ = np.linalg.lstsq(
-            matrix_3x2.data, vector_3.data, rcond=None
-        )
-        np.testing.assert_allclose(x.data, expected_x, atol=1e-10)
+        np.testing.assert_allclose(x.data, lstsq_3x2, atol=1e-10)
 
         # Verify residual
         expected_residual = vector_3.data - matrix_3x2.data @ x.data
@@ -373,19 +670,72 @@ class TestLeastSquares:
         # Residual should be nearly zero
         assert residual_norm.data < 1e-10
 
+    def test_rank_deficient(self):
+        """Test that a rank-deficient system gets the minimum norm solution."""
+        data = np.outer([1.0, 2.0, 3.0], [1.0, -1.0])
+        A = TrackedTensor(data=data, name="A", kind=TensorKind.MATRIX)
+        b = TrackedTensor(
+            data=np.array([1.0, 0.0, 2.0]), name="b", kind=TensorKind.VECTOR
+        )
+        x = LeastSquares()({"A": A, "b": b})["x"]
+
+        expected, _, _, _ = np.linalg.lstsq(data, b.data, rcond=None)
+        np.testing.assert_allclose(x.data, expected, atol=1e-10)
+
 
 class TestLinearSolve:
     """Tests for LinearSolve operator."""
 
-    def test_solve(self, matrix_2x2, vector_2):
+    def test_solve(self, matrix_2x2, vector_2, inv_2x2):
         """Test direct linear solve."""
         op = LinearSolve()
         result = op({"A": matrix_2x2, "b": vector_2})
 
         x = result["x"]
-        expected = np.linalg.solve(matrix_2x2.data, vector_2.data)
+        expected = inv_2x2 @ vector_2.data
         np.testing.assert_allclose(x.data, expected, atol=1e-10)
 
+    def test_repeated_solves_reuse_factorization(self, matrix_2x2):
+        """Test new right-hand sides against a cached LU factorization."""
+        op = LinearSolve()
+        for rhs in ([1.0, 0.0], [0.0, 1.0], [3.0, -2.0]):
+            b = TrackedTensor(data=np.array(rhs), name="b", kind=TensorKind.VECTOR)
+            x = op({"A": matrix_2x2, "b": b})["x"]
+            np.testing.assert_allclose(matrix_2x2.data @ x.data, rhs, atol=1e-12)
+
+    def test_solve_after_caller_writes_matrix(self, vector_2):
+        """Test that a cached factorization is not reused for changed data."""
+        a = np.array([[4.0, 1.0], [1.0, 3.0]])
+        A = TrackedTensor(data=a, name="A", kind=TensorKind.MATRIX)
+        op = LinearSolve()
+        op({"A": A, "b": vector_2})
+
+        a[0, 0] = 100.0
+        x = op({"A": A, "b": vector_2})["x"]
+        np.testing.assert_allclose(
+            x.data, np.linalg.solve(a, vector_2.data), rtol=1e-6
+        )
+
+    @pytest.mark.parametrize(
+        "data", [[[4.0, 1.0], [1.0, 3.0]], [[1.0, 2.0], [2.0, 1.0]]]
+    )
+    def test_positive_definite_tag(self, data, vector_2):
+        """Test the Cholesky path, and its LU fallback for a mistagged matrix."""
+        A = TrackedTensor(
+            data=np.array(data),
+            name="A",
+            kind=TensorKind.MATRIX,
+            tags=frozenset({"symmetric", "positive_definite"}),
+        )
+        x = LinearSolve()({"A": A, "b": vector_2})["x"]
+        np.testing.assert_allclose(A.data @ x.data, vector_2.data, atol=1e-12)
+
+    def test_singular_raises(self, vector_2):
+        """Test that a singular matrix raises LinAlgError."""
+        A = TrackedTensor(data=np.ones((2, 2)), name="A", kind=TensorKind.MATRIX)
+        with pytest.raises(np.linalg.LinAlgError):
+            LinearSolve()({"A": A, "b": vector_2})
+
     def test_non_square_raises(self, matrix_3x2, vector_3):
         """Test that non-square matrix raises error."""
         op = LinearSolve()
@@ -396,7 +746,7 @@ class TestLinearSolve:
 class TestNormalEquations:
     """Tests for NormalEquations operator."""
 
-    def test_normal_equations(self, matrix_3x2, vector_3):
+    def test_normal_equations(self, matrix_3x2, vector_3, lstsq_3x2):
         """Test normal equations solver."""
         op = NormalEquations()
         result = op({"A": matrix_3x2, "b": vector_3})
@@ -410,14 +760,34 @@ class TestNormalEquations:
         assert "psd" in AtA.tags
 
         # Verify solution
-        expected_x, _, _, _ = np.linalg.lstsq(
-            matrix_3x2.data, vector_3.data, rcond=None
-        )
-        np.testing.assert_allclose(x.data, expected_x, atol=1e-10)
+        np.testing.assert_allclose(x.data, lstsq_3x2, atol=1e-10)
 
         # Verify AtA and Atb
-        np.testing.assert_allclose(AtA.data, matrix_3x2.data.T @ matrix_3x2.data)
-        np.testing.assert_allclose(Atb.data, matrix_3x2.data.T @ vector_3.data)
+        np.testing.assert_allclose(AtA.data, _ATA_3X2)
+        np.testing.assert_allclose(Atb.data, _ATB_3X2)
+        assert "positive_definite" in AtA.tags
+
+    def test_solution_only(self, matrix_3x2, vector_3, lstsq_3x2):
+        """Test that emit_normal_tensors=False outputs only x."""
+        op = NormalEquations(emit_normal_tensors=False)
+        result = op({"A": matrix_3x2, "b": vector_3})
+
+        assert set(result) == set(op.output_specs) == {"x"}
+        np.testing.assert_allclose(result["x"].data, lstsq_3x2, atol=1e-10)
+
+    def test_ill_conditioned_not_positive_definite(self):
+        """Test that a nearly singular R with a large diagonal is not definite."""
+        # Kahan matrix: min |diag(R)| is about 6e-5, sigma_min about 2e-11
+        n, c = 30, 0.7
+        kahan = np.diag(np.sqrt(1 - c**2) ** np.arange(n)) @ (
+            np.eye(n) - c * np.triu(np.ones((n, n)), 1)
+        )
+        A = TrackedTensor(data=kahan, name="K", kind=TensorKind.MATRIX)
+        b = TrackedTensor(data=np.ones(n), name="b", kind=TensorKind.VECTOR)
+
+        AtA = NormalEquations()({"A": A, "b": b})["AtA"]
+        assert "psd" in AtA.tags
+        assert "positive_definite" not in AtA.tags
 
 
 class TestInverse:
@@ -432,7 +802,14 @@ class TestInverse:
 
         # Verify A @ A^{-1} = I
         product = matrix_2x2.data @ A_inv.data
-        np.testing.assert_allclose(product, np.eye(2), atol=1e-10)
+        np.testing.assert_allclose(product, _EYE[2], atol=1e-10)
+
+    def test_inverse_after_solve(self, matrix_2x2, vector_2, inv_2x2):
+        """Test inverting a matrix whose LU factors LinearSolve cached."""
+        LinearSolve()({"A": matrix_2x2, "b": vector_2})
+        A_inv = Inverse()({"A": matrix_2x2})["A_inv"].data
+        np.testing.assert_allclose(A_inv, inv_2x2)
+        assert A_inv.flags.c_contiguous
 
     def test_non_square_raises(self, matrix_3x2):
         """Test that non-square matrix raises error."""
@@ -454,13 +831,23 @@ class TestPseudoInverse:
 
         # Verify A^+ @ A = I (left inverse property for full column rank)
         product = A_pinv.data @ matrix_3x2.data
-        np.testing.assert_allclose(product, np.eye(2), atol=1e-10)
+        np.testing.assert_allclose(product, _EYE[2], atol=1e-10)
 
-    def test_pseudoinverse_square(self, matrix_2x2):
+    def test_pseudoinverse_square(self, matrix_2x2, inv_2x2):
         """Test pseudoinverse of square invertible matrix equals inverse."""
         op = PseudoInverse()
         result = op({"A": matrix_2x2})
 
         A_pinv = result["A_pinv"]
-        expected = np.linalg.inv(matrix_2x2.data)
-        np.testing.assert_allclose(A_pinv.data, expected, atol=1e-10)
+        np.testing.assert_allclose(A_pinv.data, inv_2x2, atol=1e-10)
+
+    @pytest.mark.parametrize("rcond", [None, 1e-3])
+    def test_pseudoinverse_rank_deficient(self, rcond):
+        """Test that small singular values are cut off as in NumPy."""
+        data = np.outer([1.0, 2.0, 3.0], [1.0, -1.0]) + 1e-6 * np.eye(3, 2)
+        A = TrackedTensor(data=data, name="A", kind=TensorKind.MATRIX)
+        A_pinv = PseudoInverse(rcond=rcond)({"A": A})["A_pinv"].data
+
+        kwargs = {} if rcond is None else {"rcond": rcond}
+        expected = np.linalg.pinv(data, **kwargs)
+        np.testing.assert_allclose(A_pinv, expected, atol=1e-8)
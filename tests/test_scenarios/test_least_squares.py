@@ -1,12 +1,25 @@
 """Tests for the Least Squares 2D scenario."""
 
+import threading
+
 import numpy as np
 import pytest
 
-from tensorscope.core import Scenario, Parameter, ParameterType
+from tensorscope.core import Scenario, Parameter, ParameterType, compute_summary
 from tensorscope.scenarios import least_squares_2d, create_least_squares_2d_scenario
 
 
+@pytest.fixture(scope="module")
+def scenario():
+    """A scenario built once and shared by tests that only run it.
+
+    Scenario.run() depends only on its parameters, so runs from earlier
+    tests do not change results; tests about construction or about one
+    instance's result memo build their own.
+    """
+    return create_least_squares_2d_scenario()
+
+
 class TestLeastSquares2DScenario:
     """Test suite for the Least Squares 2D scenario."""
 
@@ -73,10 +86,8 @@ class TestLeastSquares2DScenario:
         assert "projection" in node_names
         assert "residual" in node_names
 
-    def test_run_with_defaults(self):
+    def test_run_with_defaults(self, scenario):
         """Test running the scenario with default parameters."""
-        scenario = create_least_squares_2d_scenario()
-
         results = scenario.run()
 
         assert len(results) > 0
@@ -89,9 +100,8 @@ class TestLeastSquares2DScenario:
         assert "projection.C" in results
         assert "residual.C" in results
 
-    def test_output_shapes(self):
+    def test_output_shapes(self, scenario):
         """Test that output tensors have correct shapes."""
-        scenario = create_least_squares_2d_scenario()
         results = scenario.run()
 
         # A is 3x2
@@ -118,9 +128,8 @@ class TestLeastSquares2DScenario:
         residual = results["residual.C"]
         assert residual.shape == (3,)
 
-    def test_mathematical_correctness(self):
+    def test_mathematical_correctness(self, scenario):
         """Test that the least squares solution is mathematically correct."""
-        scenario = create_least_squares_2d_scenario()
         results = scenario.run({"noise_level": 0.0})  # No noise for clean test
 
         A = results["_input.A"].data
@@ -137,18 +146,20 @@ class TestLeastSquares2DScenario:
         expected_residual = b - projection
         np.testing.assert_allclose(residual, expected_residual, rtol=1e-10)
 
+        # Inputs are stored in the visualization dtype, usually float32
+        tol = 1e3 * np.finfo(A.dtype).eps
+
         # Test: residual is orthogonal to column space of A
         # (A^T @ residual should be ~0)
         orthogonality_error = A.T @ residual
-        np.testing.assert_allclose(orthogonality_error, np.zeros(2), atol=1e-10)
+        np.testing.assert_allclose(orthogonality_error, np.zeros(2), atol=tol)
 
         # Test: x matches numpy's lstsq solution
         x_numpy, _, _, _ = np.linalg.lstsq(A, b, rcond=None)
-        np.testing.assert_allclose(x, x_numpy, rtol=1e-10)
+        np.testing.assert_allclose(x, x_numpy, rtol=tol)
 
-    def test_ata_is_symmetric_psd(self):
+    def test_ata_is_symmetric_psd(self, scenario):
         """Test that A^T A is symmetric and positive semi-definite."""
-        scenario = create_least_squares_2d_scenario()
         results = scenario.run()
 
         AtA = results["AtA.C"].data
@@ -156,22 +167,20 @@ class TestLeastSquares2DScenario:
         # Check symmetry
         np.testing.assert_allclose(AtA, AtA.T, rtol=1e-10)
 
-        # Check positive semi-definiteness (eigenvalues >= 0)
-        eigenvalues = np.linalg.eigvalsh(AtA)
-        assert np.all(eigenvalues >= -1e-10)
+        # Check positive semi-definiteness (eigenvalues > -1e-10): the
+        # Cholesky factorization of AtA + 1e-10 I exists exactly then, and
+        # stops at the first failing pivot otherwise
+        np.linalg.cholesky(AtA + 1e-10 * np.eye(len(AtA)))
 
-    def test_noise_affects_results(self):
+    def test_noise_affects_results(self, scenario):
         """Test that changing noise_level affects the results."""
-        scenario = create_least_squares_2d_scenario()
-
         # Run with no noise
         results_clean = scenario.run({"noise_level": 0.0, "seed": 42})
         x_clean = results_clean["solve.x"].data
         residual_clean = results_clean["residual.C"].data
 
         # Run with high noise
-        scenario2 = create_least_squares_2d_scenario()
-        results_noisy = scenario2.run({"noise_level": 0.5, "seed": 42})
+        results_noisy = scenario.run({"noise_level": 0.5, "seed": 42})
         x_noisy = results_noisy["solve.x"].data
         residual_noisy = results_noisy["residual.C"].data
 
@@ -185,56 +194,84 @@ class TestLeastSquares2DScenario:
         # We just check they're different
         assert residual_norm_clean != residual_norm_noisy
 
-    def test_condition_number_affects_matrix(self):
+    def test_noise_change_reuses_design_matrix(self):
+        """Test that only b is rebuilt when just the noise level changes."""
+        scenario = create_least_squares_2d_scenario()
+        A1 = scenario.run({"noise_level": 0.1, "seed": 7})["_input.A"]
+        A2 = scenario.run({"noise_level": 0.3, "seed": 7})["_input.A"]
+        assert A1 is A2
+
+    def test_run_keeps_other_scenarios_summaries(self):
+        """Test that a run only evicts summaries of tensors it replaced."""
+        first = create_least_squares_2d_scenario()
+        second = create_least_squares_2d_scenario()
+        A = first.run({"seed": 1})["_input.A"]
+        summary = compute_summary(A)
+
+        second.run({"seed": 2})
+        assert compute_summary(A) is summary
+
+        first.run({"seed": 3})
+        assert compute_summary(A) is not summary
+
+    def test_condition_number_affects_matrix(self, scenario):
         """Test that condition_number parameter affects A^T A."""
-        scenario1 = create_least_squares_2d_scenario()
-        results1 = scenario1.run({"condition_number": 1.0, "seed": 42})
+        results1 = scenario.run({"condition_number": 1.0, "seed": 42})
         AtA1 = results1["AtA.C"].data
 
-        scenario2 = create_least_squares_2d_scenario()
-        results2 = scenario2.run({"condition_number": 50.0, "seed": 42})
+        results2 = scenario.run({"condition_number": 50.0, "seed": 42})
         AtA2 = results2["AtA.C"].data
 
-        # Compute actual condition numbers
-        cond1 = np.linalg.cond(AtA1)
-        cond2 = np.linalg.cond(AtA2)
+        # A^T A is symmetric positive definite, so its condition number is
+        # the ratio of its extreme eigenvalues (ascending from eigvalsh)
+        eig1 = np.linalg.eigvalsh(AtA1)
+        eig2 = np.linalg.eigvalsh(AtA2)
+        cond1 = eig1[-1] / eig1[0]
+        cond2 = eig2[-1] / eig2[0]
 
         # Higher condition_number parameter should lead to worse conditioning
         # (AtA condition number is roughly squared of A's condition number)
         assert cond2 > cond1
 
-    def test_seed_reproducibility(self):
+    def test_seed_reproducibility(self, scenario):
         """Test that same seed produces identical results."""
-        scenario1 = create_least_squares_2d_scenario()
-        results1 = scenario1.run({"seed": 123})
-
-        scenario2 = create_least_squares_2d_scenario()
-        results2 = scenario2.run({"seed": 123})
-
-        # All tensors should be identical
-        for key in results1:
-            np.testing.assert_array_equal(
-                results1[key].data,
-                results2[key].data,
-                err_msg=f"Mismatch in {key}",
-            )
+        results1 = scenario.run({"seed": 123})
+
+        # Forced, so the graph runs again rather than returning results1
+        results2 = scenario.run({"seed": 123}, force=True)
+        assert results2 is not results1
+
+        # All tensors should be identical; compared as one flattened array
+        keys = sorted(results1)
+        assert sorted(results2) == keys
+        assert [results1[k].shape for k in keys] == [results2[k].shape for k in keys]
+        np.testing.assert_array_equal(
+            np.concatenate([results1[k].data.ravel() for k in keys]),
+            np.concatenate([results2[k].data.ravel() for k in keys]),
+        )
 
-    def test_different_seeds_different_results(self):
+    def test_different_seeds_different_results(self, scenario):
         """Test that different seeds produce different results."""
-        scenario1 = create_least_squares_2d_scenario()
-        results1 = scenario1.run({"seed": 1})
-
-        scenario2 = create_least_squares_2d_scenario()
-        results2 = scenario2.run({"seed": 2})
+        results1 = scenario.run({"seed": 1})
+        results2 = scenario.run({"seed": 2})
 
         # At least some tensors should differ
         A1 = results1["_input.A"].data
         A2 = results2["_input.A"].data
         assert not np.allclose(A1, A2)
 
-    def test_get_probed_tensors(self):
-        """Test getting only probed tensors."""
+    def test_rerun_with_same_params_reuses_results(self):
+        """Test that unchanged parameters skip re-execution unless forced."""
         scenario = create_least_squares_2d_scenario()
+        first = scenario.run({"seed": 7})
+
+        assert scenario.run({"seed": 7}) is first
+        second = scenario.run({"seed": 8})
+        assert second is not first
+        assert scenario.run({"seed": 8}, force=True) is not second
+
+    def test_get_probed_tensors(self, scenario):
+        """Test getting only probed tensors."""
         scenario.run()
 
         probed = scenario.get_probed_tensors()
@@ -244,9 +281,8 @@ class TestLeastSquares2DScenario:
         assert "x* (Solution)" in probed
         assert "r (Residual)" in probed
 
-    def test_get_probed_summaries(self):
+    def test_get_probed_summaries(self, scenario):
         """Test getting summaries of probed tensors."""
-        scenario = create_least_squares_2d_scenario()
         scenario.run()
 
         summaries = scenario.get_probed_summaries()
@@ -261,6 +297,36 @@ class TestLeastSquares2DScenario:
             assert summary.dtype is not None
             assert "norm" in summary.stats
 
+    def test_get_probed_summaries_in_parallel(self, monkeypatch):
+        """Test matrix summaries computed in the worker pool are complete."""
+        from tensorscope.core import scenario as scenario_module
+
+        monkeypatch.setattr(scenario_module, "_MIN_PARALLEL_SUMMARIES", 1)
+        scenario = create_least_squares_2d_scenario()
+        scenario.run()
+
+        # Record the threads the summaries' SVDs run on
+        svd_threads = []
+        svd = np.linalg.svd
+
+        def recording_svd(*args, **kwargs):
+            svd_threads.append(threading.current_thread().name)
+            return svd(*args, **kwargs)
+
+        monkeypatch.setattr(np.linalg, "svd", recording_svd)
+        summaries = scenario.get_probed_summaries()
+        monkeypatch.undo()
+        probed = scenario.get_probed_tensors()
+
+        # Every decomposition ran in the worker pool, none on this thread
+        assert svd_threads
+        assert all(name.startswith("tensorscope-summary") for name in svd_threads)
+
+        for name in ("A (Design Matrix)", "A^T A (Normal Matrix)"):
+            expected = np.linalg.matrix_rank(probed[name].data)
+            assert summaries[name].stats["rank"] == expected
+        assert summaries["A^T A (Normal Matrix)"].stats["is_positive_definite"]
+
     def test_to_dict_serialization(self):
         """Test scenario serialization for API."""
         scenario = least_squares_2d
@@ -279,10 +345,8 @@ class TestLeastSquares2DScenario:
         assert params["noise_level"]["min"] == 0.0
         assert params["noise_level"]["max"] == 1.0
 
-    def test_parameter_validation(self):
+    def test_parameter_validation(self, scenario):
         """Test that invalid parameters are rejected."""
-        scenario = create_least_squares_2d_scenario()
-
         # noise_level out of range
         is_valid, errors = scenario.validate_params({"noise_level": 2.0})
         assert not is_valid
@@ -292,10 +356,8 @@ class TestLeastSquares2DScenario:
         is_valid, errors = scenario.validate_params({"unknown_param": 1.0})
         assert not is_valid
 
-    def test_run_raises_on_invalid_params(self):
+    def test_run_raises_on_invalid_params(self, scenario):
         """Test that run() raises ValueError for invalid parameters."""
-        scenario = create_least_squares_2d_scenario()
-
         with pytest.raises(ValueError):
             scenario.run({"noise_level": -1.0})  # Below minimum
 
@@ -365,3 +427,13 @@ class TestScenarioClass:
         is_valid, error = params["method"].validate("invalid")
         assert not is_valid
         assert "not in options" in error
+
+    def test_parameter_validator_tracks_constraint_changes(self):
+        """Test that changing a bound after construction is respected."""
+        param = Parameter(name="alpha", min_val=0.0, max_val=1.0)
+        assert param.validate(0.5) == (True, "")
+
+        param.max_val = 0.25
+        is_valid, error = param.validate(0.5)
+        assert not is_valid
+        assert "above maximum 0.25" in error
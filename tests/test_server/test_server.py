@@ -0,0 +1,127 @@
+"""Tests for the REST endpoints and WebSocket protocol of the server."""
+
+import base64
+import json
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from tensorscope.server.main import app
+from tensorscope.server.state import state
+
+SCENARIO_ID = "least_squares_2d"
+
+
+@pytest.fixture(scope="module")
+def client():
+    """A client for the app, with the scenario run once at default parameters."""
+    with TestClient(app) as client:
+        response = client.post(
+            f"/api/scenarios/{SCENARIO_ID}/run", json={"parameters": {}}
+        )
+        assert response.status_code == 200
+        yield client
+
+
+def _update_param(ws, param, value, **extra):
+    """Send an update_param message for the scenario over a WebSocket."""
+    ws.send_json(
+        {
+            "type": "update_param",
+            "scenario_id": SCENARIO_ID,
+            "param": param,
+            "value": value,
+            **extra,
+        }
+    )
+
+
+class TestTensorData:
+    """Tests for the tensor data endpoints."""
+
+    def test_data_base64_round_trip(self, client):
+        """encoding=base64 returns the tensor's little-endian bytes."""
+        tensor = state.get_tensor("_input.A")
+        response = client.get(f"/api/tensors/{tensor.id}/data?encoding=base64")
+        assert response.status_code == 200
+
+        payload = response.json()
+        assert payload["encoding"] == "base64"
+        assert payload["shape"] == list(tensor.shape)
+        data = np.frombuffer(
+            base64.b64decode(payload["data"]),
+            dtype=np.dtype(payload["dtype"]).newbyteorder("<"),
+        ).reshape(payload["shape"])
+        np.testing.assert_array_equal(data, tensor.data)
+
+    def test_raw_round_trip(self, client):
+        """/raw returns the tensor buffer, or a slice of it, with its layout."""
+        tensor = state.get_tensor("_input.A")
+        for query, expected in (
+            ("", tensor.data),
+            ("?row_start=1&row_end=3&col_end=1", tensor.data[1:3, :1]),
+        ):
+            response = client.get(f"/api/tensors/{tensor.id}/raw{query}")
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/octet-stream"
+
+            dtype = np.dtype(response.headers["X-Dtype"]).newbyteorder("<")
+            shape = json.loads(response.headers["X-Shape"])
+            data = np.frombuffer(response.content, dtype=dtype).reshape(shape)
+            np.testing.assert_array_equal(data, expected)
+
+
+class TestWebSocket:
+    """Tests for the WebSocket protocol."""
+
+    def test_update_param(self, client):
+        """update_param answers with one tensors_update holding every tensor."""
+        with client.websocket_connect("/ws") as ws:
+            _update_param(ws, "seed", 7)
+            message = ws.receive_json()
+
+        assert message["type"] == "tensors_update"
+        assert "partial" not in message
+        assert len(message["tensors"]) == len(state.get_all_summaries())
+        for key, summary in message["tensors"].items():
+            assert summary == state.get_tensor_summary(key).to_dict()
+        assert state.current_params["seed"] == 7
+
+    def test_update_param_stream(self, client):
+        """With stream, each tensor arrives alone, then a stream_end count."""
+        with client.websocket_connect("/ws") as ws:
+            _update_param(ws, "seed", 8, stream=True)
+            updates = []
+            message = ws.receive_json()
+            while message["type"] == "tensor_update":
+                updates.append(message)
+                message = ws.receive_json()
+
+        assert message == {"type": "stream_end", "count": len(updates)}
+        assert len(updates) == len(state.get_all_summaries())
+        for update in updates:
+            summary = state.get_tensor_summary(update["tensor_id"])
+            assert update["summary"] == summary.to_dict()
+        assert state.current_params["seed"] == 8
+
+    def test_update_param_broadcasts_partial_update(self, client):
+        """Other clients receive only the tensors they subscribe to."""
+        with client.websocket_connect("/ws") as watcher:
+            watcher.send_json({"type": "subscribe", "tensor_id": "solve.x"})
+            initial = watcher.receive_json()
+            assert initial["type"] == "tensor_update"
+            assert initial["tensor_id"] == "solve.x"
+
+            with client.websocket_connect("/ws") as updater:
+                _update_param(updater, "seed", 9)
+                assert updater.receive_json()["type"] == "tensors_update"
+
+            message = watcher.receive_json()
+
+        assert message["type"] == "tensors_update"
+        assert message["partial"] is True
+        assert list(message["tensors"]) == ["solve.x"]
+        summary = state.get_tensor_summary("solve.x").to_dict()
+        assert message["tensors"]["solve.x"] == summary
+        assert message["tensors"]["solve.x"] != initial["summary"]
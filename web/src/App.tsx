@@ -29,6 +29,7 @@ function App() {
     updateTensor,
     updateParameter,
     setTensors,
+    mergeTensors,
     setUpdatingParams,
     addToast,
     removeToast,
@@ -51,12 +52,19 @@ function App() {
   const { isConnected, updateParam } = useWebSocket(`ws://${window.location.host}/ws`, {
     onMessage: (message: WSServerMessage) => {
       if (message.type === 'tensor_update') {
+        // Streamed updates keep the controls locked until stream_end
         updateTensor(message.tensor_id, message.summary);
+      } else if (message.type === 'stream_end') {
         isUpdatingRef.current = false;
         setUpdatingParams(false);
       } else if (message.type === 'tensors_update') {
-        // Bulk update all tensors (e.g., after parameter change)
-        setTensors(message.tensors);
+        // Bulk update all tensors (e.g., after parameter change), or only
+        // the subscribed ones when another client changed a parameter
+        if (message.partial) {
+          mergeTensors(message.tensors);
+        } else {
+          setTensors(message.tensors);
+        }
         isUpdatingRef.current = false;
         setUpdatingParams(false);
       } else if (message.type === 'error') {
@@ -6,6 +6,8 @@ import type {
   TensorSummary,
   TensorData,
   TensorSlice,
+  TensorRaw,
+  DataEncoding,
   RunScenarioRequest,
   RunScenarioResponse,
 } from '../types';
@@ -51,8 +53,11 @@ export async function fetchTensorSummary(id: string): Promise<TensorSummary> {
   return fetchJSON<TensorSummary>(`${API_BASE}/tensors/${id}/summary`);
 }
 
-export async function fetchTensorData(id: string): Promise<TensorData> {
-  return fetchJSON<TensorData>(`${API_BASE}/tensors/${id}/data`);
+export async function fetchTensorData(
+  id: string,
+  encoding: DataEncoding = 'list'
+): Promise<TensorData> {
+  return fetchJSON<TensorData>(`${API_BASE}/tensors/${id}/data?encoding=${encoding}`);
 }
 
 export async function fetchTensorSlice(
@@ -60,13 +65,72 @@ export async function fetchTensorSlice(
   rowStart = 0,
   rowEnd?: number,
   colStart = 0,
-  colEnd?: number
+  colEnd?: number,
+  encoding: DataEncoding = 'list'
 ): Promise<TensorSlice> {
   const params = new URLSearchParams();
   params.set('row_start', String(rowStart));
   if (rowEnd !== undefined) params.set('row_end', String(rowEnd));
   params.set('col_start', String(colStart));
   if (colEnd !== undefined) params.set('col_end', String(colEnd));
+  params.set('encoding', encoding);
 
   return fetchJSON<TensorSlice>(`${API_BASE}/tensors/${id}/slice?${params}`);
 }
+
+const TYPED_ARRAYS: Record<string, new (buffer: ArrayBuffer) => ArrayLike<number>> = {
+  float64: Float64Array,
+  float32: Float32Array,
+  int32: Int32Array,
+  int16: Int16Array,
+  int8: Int8Array,
+  uint32: Uint32Array,
+  uint16: Uint16Array,
+  uint8: Uint8Array,
+};
+
+// Decode the base64 "data" of a /data or /slice response fetched with
+// encoding 'base64' into a flat typed array in C order.
+export function decodeBase64Data(data: string, dtype: string): ArrayLike<number> {
+  const ArrayType = TYPED_ARRAYS[dtype];
+  if (ArrayType === undefined) {
+    throw new Error(`Unsupported tensor dtype: ${dtype}`);
+  }
+  const binary = atob(data);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  return new ArrayType(bytes.buffer);
+}
+
+// Fetch tensor data (optionally a slice) as raw bytes in C order. Much
+// cheaper than the JSON /data and /slice endpoints for large tensors.
+export async function fetchTensorRaw(
+  id: string,
+  rowStart = 0,
+  rowEnd?: number,
+  colStart = 0,
+  colEnd?: number
+): Promise<TensorRaw> {
+  const params = new URLSearchParams();
+  params.set('row_start', String(rowStart));
+  if (rowEnd !== undefined) params.set('row_end', String(rowEnd));
+  params.set('col_start', String(colStart));
+  if (colEnd !== undefined) params.set('col_end', String(colEnd));
+
+  const response = await fetch(`${API_BASE}/tensors/${id}/raw?${params}`);
+  if (!response.ok) {
+    const error = await response.text();
+    throw new Error(`API error ${response.status}: ${error}`);
+  }
+
+  const dtype = response.headers.get('X-Dtype') ?? 'float64';
+  const shape: number[] = JSON.parse(response.headers.get('X-Shape') ?? '[]');
+  const buffer = await response.arrayBuffer();
+  const ArrayType = TYPED_ARRAYS[dtype];
+  if (ArrayType === undefined) {
+    throw new Error(`Unsupported tensor dtype: ${dtype}`);
+  }
+  return { shape, dtype, data: new ArrayType(buffer) };
+}
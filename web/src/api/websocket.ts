@@ -137,7 +137,8 @@ export function useWebSocket(
 
   const updateParam = useCallback(
     (scenarioId: string, param: string, value: number | string) => {
-      send({ type: 'update_param', scenario_id: scenarioId, param, value });
+      // Stream one tensor_update per tensor so the first arrives early
+      send({ type: 'update_param', scenario_id: scenarioId, param, value, stream: true });
     },
     [send]
   );
@@ -130,7 +130,7 @@ export function TensorInspector({ tensor }: TensorInspectorProps) {
     }
 
     if (activeTab === 'data') {
-      return <TensorDataView data={tensorData.data} shape={tensorData.shape} />;
+      return <TensorDataView data={tensorData.data as unknown[]} shape={tensorData.shape} />;
     }
 
     const activeVisualizer = visualizers.find((v) => v.id === activeTab);
@@ -49,6 +49,7 @@ interface TensorscapeState {
   selectTensor: (id: string | null) => void;
   updateTensor: (id: string, summary: TensorSummary) => void;
   setTensors: (tensors: Record<string, TensorSummary>) => void;
+  mergeTensors: (tensors: Record<string, TensorSummary>) => void;
   setUpdatingParams: (updating: boolean) => void;
 
   // Toast actions
@@ -165,6 +166,12 @@ export const useStore = create<TensorscapeState>((set, get) => ({
     set({ tensors });
   },
 
+  mergeTensors: (tensors: Record<string, TensorSummary>) => {
+    set((state) => ({
+      tensors: { ...state.tensors, ...tensors },
+    }));
+  },
+
   setUpdatingParams: (updating: boolean) => {
     set({ isUpdatingParams: updating });
   },
@@ -71,7 +71,9 @@ export interface TensorData {
   name: string;
   shape: number[];
   dtype: string;
-  data: unknown[];
+  // Nested lists, or base64 little-endian bytes when encoding is 'base64'
+  data: unknown[] | string;
+  encoding?: DataEncoding;
 }
 
 export interface TensorSlice {
@@ -81,7 +83,17 @@ export interface TensorSlice {
   slice_shape: number[];
   row_range: [number, number];
   col_range: [number, number];
-  data: unknown[];
+  dtype: string;
+  data: unknown[] | string;
+  encoding?: DataEncoding;
+}
+
+export type DataEncoding = 'list' | 'base64';
+
+export interface TensorRaw {
+  shape: number[];
+  dtype: string;
+  data: ArrayLike<number>;
 }
 
 export interface RunScenarioRequest {
@@ -99,10 +111,23 @@ export interface RunScenarioResponse {
 export type WSClientMessage =
   | { type: 'subscribe'; tensor_id: string; view?: string }
   | { type: 'unsubscribe'; tensor_id: string }
-  | { type: 'update_param'; scenario_id: string; param: string; value: number | string };
+  | {
+      type: 'update_param';
+      scenario_id: string;
+      param: string;
+      value: number | string;
+      stream?: boolean;
+    };
 
 export type WSServerMessage =
   | { type: 'tensor_update'; tensor_id: string; summary: TensorSummary }
-  | { type: 'tensors_update'; tensors: Record<string, TensorSummary> }
+  | {
+      type: 'tensors_update';
+      tensors: Record<string, TensorSummary>;
+      // Only the listed tensors changed; others keep their summaries
+      partial?: boolean;
+    }
+  // Sent after the last tensor_update of a streamed parameter update
+  | { type: 'stream_end'; count: number }
   | { type: 'graph_update'; nodes: GraphNode[]; edges: GraphEdge[] }
   | { type: 'error'; message: string };